@@ -0,0 +1,63 @@
+"""Benchmark calling injectables compiled with @injectable(compile=True).
+
+Compares calling the same function directly without injection, through Container.call with the regular injection path,
+and through Container.call with a generated trampoline. Each variant is called with its dependency missing (so it is
+injected) and with every argument passed explicitly.
+
+Usage:
+    python benchmarks/compiled_injectables.py
+"""
+import statistics
+import timeit
+
+from bevy import Inject, injectable, Registry
+
+NUMBER = 20_000
+REPEATS = 5
+
+
+class Service:
+    pass
+
+
+def handler(service: Inject[Service], data: str, *, flag: bool = False):
+    return service, data, flag
+
+
+regular = injectable(handler)
+compiled = injectable(handler, compile=True)
+
+
+def time_call(call) -> float:
+    """Returns the median nanoseconds per call."""
+    timings = timeit.repeat(call, number=NUMBER, repeat=REPEATS)
+    return statistics.median(timings) / NUMBER * 1_000_000_000
+
+
+def main():
+    container = Registry().create_container()
+    service = Service()
+    container.add(service)
+
+    direct = time_call(lambda: handler(service, "data", flag=True))
+    rows = [
+        ("direct call", direct, direct),
+        (
+            "regular",
+            time_call(lambda: container.call(regular, data="data")),
+            time_call(lambda: container.call(regular, service, "data", flag=True)),
+        ),
+        (
+            "compiled",
+            time_call(lambda: container.call(compiled, data="data")),
+            time_call(lambda: container.call(compiled, service, "data", flag=True)),
+        ),
+    ]
+
+    print(f"{'':>12} {'injected ns':>12} {'passed ns':>10} {'vs direct':>10}")
+    for label, injected, passed in rows:
+        print(f"{label:>12} {injected:>12.0f} {passed:>10.0f} {injected / direct:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+"""Builders for the constructor graphs used by the benchmarks and by tests/test_performance.py."""
+
+
+def build_constructor_chain(depth: int) -> list[type]:
+    """Build classes where each constructor requires an instance of the previous class."""
+    chain = [type("Chain0", (), {"__init__": lambda self: None})]
+    for i in range(1, depth):
+        namespace = {}
+        exec("def __init__(self, dependency: Dependency):\n    self.dependency = dependency", {"Dependency": chain[-1]}, namespace)
+        chain.append(type(f"Chain{i}", (), namespace))
+
+    return chain
+
+
+def build_wide_graph(width: int) -> tuple[list[type], type]:
+    """Build a class whose constructor requires an instance of each of width leaf classes."""
+    leaves = [type(f"Leaf{i}", (), {"__init__": lambda self: None}) for i in range(width)]
+    params = ", ".join(f"dep{i}: Leaf{i}" for i in range(width))
+    body = f"self.dependencies = [{', '.join(f'dep{i}' for i in range(width))}]"
+    namespace = {}
+    exec(f"def __init__(self, {params}):\n    {body}", {leaf.__name__: leaf for leaf in leaves}, namespace)
+    return leaves, type("WideRoot", (), namespace)
@@ -0,0 +1,252 @@
+"""The benchmark suite for dependency resolution.
+
+Covers Container.get for cached instances, factories, and missing dependencies, Container.call for sync and async
+injectables, lookups through branches 1 to 10 levels deep, qualified lookups, default_factory caching, registries with
+many hooks, and building deep type_factory graphs. Timing is done by bevy.benchmarking.
+
+Usage:
+    python -m benchmarks.suite run [--output results.json] [-k FILTER] [--quick]
+    python -m benchmarks.suite compare baseline.json results.json [--threshold 0.1]
+
+Run from the repository root so the benchmarks package can be imported.
+
+compare exits with status 1 when any benchmark's median is slower than the baseline by more than the threshold.
+"""
+import argparse
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from tramp.optionals import Optional
+
+from bevy import Inject, injectable, Options, Registry
+from bevy.benchmarking import (
+    compare, DEFAULT_THRESHOLD, format_comparisons, format_results, load_results, measure, measure_async, save_results,
+)
+from bevy.bundled.type_factory_hook import type_factory
+from bevy.factories import create_type_factory
+from bevy.hooks import Hook
+
+from benchmarks.graphs import build_constructor_chain
+
+BRANCH_DEPTHS = range(1, 11)
+GRAPH_DEPTH = 25
+HOOK_COUNT = 10
+
+
+@dataclass
+class Case:
+    func: Callable[[], Any]
+    is_async: bool = False
+
+
+# Maps benchmark names to functions that set the benchmark up and return the operation to time
+BENCHMARKS: dict[str, Callable[[], Case]] = {}
+
+
+def benchmark(name: str):
+    def decorator(setup: Callable[[], Case]) -> Callable[[], Case]:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+class Config:
+    pass
+
+
+class Database:
+    def __init__(self, config: Inject[Config]):
+        self.config = config
+
+
+class Cache:
+    pass
+
+
+class Service:
+    def __init__(self, database: Inject[Database], cache: Inject[Cache]):
+        self.database = database
+        self.cache = cache
+
+
+class Missing:
+    pass
+
+
+def create_registry() -> Registry:
+    registry = Registry()
+    type_factory.register_hook(registry)
+    return registry
+
+
+@injectable
+def handler(service: Inject[Service], database: Inject[Database], cache: Inject[Cache]):
+    return service, database, cache
+
+
+@injectable
+async def async_handler(service: Inject[Service], database: Inject[Database], cache: Inject[Cache]):
+    return service, database, cache
+
+
+@benchmark("container.get/cached")
+def _():
+    container = create_registry().create_container()
+    container.get(Service)
+    return Case(lambda: container.get(Service))
+
+
+@benchmark("container.get/registry-factory")
+def _():
+    # Containers cache what the factory creates, each op uses a new container so the factory is called every time
+    registry = Registry()
+    registry.add_factory(create_type_factory(Cache))
+    return Case(lambda: registry.create_container().get(Cache))
+
+
+@benchmark("container.get/missing-default")
+def _():
+    container = Registry().create_container()
+    return Case(lambda: container.get(Missing, default=None))
+
+
+@benchmark("container.call/sync")
+def _():
+    container = create_registry().create_container()
+    return Case(lambda: container.call(handler))
+
+
+@benchmark("container.call/async")
+def _():
+    container = create_registry().create_container()
+    return Case(lambda: container.call(async_handler), is_async=True)
+
+
+def _branch_benchmark(depth: int) -> Callable[[], Case]:
+    def setup():
+        container = create_registry().create_container()
+        container.get(Service)
+        for _ in range(depth):
+            container = container.branch()
+
+        return Case(lambda: container.get(Service))
+
+    return setup
+
+
+for _depth in BRANCH_DEPTHS:
+    benchmark(f"branch.get/depth-{_depth}")(_branch_benchmark(_depth))
+
+
+@benchmark("qualified.get/local")
+def _():
+    container = Registry().create_container()
+    container.add(Database, Database(Config()), qualifier="primary")
+    return Case(lambda: container.get(Database, qualifier="primary"))
+
+
+@benchmark("qualified.get/parent")
+def _():
+    parent = Registry().create_container()
+    parent.add(Database, Database(Config()), qualifier="primary")
+    child = parent.branch()
+    return Case(lambda: child.get(Database, qualifier="primary"))
+
+
+@injectable
+def default_factory_handler(cache: Inject[Cache, Options(default_factory=Cache)]):
+    return cache
+
+
+@benchmark("default-factory/cached")
+def _():
+    container = Registry().create_container()
+    return Case(lambda: container.call(default_factory_handler))
+
+
+@benchmark("default-factory/uncached")
+def _():
+    container = Registry().create_container()
+    return Case(lambda: container.get(Cache, default_factory=Cache, cache_factory_result=False))
+
+
+@benchmark("hooks/call")
+def _():
+    registry = create_registry()
+    for hook_type in (Hook.GET_INSTANCE, Hook.GOT_INSTANCE, Hook.INJECTION_REQUEST, Hook.INJECTION_RESPONSE):
+        for _ in range(HOOK_COUNT):
+            registry.add_hook(hook_type, lambda container, value, context: Optional.Nothing())
+
+    container = registry.create_container()
+    return Case(lambda: container.call(handler))
+
+
+@benchmark("hooks/typed-call")
+def _():
+    registry = create_registry()
+    for _ in range(HOOK_COUNT):
+        registry.add_hook(Hook.GET_INSTANCE, lambda container, value, context: Optional.Nothing(), for_types=(Missing,))
+
+    container = registry.create_container()
+    return Case(lambda: container.call(handler))
+
+
+@benchmark(f"type-factory/cold-depth-{GRAPH_DEPTH}")
+def _():
+    root = build_constructor_chain(GRAPH_DEPTH)[-1]
+    registry = create_registry()
+    return Case(lambda: registry.create_container().get(root))
+
+
+def run(names: list[str], *, quick: bool) -> list:
+    options = {"warmup": 10, "samples": 5, "sample_time_ns": 2_000_000} if quick else {}
+    results = []
+    for name in names:
+        case = BENCHMARKS[name]()
+        measure_case = measure_async if case.is_async else measure
+        result = measure_case(name, case.func, **options)
+        print(f"{name}: {result.median_ns:.1f} ns", file=sys.stderr)
+        results.append(result)
+
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark Bevy's dependency resolution")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument("-o", "--output", help="Save the results as JSON")
+    run_parser.add_argument("-k", "--filter", default="", help="Only run benchmarks with this in their name")
+    run_parser.add_argument("--quick", action="store_true", help="Take fewer, shorter samples")
+
+    compare_parser = commands.add_parser("compare", help="Compare results against a baseline")
+    compare_parser.add_argument("baseline", help="Results JSON to compare against")
+    compare_parser.add_argument("current", help="Results JSON to compare")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="Slowdown (as a fraction of the baseline median) that counts as a regression",
+    )
+
+    args = parser.parse_args(argv)
+    match args.command:
+        case "run":
+            results = run([name for name in BENCHMARKS if args.filter in name], quick=args.quick)
+            print(format_results(results))
+            if args.output:
+                save_results(args.output, results)
+
+        case "compare":
+            comparisons = compare(load_results(args.baseline), load_results(args.current), threshold=args.threshold)
+            print(format_comparisons(comparisons))
+            if any(comparison.regressed for comparison in comparisons):
+                return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+"""Benchmark building constructor graphs with the bundled type_factory hook.
+
+Builds chains of increasing depth (each constructor requires the previous class) and roots with increasing numbers of
+constructor dependencies, then reports the cost per node. When resolution scales linearly the cost per node stays flat
+as the graphs grow.
+
+The threads column is the most threads seen running while the graph was being built, sampled from the constructor that
+runs last. Chains deeper than the stack allows continue on a new thread every few dozen levels, so it grows with the
+deepest chains.
+
+Usage:
+    python -m benchmarks.type_factory_graphs
+"""
+import statistics
+import threading
+import time
+
+from bevy import Registry
+from bevy.bundled.type_factory_hook import type_factory
+
+from benchmarks.graphs import build_constructor_chain, build_wide_graph
+
+REPEATS = 5
+
+
+def time_cold_resolution(root: type, deepest: type) -> tuple[float, int]:
+    """Returns the median seconds to resolve the root in a fresh container and the most threads seen running while the
+    deepest dependency was being constructed."""
+    timings = []
+    thread_counts = []
+    original_init = deepest.__init__
+
+    def record_threads(self):
+        thread_counts.append(threading.active_count())
+        original_init(self)
+
+    deepest.__init__ = record_threads
+    try:
+        for _ in range(REPEATS):
+            registry = Registry()
+            type_factory.register_hook(registry)
+            container = registry.create_container()
+            start = time.perf_counter()
+            container.get(root)
+            timings.append(time.perf_counter() - start)
+    finally:
+        deepest.__init__ = original_init
+
+    return statistics.median(timings), max(thread_counts)
+
+
+def deep_graph(depth: int) -> tuple[type, type]:
+    chain = build_constructor_chain(depth)
+    return chain[-1], chain[0]
+
+
+def wide_graph(width: int) -> tuple[type, type]:
+    leaves, root = build_wide_graph(width)
+    return root, leaves[-1]
+
+
+def report(label: str, sizes: list[int], build) -> None:
+    print(f"{label:>6} {'nodes':>6} {'total ms':>10} {'us/node':>9} {'threads':>8}")
+    for size in sizes:
+        seconds, threads = time_cold_resolution(*build(size))
+        print(f"{'':>6} {size:>6} {seconds * 1000:>10.2f} {seconds / size * 1_000_000:>9.1f} {threads:>8}")
+
+
+def main():
+    report("deep", [10, 25, 50, 100, 250, 500], deep_graph)
+    print()
+    report("wide", [50, 100, 250, 500], wide_graph)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,13 @@
 from bevy.containers import get_container, Container
 from bevy.injections import injectable, auto_inject
-from bevy.injection_types import Inject, Options, InjectionStrategy, TypeMatchingStrategy, DependencyResolutionError
+from bevy.injection_types import (
+    Inject, Options, InjectionStrategy, TypeMatchingStrategy, DependencyResolutionError, CircularDependencyError,
+)
 from bevy.registries import get_registry, Registry
 
 __all__ = [
     "get_registry", "get_container", 
     "injectable", "auto_inject",
-    "Inject", "Options", "InjectionStrategy", "TypeMatchingStrategy", "DependencyResolutionError"
+    "Inject", "Options", "InjectionStrategy", "TypeMatchingStrategy", "DependencyResolutionError",
+    "CircularDependencyError",
 ]
\ No newline at end of file
@@ -3,16 +3,26 @@
 
 Usage:
     python -m bevy <dotpath> [command]
+    python -m bevy bench <module> [--resolve TYPE ...] [--call FUNCTION ...] [-n NUMBER]
+    python -m bevy graph <module> [--format dot|json] [--profile] [-o FILE]
     
     Commands:
         (default)   - Show docstring and file location
         signature   - Show function/class signature
         members     - Show members with signatures (for classes/modules)
         
+    bench imports the module, finds its container (or registry), and times resolving each type and calling each
+    injectable. It reports ops/sec, latency percentiles, and how the lookups were answered.
+
+    graph exports the dependency graph of the module's injectables and its registry's factories. With --profile every
+    node is annotated with its construction time and instance size.
+        
 Examples:
     python -m bevy bevy.containers.Container
     python -m bevy bevy.containers.Container.get signature
     python -m bevy bevy.containers members
+    python -m bevy bench myapp.services --resolve UserService --call handle_request -n 10000
+    python -m bevy graph myapp.services --profile -o services.dot
 """
 
 import argparse
@@ -313,7 +323,161 @@ def show_members(obj: Any, dotpath: str) -> None:
             print(f"  {name}: {type_name}")
 
 
-def main():
+def find_container(module: Any, name: Optional[str] = None):
+    """Find the container to benchmark with. A named attribute can be a container or a registry, otherwise the first
+    container in the module is used, then the first registry, then the global container."""
+    from bevy import Container, get_container, Registry
+
+    if name:
+        candidates = [resolve_name(module, name)]
+    else:
+        values = list(vars(module).values())
+        candidates = [value for value in values if isinstance(value, Container)]
+        candidates += [value for value in values if isinstance(value, Registry)]
+
+    for candidate in candidates:
+        if isinstance(candidate, Container):
+            return candidate
+
+        if isinstance(candidate, Registry):
+            return candidate.create_container()
+
+    if name:
+        raise ValueError(f"'{name}' is not a Container or Registry")
+
+    return get_container()
+
+
+def resolve_name(module: Any, name: str) -> Any:
+    """Resolve a name relative to the module, falling back to a full dotpath."""
+    obj = module
+    try:
+        for attr in name.split('.'):
+            obj = getattr(obj, attr)
+    except AttributeError:
+        return parse_dotpath(name)[2]
+
+    return obj
+
+
+def bench(argv: list[str]) -> int:
+    """Benchmark resolving types and calling injectables from a user's module."""
+    from bevy.benchmarking import measure, measure_async, percentile, save_results
+    from bevy.injections import _locate_injectable
+
+    parser = argparse.ArgumentParser(
+        prog="python -m bevy bench",
+        description="Benchmark dependency resolution in a module",
+    )
+    parser.add_argument('module', help='Module to import, e.g. myapp.services')
+    parser.add_argument(
+        '--resolve', action='append', default=[], metavar='TYPE', help='Type to resolve with container.get'
+    )
+    parser.add_argument(
+        '--call', action='append', default=[], metavar='FUNCTION', help='Injectable to call with container.call'
+    )
+    parser.add_argument('--container', help='Container or registry attribute to use (default: found in the module)')
+    parser.add_argument('-n', '--number', type=int, default=10_000, help='Times to run each benchmark')
+    parser.add_argument('--warmup', type=int, default=100, help='Runs before timing starts')
+    parser.add_argument('-o', '--output', help='Save the results as JSON')
+    args = parser.parse_args(argv)
+
+    if not args.resolve and not args.call:
+        parser.error("nothing to benchmark, pass --resolve or --call")
+
+    module = importlib.import_module(args.module)
+    container = find_container(module, args.container)
+
+    targets = []
+    for name in args.resolve:
+        dependency = resolve_name(module, name)
+        targets.append((f"resolve {name}", lambda dependency=dependency: container.get(dependency), False))
+
+    for name in args.call:
+        func = resolve_name(module, name)
+        injectable = _locate_injectable(func)
+        is_async = injectable.is_async if injectable else inspect.iscoroutinefunction(func)
+        targets.append((f"call {name}", lambda func=func: container.call(func), is_async))
+
+    results = []
+    sources = {}
+    registry = container.registry
+    collect_metrics = registry.collect_metrics
+    for label, func, is_async in targets:
+        # Each sample is a single run so the samples are per-operation latencies
+        measure_target = measure_async if is_async else measure
+        registry.collect_metrics = False
+        results.append(measure_target(label, func, warmup=args.warmup, samples=args.number, batch_size=1))
+
+        # Lookups are counted in a separate pass so counting doesn't add to the timings
+        registry.collect_metrics = True
+        registry.reset_stats()
+        measure_target(label, func, warmup=0, samples=args.number, batch_size=1)
+        sources[label] = registry.stats().by_source()
+
+    registry.collect_metrics = collect_metrics
+
+    width = max(len(result.name) for result in results)
+    print(f"{'':<{width}} {'ops/sec':>12} {'p50 us':>9} {'p95 us':>9} {'p99 us':>9}  lookups per op")
+    for result in results:
+        per_op = ", ".join(
+            f"{source}={count / args.number:g}" for source, count in sorted(sources[result.name].items())
+        )
+        print(
+            f"{result.name:<{width}} {result.ops_per_sec:>12,.0f} {result.median_ns / 1000:>9.2f} "
+            f"{result.p95_ns / 1000:>9.2f} {percentile(result.samples_ns, 0.99) / 1000:>9.2f}  {per_op or '-'}"
+        )
+
+    if args.output:
+        save_results(args.output, results)
+
+    return 0
+
+
+def graph(argv: list[str]) -> int:
+    """Export the dependency graph of a user's module."""
+    from bevy.dependency_graph import build_graph
+
+    parser = argparse.ArgumentParser(
+        prog="python -m bevy graph",
+        description="Export the dependency graph of a module's injectables and factories",
+    )
+    parser.add_argument('module', help='Module to import, e.g. myapp.services')
+    parser.add_argument('--container', help='Container or registry attribute to use (default: found in the module)')
+    parser.add_argument('--format', choices=['dot', 'json'], default='dot', help='Output format (default: dot)')
+    parser.add_argument(
+        '--profile', action='store_true', help='Resolve everything once and annotate construction times and sizes'
+    )
+    parser.add_argument('-o', '--output', help='Write the graph to a file instead of stdout')
+    args = parser.parse_args(argv)
+
+    module = importlib.import_module(args.module)
+    container = find_container(module, args.container)
+    dependency_graph = build_graph(module, container.registry)
+    if args.profile:
+        # A branch so that instances the module already created are found rather than constructed
+        dependency_graph.profile(container.branch())
+
+    output = dependency_graph.to_dot() if args.format == 'dot' else dependency_graph.to_json() + "\n"
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(output)
+    else:
+        print(output, end='')
+
+    return 0
+
+
+def main(argv: Optional[list[str]] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    commands = {'bench': bench, 'graph': graph}
+    if argv[:1] and argv[0] in commands:
+        try:
+            sys.exit(commands[argv[0]](argv[1:]))
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
     parser = argparse.ArgumentParser(
         description="Bevy documentation CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -332,7 +496,7 @@ def main():
         help='Command to execute (default: show docstring)'
     )
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     try:
         module, attr_path, obj = parse_dotpath(args.dotpath)
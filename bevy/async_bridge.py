@@ -0,0 +1,130 @@
+"""Utilities for running async resolution work from synchronous callers.
+
+The sync resolution engine resolves everything inline and only hands work to an event loop when it reaches an async
+factory or an async hook. This module owns the event loops used for that hand off so that they are created once and
+reused instead of being created and torn down on every call:
+
+- Threads that are not running an event loop reuse a loop cached for that thread. The coroutine runs on the calling
+  thread, so no thread hand off is needed.
+- Threads that are already running an event loop (async code calling ``container.get()`` or an async hook resolving
+  nested dependencies synchronously) cannot block their own loop. Their coroutines are submitted to a pool of
+  persistent background loop threads. A loop thread is only lent to one call at a time, so nested calls borrow another
+  loop thread instead of deadlocking.
+
+Context variables are propagated in both cases, the coroutine runs in a copy of the caller's context.
+"""
+import asyncio
+import threading
+import typing as t
+from typing import Any, Coroutine
+
+DEFAULT_TIMEOUT: float = 30.0
+
+
+class _ThreadLoop:
+    """Holds the event loop cached for a thread and closes it when the thread exits."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+
+    def __del__(self):
+        if not self.loop.is_closed() and not self.loop.is_running():
+            self.loop.close()
+
+
+class _BackgroundLoop:
+    """An event loop running forever on a daemon thread."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, name="bevy-async-bridge", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+
+class EventLoopBridge:
+    """Runs coroutines to completion for sync callers using long-lived event loops."""
+
+    def __init__(self):
+        self._thread_loops = threading.local()
+        self._idle_background_loops: list[_BackgroundLoop] = []
+        self._lock = threading.Lock()
+
+    def run[T](self, coro: Coroutine[Any, Any, T], timeout: float = DEFAULT_TIMEOUT) -> T:
+        """Runs the coroutine and returns its result, raising TimeoutError if it takes longer than the timeout."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return self._run_on_thread_loop(coro, timeout)
+        else:
+            return self._run_on_background_loop(coro, timeout)
+
+    def _run_on_thread_loop[T](self, coro: Coroutine[Any, Any, T], timeout: float) -> T:
+        holder: _ThreadLoop | None = getattr(self._thread_loops, "holder", None)
+        if holder is None or holder.loop.is_closed():
+            holder = self._thread_loops.holder = _ThreadLoop()
+
+        return holder.loop.run_until_complete(_run_with_timeout(coro, timeout))
+
+    def _run_on_background_loop[T](self, coro: Coroutine[Any, Any, T], timeout: float) -> T:
+        background_loop = self._acquire_background_loop()
+        try:
+            # run_coroutine_threadsafe schedules the task from this thread, so it copies this thread's context
+            future = asyncio.run_coroutine_threadsafe(coro, background_loop.loop)
+            try:
+                return future.result(timeout=timeout)
+            except TimeoutError:
+                if future.done():
+                    raise  # The coroutine itself raised a TimeoutError
+
+                future.cancel()
+                raise _timeout_error(timeout) from None
+        finally:
+            self._release_background_loop(background_loop)
+
+    def _acquire_background_loop(self) -> _BackgroundLoop:
+        with self._lock:
+            if self._idle_background_loops:
+                return self._idle_background_loops.pop()
+
+        return _BackgroundLoop()
+
+    def _release_background_loop(self, background_loop: _BackgroundLoop):
+        with self._lock:
+            self._idle_background_loops.append(background_loop)
+
+
+async def _run_with_timeout[T](coro: t.Awaitable[T], timeout: float) -> T:
+    scope = asyncio.timeout(timeout)
+    try:
+        async with scope:
+            return await coro
+    except TimeoutError:
+        if scope.expired():
+            raise _timeout_error(timeout) from None
+
+        raise
+
+
+def _timeout_error(timeout: float) -> TimeoutError:
+    return TimeoutError(f"Dependency resolution timed out after {timeout} seconds")
+
+
+_bridge = EventLoopBridge()
+
+
+def get_event_loop_bridge() -> EventLoopBridge:
+    """Returns the event loop bridge shared by all containers."""
+    return _bridge
+
+
+def run_coroutine_sync[T](coro: Coroutine[Any, Any, T], timeout: float = DEFAULT_TIMEOUT) -> T:
+    """Runs a coroutine to completion from a sync context and returns its result.
+
+    The sync resolution engine only calls this when it reaches an async factory or an async hook. The coroutine is run
+    on a reused event loop, see the module docstring for details.
+    """
+    return _bridge.run(coro, timeout)
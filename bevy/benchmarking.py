@@ -0,0 +1,261 @@
+"""
+A small, stdlib only harness for benchmarking dependency resolution.
+
+Each benchmark is warmed up, calibrated so a sample takes long enough to time reliably, then sampled repeatedly. A
+sample is the mean time per operation across a batch of calls, the median and 95th percentile are taken across the
+samples. Results can be saved as JSON and compared against a stored baseline to find regressions.
+
+Example:
+    >>> from bevy.benchmarking import compare, measure
+    >>>
+    >>> result = measure("container.get", lambda: container.get(UserService))
+    >>> result.median_ns, result.p95_ns, result.ops_per_sec
+    (412.5, 430.1, 2424242.4)
+
+The suite that benchmarks Bevy itself is in benchmarks/suite.py.
+"""
+import asyncio
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Any
+
+DEFAULT_WARMUP = 100
+DEFAULT_SAMPLES = 20
+# Batches are sized so that a single sample takes at least this long
+DEFAULT_SAMPLE_TIME_NS = 10_000_000
+
+# A benchmark is considered to have regressed when its median is this much slower than the baseline
+DEFAULT_THRESHOLD = 0.10
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    """The samples collected for a benchmark.
+
+    Attributes:
+        name: The benchmark's name
+        samples_ns: Mean nanoseconds per operation for each sample
+        batch_size: How many operations were timed in each sample
+    """
+    name: str
+    samples_ns: tuple[float, ...]
+    batch_size: int
+
+    @property
+    def median_ns(self) -> float:
+        return statistics.median(self.samples_ns)
+
+    @property
+    def p95_ns(self) -> float:
+        return percentile(self.samples_ns, 0.95)
+
+    @property
+    def ops_per_sec(self) -> float:
+        return 1_000_000_000 / self.median_ns if self.median_ns else float("inf")
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "median_ns": self.median_ns,
+            "p95_ns": self.p95_ns,
+            "ops_per_sec": self.ops_per_sec,
+            "batch_size": self.batch_size,
+            "samples_ns": list(self.samples_ns),
+        }
+
+    @classmethod
+    def from_dict(cls, name: str, data: Mapping[str, Any]) -> "BenchmarkResult":
+        return cls(name, tuple(data["samples_ns"]), data["batch_size"])
+
+
+@dataclass(frozen=True, slots=True)
+class Comparison:
+    """How a benchmark's median changed from the baseline. A ratio above 1 means the benchmark got slower."""
+    name: str
+    baseline_ns: float
+    current_ns: float
+    threshold: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ns / self.baseline_ns if self.baseline_ns else float("inf")
+
+    @property
+    def regressed(self) -> bool:
+        return self.ratio > 1 + self.threshold
+
+
+def percentile(values: Iterable[float], fraction: float) -> float:
+    """The value below which the given fraction (0.0 - 1.0) of values fall, interpolating between the closest two."""
+    ordered = sorted(values)
+    if not ordered:
+        raise ValueError("Cannot take the percentile of no values")
+
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    *,
+    warmup: int = DEFAULT_WARMUP,
+    samples: int = DEFAULT_SAMPLES,
+    sample_time_ns: int = DEFAULT_SAMPLE_TIME_NS,
+    batch_size: int | None = None,
+) -> BenchmarkResult:
+    """Benchmarks a sync callable. The garbage collector is disabled while samples are taken."""
+    for _ in range(warmup):
+        func()
+
+    if batch_size is None:
+        batch_size = _calibrate(lambda size: _time_batch(func, size), sample_time_ns)
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        timings = tuple(_time_batch(func, batch_size) / batch_size for _ in range(samples))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return BenchmarkResult(name, timings, batch_size)
+
+
+def measure_async(
+    name: str,
+    func: Callable[[], Awaitable[Any]],
+    *,
+    warmup: int = DEFAULT_WARMUP,
+    samples: int = DEFAULT_SAMPLES,
+    sample_time_ns: int = DEFAULT_SAMPLE_TIME_NS,
+    batch_size: int | None = None,
+) -> BenchmarkResult:
+    """Benchmarks an async callable. Every sample is awaited on a single event loop so loop start up isn't timed."""
+    async def run() -> BenchmarkResult:
+        for _ in range(warmup):
+            await func()
+
+        size = batch_size
+        if size is None:
+            size = await _calibrate_async(func, sample_time_ns)
+
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            timings = []
+            for _ in range(samples):
+                timings.append(await _time_batch_async(func, size) / size)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        return BenchmarkResult(name, tuple(timings), size)
+
+    return asyncio.run(run())
+
+
+def _time_batch(func: Callable[[], Any], size: int) -> int:
+    started = perf_counter_ns()
+    for _ in range(size):
+        func()
+
+    return perf_counter_ns() - started
+
+
+async def _time_batch_async(func: Callable[[], Awaitable[Any]], size: int) -> int:
+    started = perf_counter_ns()
+    for _ in range(size):
+        await func()
+
+    return perf_counter_ns() - started
+
+
+def _calibrate(time_batch: Callable[[int], int], sample_time_ns: int) -> int:
+    """Doubles the batch size until a batch takes at least sample_time_ns."""
+    size = 1
+    while time_batch(size) < sample_time_ns:
+        size *= 2
+
+    return size
+
+
+async def _calibrate_async(func: Callable[[], Awaitable[Any]], sample_time_ns: int) -> int:
+    size = 1
+    while await _time_batch_async(func, size) < sample_time_ns:
+        size *= 2
+
+    return size
+
+
+def compare(
+    baseline: Mapping[str, BenchmarkResult],
+    current: Mapping[str, BenchmarkResult],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[Comparison]:
+    """Compares the medians of the benchmarks that are in both sets of results."""
+    return [
+        Comparison(name, baseline[name].median_ns, result.median_ns, threshold)
+        for name, result in current.items()
+        if name in baseline
+    ]
+
+
+def environment() -> dict[str, str]:
+    """Details about the interpreter and machine, saved with results so baselines can be matched to where they ran."""
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": str(os.cpu_count()),
+    }
+
+
+def save_results(path: str | os.PathLike, results: Iterable[BenchmarkResult]):
+    data = {
+        "environment": environment(),
+        "results": {result.name: result.to_dict() for result in results},
+    }
+    with open(path, "w") as file:
+        json.dump(data, file, indent=2)
+
+
+def load_results(path: str | os.PathLike) -> dict[str, BenchmarkResult]:
+    with open(path) as file:
+        data = json.load(file)
+
+    return {name: BenchmarkResult.from_dict(name, result) for name, result in data["results"].items()}
+
+
+def format_results(results: Iterable[BenchmarkResult]) -> str:
+    """A table of the results, one benchmark per row."""
+    results = list(results)
+    width = max((len(result.name) for result in results), default=4)
+    lines = [f"{'name':<{width}} {'median ns':>12} {'p95 ns':>12} {'ops/sec':>14}"]
+    lines.extend(
+        f"{result.name:<{width}} {result.median_ns:>12.1f} {result.p95_ns:>12.1f} {result.ops_per_sec:>14,.0f}"
+        for result in results
+    )
+    return "\n".join(lines)
+
+
+def format_comparisons(comparisons: Iterable[Comparison]) -> str:
+    """A table of the comparisons, regressions are marked."""
+    comparisons = list(comparisons)
+    width = max((len(comparison.name) for comparison in comparisons), default=4)
+    lines = [f"{'name':<{width}} {'baseline ns':>12} {'current ns':>12} {'change':>8}"]
+    lines.extend(
+        f"{comparison.name:<{width}} {comparison.baseline_ns:>12.1f} {comparison.current_ns:>12.1f} "
+        f"{comparison.ratio - 1:>+8.1%}{'  REGRESSION' if comparison.regressed else ''}"
+        for comparison in comparisons
+    )
+    return "\n".join(lines)
@@ -1,26 +1,149 @@
-import time
+import threading
 import typing as t
+from collections.abc import Iterator, MutableMapping
+from contextlib import contextmanager
 from contextvars import ContextVar
-from inspect import signature
+from types import MappingProxyType
 from typing import Any
+from weakref import WeakSet
 
 from tramp.optionals import Optional
 
+import bevy.metrics as metrics
 import bevy.registries as registries
+import bevy.tracing as tracing
 from bevy.context_vars import get_global_container, global_container, GlobalContextMixin
-from bevy.debug import create_debug_logger
 # DependencyMetadata removed - using injection system
 from bevy.find_results import Result
-from bevy.hooks import Hook, InjectionContext, PostInjectionContext
+from bevy.hooks import Hook, InjectionContext
 from bevy.injection_types import (
-    DependencyResolutionError, get_non_none_type, InjectionStrategy, is_optional_type, TypeMatchingStrategy,
+    CircularDependencyError, DependencyResolutionError, InjectionChain, TypeMatchingStrategy,
 )
 from bevy.injections import InjectableCallable
 
+if t.TYPE_CHECKING:
+    from bevy.injections import _InjectedParameter, _InjectionPlan
+
 type Instance = t.Any
 
 # Context variable to track current injection chain across factory calls
-_current_injection_chain: ContextVar[list[str]] = ContextVar('current_injection_chain', default=[])
+# Chains are immutable so they can be shared by every InjectionContext created for a call and by nested calls
+_current_injection_chain: ContextVar[InjectionChain] = ContextVar('current_injection_chain', default=InjectionChain())
+
+# Hooks that are given the InjectionContext of a parameter, it is only created when one of them has a callback
+_INJECTION_CONTEXT_HOOKS = frozenset({
+    Hook.GET_INSTANCE,
+    Hook.GOT_INSTANCE,
+    Hook.CREATE_INSTANCE,
+    Hook.CREATED_INSTANCE,
+    Hook.HANDLE_UNSUPPORTED_DEPENDENCY,
+    Hook.INJECTION_REQUEST,
+    Hook.INJECTION_RESPONSE,
+})
+
+# Guards the sets of child containers that are used to invalidate the caches of branches
+_children_lock = threading.Lock()
+
+_UNKNOWN = object()
+
+# Strategies that only use instances stored for exactly the requested type
+_EXACT_TYPE_MATCHING = frozenset({TypeMatchingStrategy.DEFAULT, TypeMatchingStrategy.EXACT_TYPE})
+
+# Whether a concrete type satisfies a runtime checkable protocol, keyed by (protocol, concrete type)
+_protocol_matches: dict[tuple[type, type], bool] = {}
+
+
+def _is_runtime_protocol(dependency: t.Any) -> bool:
+    return getattr(dependency, "_is_runtime_protocol", False)
+
+
+def _satisfies_protocol(instance: Instance, protocol: type) -> bool:
+    """Check if an instance structurally satisfies a runtime checkable protocol. Results are cached for each
+    concrete type."""
+    key = (protocol, type(instance))
+    try:
+        return _protocol_matches[key]
+    except KeyError:
+        pass
+
+    try:
+        matches = issubclass(type(instance), protocol)
+    except TypeError:
+        # Protocols with data members can only be checked against instances, which can't be cached per type
+        return isinstance(instance, protocol)
+
+    _protocol_matches[key] = matches
+    return matches
+
+
+class InstancesView(MutableMapping):
+    """A dict-like view over all of a container's instance stores, this is what Container.instances returns.
+
+    Containers keep instances stored for types, qualified instances stored for (type, qualifier) keys, and results
+    cached for factory functions in separate stores so that lookups only touch the store they need. The view presents
+    them as the single mapping containers used to have. Writes are routed to the matching store.
+    """
+
+    __slots__ = ("_container",)
+
+    def __init__(self, container: "Container"):
+        self._container = container
+
+    def _store_for(self, key: t.Any) -> dict:
+        container = self._container
+        if isinstance(key, tuple):
+            return container._qualified_instances
+
+        if callable(key) and not isinstance(key, type) and not hasattr(key, "__origin__"):
+            return container._factory_results
+
+        return container._type_instances
+
+    def __getitem__(self, key: t.Any) -> Instance:
+        if not isinstance(key, tuple):
+            # Factories that are classes were stored in the same dict as types, so check both stores
+            if key in self._container._type_instances:
+                return self._container._type_instances[key]
+
+            return self._container._factory_results[key]
+
+        return self._container._qualified_instances[key]
+
+    def __setitem__(self, key: t.Any, instance: Instance):
+        self._container._store_instance(self._store_for(key), key, instance)
+
+    def __delitem__(self, key: t.Any):
+        container = self._container
+        if not isinstance(key, tuple) and key not in container._type_instances:
+            # Factories that are classes are stored with the factory results
+            container._remove_instance(container._factory_results, key)
+        else:
+            container._remove_instance(self._store_for(key), key)
+
+    def __contains__(self, key: object) -> bool:
+        container = self._container
+        if isinstance(key, tuple):
+            return key in container._qualified_instances
+
+        return key in container._type_instances or key in container._factory_results
+
+    def __iter__(self) -> Iterator[t.Any]:
+        container = self._container
+        yield from container._type_instances
+        yield from container._qualified_instances
+        yield from (key for key in container._factory_results if key not in container._type_instances)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+
+def _lookup_keys(dependency: t.Any) -> tuple[t.Any, ...]:
+    """The dependencies whose lookups an instance stored for the dependency can answer: the dependency itself and, for
+    classes, every base class."""
+    return dependency.__mro__ if isinstance(dependency, type) else (dependency,)
 
 
 def issubclass_or_raises[T](cls: T, class_or_tuple: t.Type[T] | tuple[t.Type[T], ...], exception: Exception) -> bool:
@@ -72,21 +195,99 @@ class Container(GlobalContextMixin, var=global_container):
     def __init__(self, registry: "registries.Registry", *, parent: "Container | None" = None):
         super().__init__()
         self.registry = registry
-        # Unified instances cache - can store:
-        # - Type -> Instance (regular instances)
-        # - (Type, qualifier) -> Instance (qualified instances) 
-        # - Callable -> Instance (factory-cached instances)
-        self.instances: dict[t.Type[Instance] | tuple | t.Callable, Instance] = {
+        # Instances are stored by kind, Container.instances presents them as a single mapping
+        self._type_instances: dict[t.Type[Instance], Instance] = {
             Container: self,
             registries.Registry: registry,
         }
+        self._qualified_instances: dict[tuple[t.Type[Instance], str], Instance] = {}
+        self._factory_results: dict[t.Callable, Instance] = {}
+        # Maps each base class of a type stored in the container to the stored types, in the order they were stored
+        self._subtype_index: dict[type, list[type]] = {}
+        # Types known to be missing from this container and its parents, mapped to True if they also couldn't be
+        # created. Cleared when the registry changes and when an instance for the type is stored here or in a parent.
+        self._missing: dict[t.Any, bool] = {}
+        self._missing_registry_version = registry.version
+        # Instances the parents store for each type that has been looked up (None if they don't), see _find_in_parents
+        self._parent_lookups: dict[t.Any, Instance | None] = {}
+        self._lookups_version = 0
+        self._children: "WeakSet[Container]" = WeakSet()
         self._parent = parent
+        self._resolution_timeout: float | None = None
+        self._metrics: metrics.ResolutionMetrics | None = None
+        if parent:
+            with _children_lock:
+                parent._children.add(self)
 
     @property
     def parent(self) -> "Container | None":
         """Returns the parent container, or None if this is a root container."""
         return self._parent
 
+    @property
+    def instances(self) -> InstancesView:
+        """All instances stored in the container, keyed by type, by (type, qualifier) for qualified instances, and by
+        factory for cached factory results."""
+        return InstancesView(self)
+
+    @property
+    def type_instances(self) -> t.Mapping[t.Type[Instance], Instance]:
+        """A read-only view of the instances stored for types."""
+        return MappingProxyType(self._type_instances)
+
+    @property
+    def qualified_instances(self) -> t.Mapping[tuple[t.Type[Instance], str], Instance]:
+        """A read-only view of the qualified instances, keyed by (type, qualifier)."""
+        return MappingProxyType(self._qualified_instances)
+
+    @property
+    def factory_results(self) -> t.Mapping[t.Callable, Instance]:
+        """A read-only view of the cached factory results, keyed by factory."""
+        return MappingProxyType(self._factory_results)
+
+    @property
+    def resolution_timeout(self) -> float:
+        """Seconds a sync caller waits on async factories and async hooks before a TimeoutError is raised. Defaults to
+        the parent container's timeout, or the registry's timeout for root containers."""
+        if self._resolution_timeout is not None:
+            return self._resolution_timeout
+
+        if self._parent:
+            return self._parent.resolution_timeout
+
+        return self.registry.resolution_timeout
+
+    @resolution_timeout.setter
+    def resolution_timeout(self, value: float | None):
+        self._resolution_timeout = value
+
+    def stats(self) -> metrics.ResolutionStats:
+        """A snapshot of how this container answered lookups and how long its factories took. Metrics are only
+        collected while the registry's collect_metrics is set."""
+        if self._metrics is None:
+            return metrics.ResolutionMetrics().snapshot()
+
+        return self._metrics.snapshot()
+
+    def reset_stats(self):
+        """Clears the container's metrics, the registry's totals are kept."""
+        if self._metrics is not None:
+            self._metrics.reset()
+
+    def _record_resolution(self, dependency: t.Any, qualifier: str | None, source: str):
+        if self._metrics is None:
+            self._metrics = metrics.ResolutionMetrics()
+
+        self._metrics.record_resolution(dependency, qualifier, source)
+        self.registry._metrics.record_resolution(dependency, qualifier, source)
+
+    def _record_factory(self, factory: t.Callable, duration_ns: int):
+        if self._metrics is None:
+            self._metrics = metrics.ResolutionMetrics()
+
+        self._metrics.record_factory(factory, duration_ns)
+        self.registry._metrics.record_factory(factory, duration_ns)
+
     @t.overload
     def add(self, instance: Instance):
         ...
@@ -102,15 +303,15 @@ class Container(GlobalContextMixin, var=global_container):
     def add(self, *args, **kwargs):
         match args:
             case [instance]:
-                self.instances[type(instance)] = instance
+                self._store_instance(self._type_instances, type(instance), instance)
 
             case [for_dependency, instance]:
                 qualifier = kwargs.get('qualifier')
                 if qualifier:
                     # Store qualified instance with (type, qualifier) key
-                    self.instances[(for_dependency, qualifier)] = instance
+                    self._store_instance(self._qualified_instances, (for_dependency, qualifier), instance)
                 else:
-                    self.instances[for_dependency] = instance
+                    self._store_instance(self._type_instances, for_dependency, instance)
 
             case _:
                 raise ValueError(f"Unexpected arguments to add: {args}")
@@ -236,7 +437,8 @@ class Container(GlobalContextMixin, var=global_container):
         container or its parents, a new instance will be created and stored for reuse. When a default is given it will
         be returned instead of creating a new instance, the default is not stored. When a default_factory is given,
         it will be used instead of normal resolution if no instance exists, and the result will be cached using the
-        factory as the key. When a qualifier is given, it will look up the qualified instance."""
+        factory as the key. When a qualifier is given, it will look up the qualified instance. A type_matching strategy
+        controls which stored instances can be used, see Container._get_existing_instance."""
         return self.find(dependency, **kwargs).get()
 
     @t.overload
@@ -286,90 +488,189 @@ class Container(GlobalContextMixin, var=global_container):
         """
         return Result(self, dependency, **kwargs)
 
-    def _build_injection_chain(self, function_name: str, injection_chain: list[str] = None) -> list[str]:
-        """Build the injection chain for tracking nested dependency calls."""
-        context_chain = _current_injection_chain.get([])
-        
-        if injection_chain is None and context_chain:
-            # We're in a nested call (e.g., from a factory), use context chain
-            return context_chain + [function_name]
-        elif injection_chain is None:
-            # Top-level call
-            return [function_name]
-        else:
-            # Explicit chain provided
-            return injection_chain + [function_name]
+    def _build_injection_chain(
+        self, function_name: str, injection_chain: t.Sequence[str] | None = None
+    ) -> InjectionChain:
+        """Build the injection chain for tracking nested dependency calls. Top-level calls push onto an empty chain,
+        nested calls (e.g., from a factory) push onto the chain of the call that is resolving a dependency."""
+        if injection_chain is None:
+            return _current_injection_chain.get().push(function_name)
+
+        # Explicit chain provided
+        if not isinstance(injection_chain, InjectionChain):
+            injection_chain = InjectionChain.from_names(injection_chain)
+
+        return injection_chain.push(function_name)
+
+    @contextmanager
+    def _creating(self, dependency: t.Any) -> Iterator[None]:
+        """Marks the dependency as being created by this container while the context is active. Nested resolution
+        that needs to create the same dependency again raises a CircularDependencyError instead of recursing."""
+        chain = _current_injection_chain.get()
+        key = (self, dependency)
+        try:
+            creating = None if chain.is_creating(key) else chain.creating(key)
+        except TypeError:  # Unhashable dependencies aren't tracked
+            yield
+            return
+
+        if creating is None:
+            raise CircularDependencyError(
+                dependency_type=dependency,
+                parameter_name="unknown",
+                message=(
+                    f"Circular dependency detected, {dependency!r} is already being created "
+                    f"(injection chain: {' -> '.join(chain) or 'empty'})"
+                ),
+            )
+
+        token = _current_injection_chain.set(creating)
+        try:
+            yield
+        finally:
+            _current_injection_chain.reset(token)
+            creating.finish_creating()
 
     async def _inject_single_dependency(
-        self, param_name: str, param_type: type, options, injection_config: dict,
-        function_name: str, current_injection_chain: list[str], parameter_default
+        self, plan: "_InjectionPlan", parameter: "_InjectedParameter", current_injection_chain: InjectionChain
     ) -> Any:
         """Inject a single dependency parameter (async)."""
-        # Create injection context for hooks
-        injection_context = InjectionContext(
-            function_name=function_name,
-            parameter_name=param_name,
-            requested_type=param_type,
-            options=options,
-            injection_strategy=injection_config['strategy'],
-            type_matching=injection_config['type_matching'],
-            strict_mode=injection_config['strict_mode'],
-            debug_mode=injection_config['debug_mode'],
-            injection_chain=current_injection_chain.copy(),
-            parameter_default=parameter_default,
-        )
-
-        # Call INJECTION_REQUEST hook - allows hooks to provide the value directly
-        hook_result = await self.registry.hooks[Hook.INJECTION_REQUEST].handle(self, injection_context)
-        if isinstance(hook_result, Optional.Some):
-            # Hook provided a value, use it directly
-            return await self._handle_injection_success(hook_result.value, injection_context)
+        active_hooks = self.registry.active_hooks
+        injection_context = None
+        if not active_hooks.isdisjoint(_INJECTION_CONTEXT_HOOKS):
+            injection_context = self._create_injection_context(plan, parameter, current_injection_chain)
+
+            # Call INJECTION_REQUEST hook - allows hooks to provide the value directly
+            if Hook.INJECTION_REQUEST in active_hooks:
+                hook_manager = self.registry.hooks[Hook.INJECTION_REQUEST]
+                if hook_manager.has_async:
+                    hook_result = await hook_manager.handle(self, injection_context, dependency=parameter.resolve_type)
+                else:
+                    hook_result = hook_manager.handle_sync(self, injection_context, dependency=parameter.resolve_type)
+                if isinstance(hook_result, Optional.Some):
+                    # Hook provided a value, use it directly
+                    return await self._handle_injection_success(hook_result.value, plan, parameter, injection_context)
 
         # Set the context chain for nested factory calls
         token = _current_injection_chain.set(current_injection_chain)
         try:
-            injected_value = await self._resolve_dependency_with_hooks(
-                param_type, options, injection_context
-            )
+            injected_value = await self._resolve_dependency_with_hooks(plan, parameter, injection_context)
         except DependencyResolutionError as e:
-            return await self._handle_injection_failure(
-                e, param_type, param_name, injection_context
-            )
+            if parameter.is_optional:
+                # Optional dependency not found - inject None
+                return await self._handle_injection_success(None, plan, parameter, injection_context, "optional_none")
+
+            return self._handle_injection_failure(e, plan, parameter)
         else:
-            return await self._handle_injection_success(
-                injected_value, injection_context
-            )
+            return await self._handle_injection_success(injected_value, plan, parameter, injection_context)
         finally:
             _current_injection_chain.reset(token)
 
-    async def _handle_injection_failure(
-        self, exception: DependencyResolutionError, param_type: type, param_name: str,
-        injection_context: InjectionContext
+    def _inject_single_dependency_sync(
+        self, plan: "_InjectionPlan", parameter: "_InjectedParameter", current_injection_chain: InjectionChain
     ) -> Any:
-        """Handle failed dependency injection (async)."""
-        debug = create_debug_logger(injection_context.debug_mode)
+        """Inject a single dependency parameter (sync)."""
+        active_hooks = self.registry.active_hooks
+        injection_context = None
+        if not active_hooks.isdisjoint(_INJECTION_CONTEXT_HOOKS):
+            injection_context = self._create_injection_context(plan, parameter, current_injection_chain)
+
+            # Call INJECTION_REQUEST hook - allows hooks to provide the value directly
+            if Hook.INJECTION_REQUEST in active_hooks:
+                hook_result = self.registry.hooks[Hook.INJECTION_REQUEST].handle_sync(self, injection_context, dependency=parameter.resolve_type)
+                if isinstance(hook_result, Optional.Some):
+                    # Hook provided a value, use it directly
+                    return self._handle_injection_success_sync(hook_result.value, plan, parameter, injection_context)
 
-        if injection_context.strict_mode:
-            if is_optional_type(param_type):
-                debug.optional_dependency_none(param_name)
-                return None
-            else:
-                raise exception
+        # Set the context chain for nested factory calls
+        token = _current_injection_chain.set(current_injection_chain)
+        try:
+            injected_value = self._resolve_dependency_with_hooks_sync(plan, parameter, injection_context)
+        except DependencyResolutionError as e:
+            if parameter.is_optional:
+                # Optional dependency not found - inject None
+                return self._handle_injection_success_sync(None, plan, parameter, injection_context, "optional_none")
+
+            return self._handle_injection_failure(e, plan, parameter)
         else:
-            # Non-strict mode: inject None for missing dependencies
-            debug.non_strict_mode_none(param_name)
-            return None
+            return self._handle_injection_success_sync(injected_value, plan, parameter, injection_context)
+        finally:
+            _current_injection_chain.reset(token)
+
+    @staticmethod
+    def _create_injection_context(
+        plan: "_InjectionPlan", parameter: "_InjectedParameter", current_injection_chain: InjectionChain
+    ) -> InjectionContext:
+        """Create the injection context that is passed to hooks."""
+        return InjectionContext(
+            function_name=plan.function_name,
+            parameter_name=parameter.name,
+            requested_type=parameter.requested_type,
+            options=parameter.options,
+            injection_strategy=plan.injection_config['strategy'],
+            type_matching=plan.injection_config['type_matching'],
+            strict_mode=plan.injection_config['strict_mode'],
+            debug_mode=plan.injection_config['debug_mode'],
+            injection_chain=current_injection_chain,
+            parameter_default=parameter.default,
+        )
+
+    def _handle_injection_failure(
+        self, exception: DependencyResolutionError, plan: "_InjectionPlan", parameter: "_InjectedParameter"
+    ) -> Any:
+        """Handle failed dependency injection."""
+        if plan.injection_config['strict_mode']:
+            raise exception
 
-    async def _handle_injection_success(self, injected_value: Any, injection_context: InjectionContext) -> Any:
+        # Non-strict mode: inject None for missing dependencies
+        self._trace_injection(plan, parameter, "non_strict_none")
+        return None
+
+    def _trace_injection(self, plan: "_InjectionPlan", parameter: "_InjectedParameter", outcome: str):
+        """Emits an inject event when tracing is on or the function was decorated with debug=True."""
+        if tracing.enabled or plan.injection_config['debug_mode']:
+            tracing.emit(
+                tracing.TraceEvent(
+                    kind="inject",
+                    dependency=parameter.resolve_type,
+                    source=outcome,
+                    container_id=id(self),
+                    qualifier=parameter.resolution_kwargs.get("qualifier"),
+                    function=plan.function_name,
+                    parameter=parameter.name,
+                ),
+                debug=plan.injection_config['debug_mode'],
+            )
+
+    async def _handle_injection_success(
+        self, injected_value: Any, plan: "_InjectionPlan", parameter: "_InjectedParameter",
+        injection_context: InjectionContext | None, outcome: str = "injected"
+    ) -> Any:
         """Handle successful dependency injection (async)."""
-        debug = create_debug_logger(injection_context.debug_mode)
+        self._trace_injection(plan, parameter, outcome)
 
-        debug.injected_parameter(injection_context.parameter_name, injection_context.requested_type, injected_value)
+        # Call INJECTION_RESPONSE hook - allows hooks to transform the injected value
+        if Hook.INJECTION_RESPONSE in self.registry.active_hooks:
+            hook_manager = self.registry.hooks[Hook.INJECTION_RESPONSE]
+            if hook_manager.has_async:
+                return await hook_manager.filter(self, injected_value, {"injection_context": injection_context}, dependency=parameter.resolve_type)
+            else:
+                return hook_manager.filter_sync(self, injected_value, {"injection_context": injection_context}, dependency=parameter.resolve_type)
+
+        return injected_value
+
+    def _handle_injection_success_sync(
+        self, injected_value: Any, plan: "_InjectionPlan", parameter: "_InjectedParameter",
+        injection_context: InjectionContext | None, outcome: str = "injected"
+    ) -> Any:
+        """Handle successful dependency injection (sync)."""
+        self._trace_injection(plan, parameter, outcome)
 
         # Call INJECTION_RESPONSE hook - allows hooks to transform the injected value
-        filtered_value = await self.registry.hooks[Hook.INJECTION_RESPONSE].filter(self, injected_value, {"injection_context": injection_context})
+        if Hook.INJECTION_RESPONSE in self.registry.active_hooks:
+            return self.registry.hooks[Hook.INJECTION_RESPONSE].filter_sync(self, injected_value, {"injection_context": injection_context}, dependency=parameter.resolve_type)
 
-        return filtered_value
+        return injected_value
 
     async def _resolve_qualified_dependency(self, param_type: type, qualifier: str, injection_context: InjectionContext):
         """
@@ -386,13 +687,10 @@ class Container(GlobalContextMixin, var=global_container):
         Raises:
             DependencyResolutionError: If qualified dependency cannot be resolved
         """
-        debug = create_debug_logger(injection_context.debug_mode)
-        debug.resolving_qualified(param_type, qualifier)
-
         # Check for existing qualified instance
         qualified_key = (param_type, qualifier)
-        if qualified_key in self.instances:
-            return self.instances[qualified_key]
+        if qualified_key in self._qualified_instances:
+            return self._qualified_instances[qualified_key]
 
         # Check parent container
         if self._parent:
@@ -409,42 +707,32 @@ class Container(GlobalContextMixin, var=global_container):
         )
 
 
-    async def _resolve_dependency_with_hooks(self, param_type, options, injection_context):
+    async def _resolve_dependency_with_hooks(
+        self, plan: "_InjectionPlan", parameter: "_InjectedParameter", injection_context: InjectionContext | None
+    ):
         """
         Resolve a dependency using the hook system with rich context (async).
 
         Args:
-            param_type: Type to resolve
-            options: Options object with qualifier, etc.
-            injection_context: Rich context for hooks
+            plan: The compiled injection plan of the function being called
+            parameter: The compiled parameter, with its optional type already unwrapped
+            injection_context: Rich context for hooks, None when no hook that receives it is registered
 
         Returns:
             Resolved dependency instance
         """
-        # Extract actual type if optional
-        is_optional = is_optional_type(param_type)
-        actual_type = get_non_none_type(param_type) if is_optional else param_type
-
-        try:
-            return await self._resolve_single_type_with_hooks(actual_type, options, injection_context)
-        except DependencyResolutionError:
-            if is_optional:
-                # Optional dependency not found - return None
-                debug = create_debug_logger(injection_context.debug_mode)
-                debug.optional_dependency_none(injection_context.parameter_name)
-                return None
-            else:
-                # Required dependency not found - re-raise
-                raise
+        return await self._resolve_single_type_with_hooks(plan, parameter, injection_context)
 
-    async def _resolve_single_type_with_hooks(self, param_type, options, injection_context):
+    async def _resolve_single_type_with_hooks(
+        self, plan: "_InjectionPlan", parameter: "_InjectedParameter", injection_context: InjectionContext | None
+    ):
         """
         Resolve a single non-optional type using the hook system (async).
 
         Args:
-            param_type: Type to resolve
-            options: Options object
-            injection_context: Rich context for hooks
+            plan: The compiled injection plan of the function being called
+            parameter: The compiled parameter
+            injection_context: Rich context for hooks, None when no hook that receives it is registered
 
         Returns:
             Resolved instance
@@ -452,146 +740,103 @@ class Container(GlobalContextMixin, var=global_container):
         Raises:
             Exception if type cannot be resolved
         """
-        debug = create_debug_logger(injection_context.debug_mode)
-        debug.resolving_dependency(param_type, options)
-
-        # Build kwargs for Result.find() - handle all options together
-        find_kwargs = {"context": {"injection_context": injection_context}}
-
-        if options:
-            if options.qualifier:
-                debug.resolving_qualified(param_type, options.qualifier)
-                find_kwargs["qualifier"] = options.qualifier
-            if options.default_factory:
-                debug.using_default_factory(param_type)
-                find_kwargs["default_factory"] = options.default_factory
-                find_kwargs["cache_factory_result"] = options.cache_factory_result
+        find_kwargs = self._build_find_kwargs(parameter, injection_context)
 
         # Delegate ALL resolution to Result.get_async() which handles qualified + default_factory combinations
         try:
-            return await self.find(param_type, **find_kwargs).get_async()
+            return await Result(self, parameter.resolve_type, **find_kwargs).get_async()
 
         except DependencyResolutionError as e:
-            # Re-raise with proper parameter name if it's not already set
-            if e.parameter_name == "unknown":
-                # Preserve qualified dependency error messages and add parameter context
-                error_msg = str(e)
-                if "qualified" in error_msg.lower():
-                    # Update message to include parameter name
-                    if "parameter '" in error_msg:
-                        # Message already has parameter info, just replace it
-                        updated_msg = error_msg.replace("parameter 'unknown'", f"parameter '{injection_context.parameter_name}'")
-                    else:
-                        # Add parameter info to the message
-                        updated_msg = f"{error_msg} for parameter '{injection_context.parameter_name}'"
-                    raise DependencyResolutionError(
-                        dependency_type=param_type,
-                        parameter_name=injection_context.parameter_name,
-                        message=updated_msg
-                    ) from e
-                else:
-                    # Generic dependency error
-                    type_name = getattr(param_type, '__name__', str(param_type))
-                    raise DependencyResolutionError(
-                        dependency_type=param_type,
-                        parameter_name=injection_context.parameter_name,
-                        message=f"Cannot resolve dependency {type_name} for parameter '{injection_context.parameter_name}'"
-                    ) from e
-            else:
-                # Parameter name already set, just re-raise
-                raise
-    
-    def _create_instance_with_hooks(self, dependency, injection_context):
-        """
-        Create an instance with hook integration for richer context.
-        
-        Args:
-            dependency: Type to create
-            injection_context: Rich context for hooks
-            
-        Returns:
-            Created instance
-        """
-        # Use container.get() which delegates to Result (async-native)
-        return self.get(dependency, context={"injection_context": injection_context})
+            self._reraise_for_parameter(e, parameter.resolve_type, parameter.name)
 
-    def _resolve_dependency(self, param_type, options, type_matching, strict_mode, debug_mode):
-        """
-        Resolve a single dependency from the container.
-        
-        Args:
-            param_type: Type to resolve
-            options: Options object with qualifier, etc.
-            type_matching: Type matching strategy
-            strict_mode: Whether to raise errors or return None
-            debug_mode: Whether to log debug info
-            
-        Returns:
-            Resolved dependency instance
-            
-        Raises:
-            Exception if dependency cannot be resolved and strict_mode is True
+    def _resolve_dependency_with_hooks_sync(
+        self, plan: "_InjectionPlan", parameter: "_InjectedParameter", injection_context: InjectionContext | None
+    ):
         """
-        
-        actual_type = get_non_none_type(param_type)
-        try:
-            return self._resolve_single_type(actual_type, options, type_matching, debug_mode)
-        except DependencyResolutionError:
-            if is_optional_type(param_type):
-                # Optional dependency not found
-                return None
+        Resolve a dependency using the hook system with rich context (sync).
 
-            raise
-
-    def _resolve_single_type(self, param_type, options, type_matching, debug_mode):
-        """
-        Resolve a single non-optional type from the container.
+        This combines _resolve_dependency_with_hooks and _resolve_single_type_with_hooks into a single frame. Nested
+        sync resolution runs on the caller's stack, so every frame saved here allows a deeper dependency graph.
 
         Args:
-            param_type: Type to resolve
-            options: Options object
-            type_matching: Type matching strategy
-            debug_mode: Whether to log debug info
+            plan: The compiled injection plan of the function being called
+            parameter: The compiled parameter, with its optional type already unwrapped
+            injection_context: Rich context for hooks, None when no hook that receives it is registered
 
         Returns:
-            Resolved instance
-
-        Raises:
-            Exception if type cannot be resolved
+            Resolved dependency instance
         """
-        debug = create_debug_logger(debug_mode)
-        debug.resolving_dependency(param_type, options)
-
-        # Handle qualified dependencies
-        if options and options.qualifier:
-            # Create a dummy injection context for the legacy path
-            from bevy.hooks import InjectionContext
-            from bevy.injection_types import InjectionStrategy, TypeMatchingStrategy
-            injection_context = InjectionContext(
-                function_name="legacy_resolution",
-                parameter_name="unknown",
-                requested_type=param_type,
-                options=options,
-                injection_strategy=InjectionStrategy.REQUESTED_ONLY,
-                type_matching=TypeMatchingStrategy.SUBCLASS,
-                strict_mode=True,
-                debug_mode=debug_mode,
-                injection_chain=[]
-            )
-            return self._resolve_qualified_dependency(param_type, options.qualifier, injection_context)
+        find_kwargs = self._build_find_kwargs(parameter, injection_context)
+
+        # Delegate ALL resolution to Result.get() which mirrors Result.get_async() without an event loop
+        try:
+            return Result(self, parameter.resolve_type, **find_kwargs).get()
 
-        # Delegate ALL resolution to container.get() which uses Result (single source of truth)
-        get_kwargs = {}
-        if options and options.default_factory:
-            debug.using_default_factory(param_type)
-            get_kwargs["default_factory"] = options.default_factory
-            get_kwargs["cache_factory_result"] = options.cache_factory_result
+        except DependencyResolutionError as e:
+            if parameter.is_optional:
+                raise
 
-        return self.get(param_type, **get_kwargs)
+            self._reraise_for_parameter(e, parameter.resolve_type, parameter.name)
+
+    @staticmethod
+    def _build_find_kwargs(
+        parameter: "_InjectedParameter", injection_context: InjectionContext | None
+    ) -> dict[str, Any]:
+        """Build the Result keyword arguments for resolving a parameter. The option derived arguments are precomputed
+        by the injection plan, only the per-call context is added here. The context is left out when no resolution
+        hook is registered that could receive it."""
+        if injection_context is None:
+            return {**parameter.resolution_kwargs, "parameter_name": parameter.name}
+
+        return {
+            **parameter.resolution_kwargs,
+            "parameter_name": parameter.name,
+            "context": {"injection_context": injection_context},
+        }
+
+    @staticmethod
+    def _reraise_for_parameter(
+        error: DependencyResolutionError, param_type, parameter_name: str
+    ) -> t.NoReturn:
+        """Re-raise a resolution error with the name of the parameter that was being injected."""
+        if error.parameter_name != "unknown":
+            # Parameter name already set, just re-raise
+            raise error
+
+        if isinstance(error, CircularDependencyError):
+            raise CircularDependencyError(
+                dependency_type=error.dependency_type,
+                parameter_name=parameter_name,
+                message=f"{error} for parameter '{parameter_name}'",
+            ) from error
+
+        # Preserve qualified dependency error messages and add parameter context
+        error_msg = str(error)
+        if "qualified" in error_msg.lower():
+            # Update message to include parameter name
+            if "parameter '" in error_msg:
+                # Message already has parameter info, just replace it
+                updated_msg = error_msg.replace("parameter 'unknown'", f"parameter '{parameter_name}'")
+            else:
+                # Add parameter info to the message
+                updated_msg = f"{error_msg} for parameter '{parameter_name}'"
+            raise DependencyResolutionError(
+                dependency_type=param_type,
+                parameter_name=parameter_name,
+                message=updated_msg
+            ) from error
+        else:
+            # Generic dependency error
+            type_name = getattr(param_type, '__name__', str(param_type))
+            raise DependencyResolutionError(
+                dependency_type=param_type,
+                parameter_name=parameter_name,
+                message=f"Cannot resolve dependency {type_name} for parameter '{parameter_name}'"
+            ) from error
 
     def _call_type[T](self, type_: t.Type[T], args, kwargs) -> T:
         instance = type_.__new__(type_, *args, **kwargs)
-        self.call(instance.__init__, *args, **kwargs)
+        InjectableCallable.from_callable(instance.__init__).call_using(self, *args, **kwargs)
         return instance
 
     def _get_factory_cache_result(self, factory: t.Callable) -> t.Any | None:
@@ -604,8 +849,8 @@ class Container(GlobalContextMixin, var=global_container):
         Returns:
             Cached result if found, None otherwise
         """
-        if factory in self.instances:
-            return self.instances[factory]
+        if factory in self._factory_results:
+            return self._factory_results[factory]
         
         if self._parent:
             return self._parent._get_factory_cache_result(factory)
@@ -613,39 +858,170 @@ class Container(GlobalContextMixin, var=global_container):
         return None
 
     def _find_factory_for_type(self, dependency):
-        if not isinstance(dependency, type):
+        return self.registry.find_factory(dependency)
+
+    def _get_existing_instance(
+        self, dependency: t.Type[Instance], type_matching: TypeMatchingStrategy = TypeMatchingStrategy.EXACT_TYPE
+    ) -> Optional[Instance]:
+        """Looks up an instance stored in this container for the dependency, parent containers are not checked.
+
+        An instance stored for exactly the dependency type always wins. What else can match depends on the strategy:
+
+        - EXACT_TYPE (and DEFAULT): Nothing else, the lookup is a single dict probe.
+        - SUBCLASS: The first instance that was stored for a subclass of the dependency. Instances stored later for
+          other subclasses never replace it.
+        - STRUCTURAL: The same as SUBCLASS, then when the dependency is a runtime checkable protocol, the first stored
+          instance that satisfies the protocol.
+
+        Qualified instances are never matched, cached factory results are only matched when the factory is a class,
+        the same way as instances stored for that class.
+        """
+        if dependency in self._type_instances:
+            return Optional.Some(self._type_instances[dependency])
+
+        if dependency in self._factory_results and isinstance(dependency, type):
+            return Optional.Some(self._factory_results[dependency])
+
+        if type_matching in _EXACT_TYPE_MATCHING:
             return Optional.Nothing()
 
-        for factory_type, factory in self.registry.factories.items():
-            if issubclass_or_raises(
-                dependency,
-                factory_type,
-                TypeError(f"Cannot check if {dependency!r} is a subclass of {factory_type!r}")
-            ):
-                return Optional.Some(factory)
+        for subtype in self._subtype_index.get(dependency, ()):
+            if subtype in self._type_instances:
+                return Optional.Some(self._type_instances[subtype])
+
+            if subtype in self._factory_results:
+                return Optional.Some(self._factory_results[subtype])
+
+        if type_matching is TypeMatchingStrategy.STRUCTURAL and _is_runtime_protocol(dependency):
+            for instance in self._type_instances.values():
+                if _satisfies_protocol(instance, dependency):
+                    return Optional.Some(instance)
 
         return Optional.Nothing()
 
-    def _get_existing_instance(self, dependency: t.Type[Instance]) -> Optional[Instance]:
-        if dependency in self.instances:
-            return Optional.Some(self.instances[dependency])
+    def _cache_instance(self, dependency: t.Any, instance: Instance):
+        """Stores an instance that was resolved for the dependency."""
+        self._store_instance(self._type_instances, dependency, instance)
+
+    def _cache_qualified_instance(self, qualified_key: tuple[t.Any, str], instance: Instance):
+        self._store_instance(self._qualified_instances, qualified_key, instance)
+
+    def _cache_factory_result(self, factory: t.Callable, instance: Instance):
+        self._store_instance(self._factory_results, factory, instance)
+
+    def _store_instance(self, store: dict, key: t.Any, instance: Instance):
+        """Every instance the container stores goes through here. Classes are indexed under their base classes for
+        subclass matching, and what was known about the lookups that the instance can answer is forgotten in this
+        container and its branches. Qualified instances and results cached for factory functions don't answer type
+        lookups. Storing the instance that is already stored changes nothing, so nothing is forgotten."""
+        if key in store and store[key] is instance:
+            return
+
+        store[key] = instance
+        if isinstance(key, type):
+            self._index_subtype(key)
+            self._forget_lookups(*key.__mro__)
+        elif store is self._type_instances:
+            self._forget_lookups(key)
+
+    def _remove_instance(self, store: dict, key: t.Any):
+        del store[key]
+        if isinstance(key, type) or store is self._type_instances:
+            self._forget_lookups(*_lookup_keys(key))
+
+    def _known_missing(self, dependency: t.Any) -> bool | None:
+        """Returns None if the dependency isn't known to be missing. Otherwise returns True if it also couldn't be
+        created, False if it only isn't stored in this container or its parents."""
+        if self._missing_registry_version != self.registry.version:
+            self._missing.clear()
+            self._missing_registry_version = self.registry.version
+
+        return self._missing.get(dependency)
+
+    def _remember_missing(self, dependency: t.Any, lookups_version: int, *, unresolvable: bool = False):
+        """Remembers the dependency as missing, unless something was stored since the lookups version was read."""
+        if self._missing_registry_version == self.registry.version and lookups_version == self._lookups_version:
+            self._missing[dependency] = unresolvable
+
+    def _find_in_parents(
+        self, dependency: t.Any, type_matching: TypeMatchingStrategy = TypeMatchingStrategy.EXACT_TYPE
+    ) -> Instance | None:
+        """Finds the instance the nearest parent container stores for the dependency, returns None if no parent
+        stores one. Parent hooks are not run.
+
+        Exact type answers are remembered, so each container builds a flattened view of its parents' instances as
+        types are looked up. Branches of a long-lived container reuse its view, so a miss in a deep branch is
+        usually answered by a single dict probe in the first parent instead of a walk up the whole chain.
+        """
+        if type_matching not in _EXACT_TYPE_MATCHING:
+            parent = self._parent
+            while parent:
+                if instance := parent._get_existing_instance(dependency, type_matching):
+                    return instance.value
 
-        if not isinstance(dependency, type):
-            return Optional.Nothing()
+                parent = parent._parent
 
-        for instance_type, instance in self.instances.items():
-            # Skip qualified instances (tuple keys) and factory-cached instances (callable keys)
-            if isinstance(instance_type, tuple) or callable(instance_type):
+            return None
+
+        found = self._parent_lookups.get(dependency, _UNKNOWN)
+        if found is not _UNKNOWN:
+            return found
+
+        # The containers passed on the way up, each learns the answer unless something was stored while looking
+        visited: list[tuple[Container, int]] = []
+        container = self
+        while True:
+            parent = container._parent
+            if not parent:
+                found = None
+                break
+
+            visited.append((container, container._lookups_version))
+            match parent._get_existing_instance(dependency):
+                case Optional.Some(instance):
+                    found = instance
+                    break
+
+            found = parent._parent_lookups.get(dependency, _UNKNOWN)
+            if found is not _UNKNOWN:
+                break
+
+            container = parent
+
+        for container, version in visited:
+            if version == container._lookups_version:
+                container._parent_lookups[dependency] = found
+
+        return found
+
+    def _forget_lookups(self, *dependencies: t.Any):
+        """Forgets what is known about where the dependencies are stored in this container and every branch of it.
+        Only called when an instance is stored for a new key, replaced, or deleted.
+
+        Branches are walked without recursion so chains of any depth can be invalidated, and the children lock is only
+        held while each container's branches are copied."""
+        pending = [self]
+        while pending:
+            container = pending.pop()
+            container._lookups_version += 1
+            for dependency in dependencies:
+                container._missing.pop(dependency, None)
+                container._parent_lookups.pop(dependency, None)
+
+            if container._children:
+                with _children_lock:
+                    pending.extend(container._children)
+
+    def _index_subtype(self, for_dependency: type):
+        """Indexes a type stored in the container under each of its base classes. Types are indexed once so the
+        first subclass stored for a base class keeps precedence when it is replaced."""
+        for base in for_dependency.__mro__[1:]:
+            if base is object:
                 continue
-                
-            if issubclass_or_raises(
-                dependency,
-                instance_type,
-                TypeError(f"Cannot check if {dependency} is a subclass of {instance_type}")
-            ):
-                return Optional.Some(instance)
 
-        return Optional.Nothing()
+            subtypes = self._subtype_index.setdefault(base, [])
+            if for_dependency not in subtypes:
+                subtypes.append(for_dependency)
 
 
 def _unwrap_function(func: object) -> Any:
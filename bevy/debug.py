@@ -1,6 +1,10 @@
 """
 Debug utilities for the Bevy dependency injection system.
+
+Bevy no longer uses these internally, resolution and injection are traced by bevy.tracing. The DebugLogger is kept for
+code that uses it directly, its messages go to the "bevy" logger at DEBUG level.
 """
+from bevy.tracing import logger
 
 
 class DebugLogger:
@@ -8,7 +12,8 @@ class DebugLogger:
     Centralized debug logging for dependency injection.
     
     Provides clean debug logging without cluttering the main code
-    with if statements everywhere.
+    with if statements everywhere. Messages are logged to the "bevy"
+    logger.
     """
     
     def __init__(self, enabled: bool = False):
@@ -17,38 +22,38 @@ class DebugLogger:
     def log(self, message: str):
         """Log a debug message if debugging is enabled."""
         if self.enabled:
-            print(f"[BEVY DEBUG] {message}")
+            logger.debug(message)
     
     def resolving_dependency(self, param_type: type, options=None):
         """Log dependency resolution start."""
         if self.enabled:
             opts_str = f" with options {options}" if options else ""
-            print(f"[BEVY DEBUG] Resolving {param_type}{opts_str}")
+            logger.debug(f"Resolving {param_type}{opts_str}")
     
     def resolving_qualified(self, param_type: type, qualifier: str):
         """Log qualified dependency resolution."""
         if self.enabled:
-            print(f"[BEVY DEBUG] Resolving qualified {param_type} with qualifier '{qualifier}'")
+            logger.debug(f"Resolving qualified {param_type} with qualifier '{qualifier}'")
     
     def using_default_factory(self, param_type: type):
         """Log default factory usage."""
         if self.enabled:
-            print(f"[BEVY DEBUG] Using default factory for {param_type}")
+            logger.debug(f"Using default factory for {param_type}")
     
     def optional_dependency_none(self, param_name: str):
         """Log optional dependency returning None."""
         if self.enabled:
-            print(f"[BEVY DEBUG] Optional dependency {param_name} not found, using None")
+            logger.debug(f"Optional dependency {param_name} not found, using None")
     
     def non_strict_mode_none(self, param_name: str):
         """Log non-strict mode returning None."""
         if self.enabled:
-            print(f"[BEVY DEBUG] Non-strict mode: {param_name} not found, using None")
+            logger.debug(f"Non-strict mode: {param_name} not found, using None")
     
     def injected_parameter(self, param_name: str, param_type: type, value):
         """Log successful parameter injection."""
         if self.enabled:
-            print(f"[BEVY DEBUG] Injected {param_name}: {param_type} = {value}")
+            logger.debug(f"Injected {param_name}: {param_type} = {value}")
 
 
 # Global debug logger instance
@@ -0,0 +1,321 @@
+"""
+Dependency graphs of a module's injectables and a registry's factories.
+
+The graph is built statically: the parameters of every ``@injectable`` function are read with get_injection_info, and
+every dependency they request is followed through the registry. Dependencies requested with a default_factory are
+provided by it. Otherwise types with a registered factory are provided by that factory, and other classes are
+expected to be built from their constructor by an unsupported dependency hook (such as the bundled type_factory) so
+their ``__init__`` parameters are followed with analyze_function_signature. Qualified dependencies are only provided
+by a default_factory or by instances added to a container, so without one they're unresolved. Factories are only
+followed further when they are injectable themselves, a plain factory that is passed the container is a leaf.
+
+Profiling resolves the parameters of every injectable, the same way injection would but without calling the
+injectable, and every factory's type once on a new container. Each node is then annotated with how long it took to
+construct (including its own dependencies) and the size of the instance.
+
+Example:
+    >>> from bevy.dependency_graph import build_graph
+    >>>
+    >>> graph = build_graph(myapp.services, registry)
+    >>> graph.profile(registry.create_container())
+    >>> print(graph.to_dot())
+"""
+import json
+import sys
+from dataclasses import dataclass, field
+from time import perf_counter_ns
+from types import ModuleType
+from typing import Any
+
+import bevy.tracing as tracing
+from bevy.factories import Factory
+from bevy.hooks import Hook
+from bevy.injection_types import get_non_none_type, InjectionStrategy, is_optional_type, Options, TypeMatchingStrategy
+from bevy.injections import analyze_function_signature, get_injection_info, is_injectable
+
+# Sources that mean the dependency was constructed by the lookup rather than found
+_CONSTRUCTED_SOURCES = frozenset({"factory", "hook", "default"})
+
+
+@dataclass(slots=True)
+class Node:
+    """A dependency or an injectable in the graph.
+
+    Attributes:
+        id: Unique name of the node, the qualified name of the function or type plus the qualifier
+        kind: "injectable" or "dependency"
+        provider: How a dependency is provided, "factory", "constructor", or "unresolved". None for injectables.
+        factory: The name of the registered factory, when there is one
+        qualifier: The qualifier the dependency was requested with
+        construction_ns: Nanoseconds it took to construct the dependency, or to resolve the injectable's parameters,
+            when profiled
+        size_bytes: Size of the instance and its attribute dict when profiled
+        error: The exception raised while profiling the node
+    """
+    id: str
+    kind: str
+    provider: str | None = None
+    factory: str | None = None
+    qualifier: str | None = None
+    construction_ns: int | None = None
+    size_bytes: int | None = None
+    error: str | None = None
+    target: Any = field(default=None, repr=False, compare=False)
+
+
+@dataclass(frozen=True, slots=True)
+class Edge:
+    """A parameter of the source node that requests the target node."""
+    source: str
+    target: str
+    parameter: str
+    optional: bool = False
+
+
+class DependencyGraph:
+    """Nodes and the edges between them, in the order they were found."""
+
+    def __init__(self):
+        self.nodes: dict[str, Node] = {}
+        self.edges: list[Edge] = []
+
+    def dependencies(self, node_id: str) -> set[str]:
+        """Every node that the node depends on, directly or indirectly."""
+        targets: dict[str, list[str]] = {}
+        for edge in self.edges:
+            targets.setdefault(edge.source, []).append(edge.target)
+
+        found = set()
+        pending = [node_id]
+        while pending:
+            for target in targets.get(pending.pop(), ()):
+                if target not in found:
+                    found.add(target)
+                    pending.append(target)
+
+        return found
+
+    def profile(self, container):
+        """Resolves the parameters of each injectable and gets each dependency that hasn't been constructed yet on the
+        container, recording how long each dependency took to construct and how large the instances are. Injectables
+        are never called."""
+        timings: dict[tuple[Any, str | None], int] = {}
+
+        def record(event: tracing.TraceEvent):
+            if event.kind == "resolve" and event.source in _CONSTRUCTED_SOURCES:
+                timings.setdefault((event.dependency, event.qualifier), event.duration_ns)
+
+        tracing.add_sink(record)
+        try:
+            for node in self.nodes.values():
+                if node.kind == "injectable":
+                    self._profile_injectable(node, container)
+
+            for node in self.nodes.values():
+                if node.kind == "dependency" and (node.target, node.qualifier) not in timings:
+                    try:
+                        container.get(node.target, qualifier=node.qualifier)
+                    except Exception as exception:
+                        node.error = repr(exception)
+        finally:
+            tracing.remove_sink(record)
+
+        for node in self.nodes.values():
+            if node.kind == "dependency" and (node.target, node.qualifier) in timings:
+                node.construction_ns = timings[node.target, node.qualifier]
+                instance = container.get(node.target, qualifier=node.qualifier, default=None)
+                if instance is not None:
+                    node.size_bytes = _instance_size(instance)
+
+    def to_dict(self) -> dict[str, Any]:
+        nodes = []
+        for node in self.nodes.values():
+            data = {
+                "id": node.id,
+                "kind": node.kind,
+                "dependencies": len(self.dependencies(node.id)),
+            }
+            for name in ("provider", "factory", "qualifier", "construction_ns", "size_bytes", "error"):
+                if getattr(node, name) is not None:
+                    data[name] = getattr(node, name)
+
+            nodes.append(data)
+
+        edges = [
+            {"source": edge.source, "target": edge.target, "parameter": edge.parameter, "optional": edge.optional}
+            for edge in self.edges
+        ]
+        return {"nodes": nodes, "edges": edges}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_dot(self) -> str:
+        """The graph in Graphviz's DOT language. Injectables are boxes, dependencies that can't be resolved are red."""
+        lines = ["digraph bevy {", "    rankdir=LR;", "    node [shape=ellipse];"]
+        for node in self.nodes.values():
+            label = [node.id]
+            if node.factory:
+                label.append(f"factory: {node.factory}")
+
+            if node.construction_ns is not None:
+                label.append(f"{node.construction_ns / 1000:.1f} us")
+
+            if node.size_bytes is not None:
+                label.append(f"{node.size_bytes} bytes")
+
+            attributes = ["label=" + _quote("\n".join(label))]
+            if node.kind == "injectable":
+                attributes.append("shape=box")
+
+            if node.provider == "unresolved" or node.error:
+                attributes.append("color=red")
+
+            lines.append(f"    {_quote(node.id)} [{', '.join(attributes)}];")
+
+        for edge in self.edges:
+            style = ", style=dashed" if edge.optional else ""
+            lines.append(f"    {_quote(edge.source)} -> {_quote(edge.target)} [label={_quote(edge.parameter)}{style}];")
+
+        lines.append("}")
+        return "\n".join(lines) + "\n"
+
+    def _profile_injectable(self, node: Node, container):
+        info = get_injection_info(node.target)
+        started = perf_counter_ns()
+        for dependency, options in info["params"].values():
+            kwargs = _resolution_kwargs(options, info["type_matching"])
+            if is_optional_type(dependency):
+                dependency = get_non_none_type(dependency)
+                kwargs["default"] = None
+
+            try:
+                container.find(dependency, **kwargs).get()
+            except Exception as exception:
+                node.error = repr(exception)
+                return
+
+        node.construction_ns = perf_counter_ns() - started
+
+
+def build_graph(module: ModuleType, registry) -> DependencyGraph:
+    """Builds the graph for the injectables defined in the module and the factories in the registry."""
+    graph = DependencyGraph()
+    injectables = [
+        value for value in vars(module).values()
+        if is_injectable(value) and getattr(value, "__module__", None) == module.__name__
+    ]
+    for func in injectables:
+        node_id = _name(func)
+        graph.nodes[node_id] = Node(node_id, "injectable", target=func)
+        _add_parameters(graph, registry, node_id, get_injection_info(func)["params"])
+
+    for dependency_type in list(registry.factories):
+        _add_dependency(graph, registry, dependency_type, None)
+
+    return graph
+
+
+def _add_dependency(
+    graph: DependencyGraph, registry, dependency: Any, qualifier: str | None, options: Options | None = None
+) -> str:
+    node_id = f"{_name(dependency)}[{qualifier}]" if qualifier else _name(dependency)
+    if node_id in graph.nodes:
+        return node_id
+
+    node = graph.nodes[node_id] = Node(node_id, "dependency", qualifier=qualifier, target=dependency)
+    if options and options.default_factory:
+        node.provider = "factory"
+        node.factory = _name(options.default_factory)
+        if is_injectable(options.default_factory):
+            _add_parameters(graph, registry, node_id, get_injection_info(options.default_factory)["params"])
+
+        return node_id
+
+    if qualifier:  # Registry factories and constructors are never used for qualified dependencies
+        node.provider = "unresolved"
+        return node_id
+
+    factory = registry.find_factory(dependency).value_or(None) if isinstance(dependency, type) else None
+    if factory is not None:
+        node.provider = "factory"
+        node.factory = _name(factory)
+        wrapped = factory.factory if isinstance(factory, Factory) else factory
+        if is_injectable(wrapped):
+            _add_parameters(graph, registry, node_id, get_injection_info(wrapped)["params"])
+
+    elif isinstance(dependency, type) and _has_unsupported_dependency_hooks(registry):
+        node.provider = "constructor"
+        _add_parameters(graph, registry, node_id, _constructor_parameters(dependency))
+
+    else:
+        node.provider = "unresolved"
+
+    return node_id
+
+
+def _add_parameters(graph: DependencyGraph, registry, source: str, params: dict[str, tuple[Any, Any]]):
+    for name, (dependency, options) in params.items():
+        optional = is_optional_type(dependency)
+        if optional:
+            dependency = get_non_none_type(dependency)
+
+        qualifier = options.qualifier if options else None
+        target = _add_dependency(graph, registry, dependency, qualifier, options)
+        graph.edges.append(Edge(source, target, name, optional))
+
+
+def _resolution_kwargs(options: Options | None, type_matching: TypeMatchingStrategy) -> dict[str, Any]:
+    """The keyword arguments injection resolves a parameter with, see _compile_injection_plan."""
+    kwargs: dict[str, Any] = {}
+    if options:
+        if options.qualifier:
+            kwargs["qualifier"] = options.qualifier
+
+        if options.default_factory:
+            kwargs["default_factory"] = options.default_factory
+            kwargs["cache_factory_result"] = options.cache_factory_result
+
+    if type_matching is not TypeMatchingStrategy.DEFAULT:
+        kwargs["type_matching"] = type_matching
+
+    return kwargs
+
+
+def _constructor_parameters(dependency: type) -> dict[str, tuple[Any, Any]]:
+    """The parameters that are injected when the type is called, the same way Container.call analyzes them."""
+    if dependency.__init__ is object.__init__:
+        return {}
+
+    try:
+        return analyze_function_signature(dependency.__init__, InjectionStrategy.ANY_NOT_PASSED)
+    except (NameError, TypeError, ValueError):  # Unresolvable annotations or no signature
+        return {}
+
+
+def _has_unsupported_dependency_hooks(registry) -> bool:
+    manager = registry.hooks.get(Hook.HANDLE_UNSUPPORTED_DEPENDENCY)
+    return bool(manager and manager.callbacks)
+
+
+def _instance_size(instance: Any) -> int:
+    """Size of the instance and its attribute dict. Attributes aren't followed because they're usually other
+    dependencies that have their own nodes."""
+    size = sys.getsizeof(instance)
+    if hasattr(instance, "__dict__"):
+        size += sys.getsizeof(instance.__dict__)
+
+    return size
+
+
+def _name(value: Any) -> str:
+    module = getattr(value, "__module__", None)
+    name = getattr(value, "__qualname__", None)
+    if name is None:
+        return repr(value)
+
+    return f"{module}.{name}" if module and module != "builtins" else name
+
+
+def _quote(text: str) -> str:
+    return '"' + text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
@@ -1,8 +1,6 @@
-import asyncio
-import concurrent.futures
-import contextvars
 import inspect
 import typing as t
+from time import perf_counter_ns
 from typing import TYPE_CHECKING, Any
 
 from tramp.optionals import Optional
@@ -11,7 +9,11 @@ if TYPE_CHECKING:
     from bevy.containers import Container
     from bevy.injection_types import DependencyResolutionError
 
+import bevy.spans as spans
+import bevy.tracing as tracing
+from bevy.async_bridge import run_coroutine_sync
 from bevy.hooks import Hook
+from bevy.injection_types import TypeMatchingStrategy
 
 
 def issubclass_or_raises[T](cls: T, class_or_tuple: t.Type[T] | tuple[t.Type[T], ...], exception: Exception) -> bool:
@@ -25,6 +27,9 @@ def issubclass_or_raises[T](cls: T, class_or_tuple: t.Type[T] | tuple[t.Type[T],
 class Result[T]:
     """Bevy's result types allow values to be fetched from a container in either sync or async contexts."""
 
+    # Where the value came from, only recorded for tracing. Stays "cache" when an existing instance is used.
+    _source = "cache"
+
     def __init__(self, container: "Container", dependency: t.Type[T], **kwargs):
         """Initialize Result with container context and dependency resolution parameters.
 
@@ -32,7 +37,8 @@ class Result[T]:
             container: The container to resolve dependencies from
             dependency: The type to resolve
             **kwargs: Additional parameters matching container.get() signature
-                     (default, default_factory, qualifier, context)
+                     (default, default_factory, qualifier, type_matching, context). Injection also passes
+                     the parameter_name that is being resolved, it is used in resolution errors.
         """
         self.container = container
         self.dependency = dependency
@@ -56,76 +62,130 @@ class Result[T]:
         Returns:
             Instance created by factory
         """
-        # Check if factory accepts parameters for dependency injection
-        factory_sig = inspect.signature(factory)
-        if len(factory_sig.parameters) > 0:
-            # Factory accepts parameters, use container for dependency injection
-            result = self.container.call(factory)
-        else:
-            # Factory takes no parameters, call directly
-            result = factory()
-
-        # Await if result is a coroutine or awaitable
-        if inspect.iscoroutine(result):
-            return await result
-        elif hasattr(result, "__await__"):
-            # Awaitable but not a coroutine (e.g., asyncio.Task)
-            return await result
-        else:
-            # Sync result, return as-is
-            return result
+        span = self._start_span("create", self.dependency, factory=spans.describe(factory)) if spans.enabled else None
+        started = perf_counter_ns()
+        try:
+            # Check if factory accepts parameters for dependency injection
+            factory_sig = inspect.signature(factory)
+            if len(factory_sig.parameters) > 0:
+                # Factory accepts parameters, use container for dependency injection
+                result = self.container.call(factory)
+            else:
+                # Factory takes no parameters, call directly
+                result = factory()
+
+            # Await if result is a coroutine or awaitable
+            if inspect.iscoroutine(result):
+                return await result
+            elif hasattr(result, "__await__"):
+                # Awaitable but not a coroutine (e.g., asyncio.Task)
+                return await result
+            else:
+                # Sync result, return as-is
+                return result
+        except BaseException as exception:
+            if span is not None:
+                spans.fail(span, exception)
+            raise
+        finally:
+            if self.container.registry.collect_metrics:
+                self.container._record_factory(factory, perf_counter_ns() - started)
+
+            if span is not None:
+                spans.finish(span)
+
+    def _call_factory_sync(self, factory: t.Callable) -> t.Any:
+        """Sync version of _call_factory. Factories are called inline and only async results are run on an event
+        loop.
+
+        Args:
+            factory: Factory function to call
+
+        Returns:
+            Instance created by factory
+        """
+        span = self._start_span("create", self.dependency, factory=spans.describe(factory)) if spans.enabled else None
+        started = perf_counter_ns()
+        try:
+            factory_sig = inspect.signature(factory)
+            if len(factory_sig.parameters) > 0:
+                # Factory accepts parameters, use container for dependency injection
+                result = self.container.call(factory)
+            else:
+                # Factory takes no parameters, call directly
+                result = factory()
+
+            if inspect.iscoroutine(result):
+                return run_coroutine_sync(result, self.container.resolution_timeout)
+            elif hasattr(result, "__await__"):
+                return run_coroutine_sync(self._await(result), self.container.resolution_timeout)
+            else:
+                return result
+        except BaseException as exception:
+            if span is not None:
+                spans.fail(span, exception)
+            raise
+        finally:
+            if self.container.registry.collect_metrics:
+                self.container._record_factory(factory, perf_counter_ns() - started)
+
+            if span is not None:
+                spans.finish(span)
+
+    @staticmethod
+    async def _await(awaitable: t.Awaitable) -> t.Any:
+        return await awaitable
+
+    def _lookup_hooks_registered(self) -> bool:
+        """Parent lookups have to run through the parents' GET_INSTANCE and GOT_INSTANCE hooks when any are
+        registered, otherwise the container's flattened view of its parents can be used."""
+        active_hooks = self.container.registry.active_hooks
+        return Hook.GET_INSTANCE in active_hooks or Hook.GOT_INSTANCE in active_hooks
+
+    @property
+    def _type_matching(self) -> TypeMatchingStrategy:
+        """DEFAULT only uses instances stored for exactly the dependency type, the same as EXACT_TYPE."""
+        type_matching = self.kwargs.get("type_matching", TypeMatchingStrategy.EXACT_TYPE)
+        if type_matching is TypeMatchingStrategy.DEFAULT:
+            return TypeMatchingStrategy.EXACT_TYPE
+
+        return type_matching
 
     def _get_existing_instance(self, dependency: t.Type) -> Optional[Any]:
         """Lookup an existing instance in the container's cache.
 
-        Checks for exact type match first, then subclass matches.
-        Skips qualified instances and factory-cached instances.
+        Checks for an exact type match first, then for instances that match using the type matching strategy. See
+        Container._get_existing_instance for the matching rules.
         """
-        if dependency in self.container.instances:
-            return Optional.Some(self.container.instances[dependency])
-
-        if not isinstance(dependency, type):
-            return Optional.Nothing()
+        return self.container._get_existing_instance(dependency, self._type_matching)
 
-        for instance_type, instance in self.container.instances.items():
-            # Skip qualified instances (tuple keys) and factory-cached instances (callable keys)
-            if isinstance(instance_type, tuple) or callable(instance_type):
-                continue
+    def _known_missing(self) -> bool | None:
+        """Containers only remember the dependencies that exact type lookups couldn't find."""
+        if self._type_matching is not TypeMatchingStrategy.EXACT_TYPE:
+            return None
 
-            if issubclass_or_raises(
-                dependency,
-                instance_type,
-                TypeError(f"Cannot check if {dependency} is a subclass of {instance_type}")
-            ):
-                return Optional.Some(instance)
+        return self.container._known_missing(self.dependency)
 
-        return Optional.Nothing()
+    def _remember_missing(self, *, unresolvable: bool = False):
+        """Only remembered when nothing was stored in the container or its parents since the stored instances were
+        checked, otherwise an instance added by another thread would be hidden by the stale miss."""
+        if self._type_matching is TypeMatchingStrategy.EXACT_TYPE:
+            self.container._remember_missing(self.dependency, self._lookups_version, unresolvable=unresolvable)
 
     def _find_factory_for_type(self, dependency: t.Type) -> Optional[t.Callable]:
         """Find a factory function that can create instances of the dependency type.
 
         Searches the registry for a factory registered for this type or a parent type.
         """
-        if not isinstance(dependency, type):
-            return Optional.Nothing()
-
-        for factory_type, factory in self.container.registry.factories.items():
-            if issubclass_or_raises(
-                dependency,
-                factory_type,
-                TypeError(f"Cannot check if {dependency!r} is a subclass of {factory_type!r}")
-            ):
-                return Optional.Some(factory)
-
-        return Optional.Nothing()
+        return self.container.registry.find_factory(dependency)
 
     def _get_factory_cache_result(self, factory: t.Callable) -> Any | None:
         """Get cached result for a factory function, checking parent containers.
 
         Recursively walks up the parent chain looking for a cached result.
         """
-        if factory in self.container.instances:
-            return self.container.instances[factory]
+        if factory in self.container._factory_results:
+            return self.container._factory_results[factory]
 
         if self.container.parent:
             # Recursively check parent - create a temporary Result for parent lookup
@@ -140,83 +200,398 @@ class Result[T]:
         Uses async hooks natively for truly async dependency resolution.
         Returns (instance, disable_implicit_caching).
         """
-        disable_implicit_caching = False
+        span = self._start_span("create", dependency) if spans.enabled else None
+        try:
+            disable_implicit_caching = False
+
+            if Hook.CREATE_INSTANCE in self.container.registry.active_hooks:
+                hook_manager = self.container.registry.hooks[Hook.CREATE_INSTANCE]
+                if hook_manager.has_async:
+                    lookup = await hook_manager.handle(self.container, dependency, context, dependency=dependency)
+                else:
+                    lookup = hook_manager.handle_sync(self.container, dependency, context, dependency=dependency)
+            else:
+                lookup = Optional.Nothing()
+
+            match lookup:
+                case Optional.Some(v):
+                    instance = v
+                    disable_implicit_caching = True  # Hook should handle caching
+                    self._source = "hook"
+
+                case Optional.Nothing():
+                    match self._find_factory_for_type(dependency):
+                        case Optional.Some(factory):
+                            self._source = "factory"
+                            if span is not None:
+                                span.attributes["factory"] = spans.describe(factory)
+
+                            # Call factory - await only if factory is a coroutine function
+                            started = perf_counter_ns()
+                            if inspect.iscoroutinefunction(factory):
+                                instance = await factory(self.container)
+                            else:
+                                instance = factory(self.container)
+
+                            if self.container.registry.collect_metrics:
+                                self.container._record_factory(factory, perf_counter_ns() - started)
+
+                        case Optional.Nothing():
+                            instance = await self._handle_unsupported_dependency(dependency, context)
+                            disable_implicit_caching = True  # If no error raised, hook should handle caching
+                            self._source = "hook"
+
+                        case _:
+                            raise RuntimeError(f"Impossible state reached.")
+
+                case _:
+                    raise ValueError(
+                        f"Invalid value returned from hook for dependency: {dependency}, must be an Optional type."
+                    )
+
+            if Hook.CREATED_INSTANCE in self.container.registry.active_hooks:
+                hook_manager = self.container.registry.hooks[Hook.CREATED_INSTANCE]
+                if hook_manager.has_async:
+                    instance = await hook_manager.filter(self.container, instance, context, dependency=dependency)
+                else:
+                    instance = hook_manager.filter_sync(self.container, instance, context, dependency=dependency)
+
+            return instance, disable_implicit_caching
+        except BaseException as exception:
+            if span is not None:
+                spans.fail(span, exception)
+            raise
+        finally:
+            if span is not None:
+                spans.finish(span)
+
+    def _create_instance_sync(self, dependency: t.Type, context: dict[str, Any]) -> tuple[Any, bool]:
+        """Sync version of _create_instance. Only async hooks and async factories are run on an event loop.
+        Returns (instance, disable_implicit_caching).
+        """
+        span = self._start_span("create", dependency) if spans.enabled else None
+        try:
+            disable_implicit_caching = False
+
+            if Hook.CREATE_INSTANCE in self.container.registry.active_hooks:
+                lookup = self.container.registry.hooks[Hook.CREATE_INSTANCE].handle_sync(self.container, dependency, context, dependency=dependency)
+            else:
+                lookup = Optional.Nothing()
+
+            match lookup:
+                case Optional.Some(v):
+                    instance = v
+                    disable_implicit_caching = True  # Hook should handle caching
+                    self._source = "hook"
+
+                case Optional.Nothing():
+                    match self._find_factory_for_type(dependency):
+                        case Optional.Some(factory):
+                            self._source = "factory"
+                            if span is not None:
+                                span.attributes["factory"] = spans.describe(factory)
+
+                            started = perf_counter_ns()
+                            if inspect.iscoroutinefunction(factory):
+                                instance = run_coroutine_sync(factory(self.container), self.container.resolution_timeout)
+                            else:
+                                instance = factory(self.container)
+
+                            if self.container.registry.collect_metrics:
+                                self.container._record_factory(factory, perf_counter_ns() - started)
+
+                        case Optional.Nothing():
+                            instance = self._handle_unsupported_dependency_sync(dependency, context)
+                            disable_implicit_caching = True  # If no error raised, hook should handle caching
+                            self._source = "hook"
+
+                        case _:
+                            raise RuntimeError(f"Impossible state reached.")
+
+                case _:
+                    raise ValueError(
+                        f"Invalid value returned from hook for dependency: {dependency}, must be an Optional type."
+                    )
+
+            if Hook.CREATED_INSTANCE in self.container.registry.active_hooks:
+                instance = self.container.registry.hooks[Hook.CREATED_INSTANCE].filter_sync(self.container, instance, context, dependency=dependency)
+
+            return instance, disable_implicit_caching
+        except BaseException as exception:
+            if span is not None:
+                spans.fail(span, exception)
+            raise
+        finally:
+            if span is not None:
+                spans.finish(span)
+
+    def _handle_unsupported_dependency_sync(self, dependency: t.Type, context: dict[str, Any]) -> Any:
+        """Sync version of _handle_unsupported_dependency."""
+        if Hook.HANDLE_UNSUPPORTED_DEPENDENCY in self.container.registry.active_hooks:
+            handled = self.container.registry.hooks[Hook.HANDLE_UNSUPPORTED_DEPENDENCY].handle_sync(self.container, dependency, context, dependency=dependency)
+        else:
+            handled = Optional.Nothing()
 
-        match await self.container.registry.hooks[Hook.CREATE_INSTANCE].handle(self.container, dependency, context):
+        match handled:
             case Optional.Some(v):
-                instance = v
-                disable_implicit_caching = True  # Hook should handle caching
+                return v
 
             case Optional.Nothing():
-                match self._find_factory_for_type(dependency):
-                    case Optional.Some(factory):
-                        # Call factory - await only if factory is a coroutine function
-                        if inspect.iscoroutinefunction(factory):
-                            instance = await factory(self.container)
-                        else:
-                            instance = factory(self.container)
-
-                    case Optional.Nothing():
-                        instance = await self._handle_unsupported_dependency(dependency, context)
-                        disable_implicit_caching = True  # If no error raised, hook should handle caching
-
-                    case _:
-                        raise RuntimeError(f"Impossible state reached.")
+                self._remember_missing(unresolvable=True)
+                raise self._unsupported_dependency_error(dependency, context)
 
             case _:
                 raise ValueError(
                     f"Invalid value returned from hook for dependency: {dependency}, must be an Optional type."
                 )
 
-        filtered_instance = await self.container.registry.hooks[Hook.CREATED_INSTANCE].filter(self.container, instance, context)
-        return filtered_instance, disable_implicit_caching
-
     async def _handle_unsupported_dependency(self, dependency: t.Type, context: dict[str, Any]) -> Any:
         """Handle a dependency that has no factory or existing instance.
 
         Uses async hooks natively for truly async fallback resolution.
         Delegates to hooks or raises DependencyResolutionError.
         """
-        match await self.container.registry.hooks[Hook.HANDLE_UNSUPPORTED_DEPENDENCY].handle(self.container, dependency, context):
+        if Hook.HANDLE_UNSUPPORTED_DEPENDENCY in self.container.registry.active_hooks:
+            hook_manager = self.container.registry.hooks[Hook.HANDLE_UNSUPPORTED_DEPENDENCY]
+            if hook_manager.has_async:
+                handled = await hook_manager.handle(self.container, dependency, context, dependency=dependency)
+            else:
+                handled = hook_manager.handle_sync(self.container, dependency, context, dependency=dependency)
+        else:
+            handled = Optional.Nothing()
+
+        match handled:
             case Optional.Some(v):
                 return v
 
             case Optional.Nothing():
-                from bevy.injection_types import DependencyResolutionError
-
-                parameter_name = "unknown"
-                if "injection_context" in context:
-                    parameter_name = context["injection_context"].parameter_name
-
-                raise DependencyResolutionError(
-                    dependency_type=dependency,
-                    parameter_name=parameter_name,
-                    message=f"No handler found that can handle dependency: {dependency!r}"
-                )
+                self._remember_missing(unresolvable=True)
+                raise self._unsupported_dependency_error(dependency, context)
 
             case _:
                 raise ValueError(
                     f"Invalid value returned from hook for dependency: {dependency}, must be an Optional type."
                 )
 
-    def get(self) -> T:
-        """Fetches the value from the container assuming a sync context, utilizing an event loop in a thread to await the result."""
-        def run():
-            return asyncio.run(self.get_async())
+    def _unsupported_dependency_error(self, dependency: t.Type, context: dict[str, Any]) -> "DependencyResolutionError":
+        from bevy.injection_types import DependencyResolutionError
+
+        parameter_name = self.kwargs.get("parameter_name", "unknown")
+        if "injection_context" in context:
+            parameter_name = context["injection_context"].parameter_name
+
+        return DependencyResolutionError(
+            dependency_type=dependency,
+            parameter_name=parameter_name,
+            message=f"No handler found that can handle dependency: {dependency!r}"
+        )
+
+    def _unresolved_qualifier_error(self, qualifier: str) -> "DependencyResolutionError":
+        from bevy.injection_types import DependencyResolutionError
 
-        # Capture context variables
-        ctx = contextvars.copy_context()
+        return DependencyResolutionError(
+            dependency_type=self.dependency,
+            parameter_name="unknown",
+            message=f"Cannot resolve qualified dependency {self.dependency.__name__} with qualifier '{qualifier}'"
+        )
 
-        # Run in thread with context
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(ctx.run, run)
-            try:
-                return future.result(timeout=30)
-            except concurrent.futures.TimeoutError:
-                raise TimeoutError(f"Dependency resolution timed out after 30 seconds")
+    def get(self) -> T:
+        """Fetches the value from the container in a sync context.
+
+        Resolution runs inline on the calling thread with the same semantics as get_async(). An event loop is only
+        used when an async factory or an async hook is reached.
+        """
+        if not tracing.enabled and not spans.enabled and not self.container.registry.collect_metrics:
+            return self._get()
+
+        self._source = "cache"
+        span = self._start_span("resolve", self.dependency) if spans.enabled else None
+        started = perf_counter_ns()
+        try:
+            instance = self._get()
+        except BaseException as exception:
+            self._trace(started, "error", span, exception)
+            raise
+
+        self._trace(started, self._source, span)
+        return instance
 
     async def get_async(self) -> T:
         """Fetches the value from the container in an async context."""
+        if not tracing.enabled and not spans.enabled and not self.container.registry.collect_metrics:
+            return await self._get_async()
+
+        self._source = "cache"
+        span = self._start_span("resolve", self.dependency) if spans.enabled else None
+        started = perf_counter_ns()
+        try:
+            instance = await self._get_async()
+        except BaseException as exception:
+            self._trace(started, "error", span, exception)
+            raise
+
+        self._trace(started, self._source, span)
+        return instance
+
+    def _start_span(self, kind: str, dependency: t.Any, **attributes) -> "spans.Span":
+        qualifier = self.kwargs.get("qualifier")
+        if qualifier:
+            attributes["qualifier"] = qualifier
+
+        return spans.start(kind, spans.describe(dependency), container_id=id(self.container), **attributes)
+
+    def _trace(
+        self, started: int, source: str, span: "spans.Span | None" = None, exception: BaseException | None = None
+    ):
+        if span is not None:
+            span.attributes["source"] = source
+            if exception is not None:
+                spans.fail(span, exception)
+
+            spans.finish(span)
+
+        if self.container.registry.collect_metrics:
+            self.container._record_resolution(self.dependency, self.kwargs.get("qualifier"), source)
+
+        if tracing.enabled:
+            tracing.emit(
+                tracing.TraceEvent(
+                    kind="resolve",
+                    dependency=self.dependency,
+                    source=source,
+                    container_id=id(self.container),
+                    qualifier=self.kwargs.get("qualifier"),
+                    duration_ns=perf_counter_ns() - started,
+                )
+            )
+
+    def _get(self) -> T:
+        disable_implicit_caching = False
+        default_factory = self.kwargs.get("default_factory", None)
+        cache_factory_result = self.kwargs.get("cache_factory_result", True)
+        qualifier = self.kwargs.get("qualifier", None)
+        context: dict[str, Any] = self.kwargs.get("context", {})
+
+        # Handle qualified dependencies first
+        if qualifier:
+            qualified_key = (self.dependency, qualifier)
+
+            # Check current container for qualified instance
+            if qualified_key in self.container._qualified_instances:
+                return self.container._qualified_instances[qualified_key]
+
+            # Check parent container for qualified instance
+            if self.container.parent:
+                try:
+                    parent_kwargs = {"qualifier": qualifier}
+                    if default_factory:
+                        parent_kwargs["default_factory"] = default_factory
+                    instance = self.container.parent.find(self.dependency, **parent_kwargs).get()
+                    self._source = "parent"
+                    return instance
+                except Exception:  # DependencyResolutionError
+                    pass
+
+            # If we have a default_factory for qualified dependency, use it
+            if default_factory:
+                if cache_factory_result and default_factory in self.container._factory_results:
+                    return self.container._factory_results[default_factory]
+
+                instance = self._call_factory_sync(default_factory)
+
+                if cache_factory_result:
+                    self.container._cache_factory_result(default_factory, instance)
+                    self.container._cache_qualified_instance(qualified_key, instance)
+
+                self._source = "factory"
+                return instance
+            elif "default" in self.kwargs:
+                self._source = "default"
+                return self.kwargs["default"]
+            else:
+                raise self._unresolved_qualifier_error(qualifier)
+
+        # Handle unqualified dependencies - prioritize default_factory when specified
+        if default_factory:
+            if cache_factory_result and default_factory in self.container._factory_results:
+                return self.container._factory_results[default_factory]
+
+            if cache_factory_result and self.container.parent:
+                if parent_result := self._get_factory_cache_result(default_factory):
+                    self.container._cache_factory_result(default_factory, parent_result)
+                    self._source = "parent"
+                    return parent_result
+
+            instance = self._call_factory_sync(default_factory)
+
+            if cache_factory_result:
+                self.container._cache_factory_result(default_factory, instance)
+
+            self._source = "factory"
+            return instance
+
+        # No default factory, use normal resolution
+        # Types already known to be missing skip the stored instance lookups and go straight to the default or to
+        # creating an instance. GET_INSTANCE hooks always run, they can return instances the container doesn't store.
+        # The container's lookups version when its stored instances were checked, see _remember_missing
+        self._lookups_version = self.container._lookups_version
+        known_missing = self._known_missing()
+        if Hook.GET_INSTANCE in self.container.registry.active_hooks:
+            lookup = self.container.registry.hooks[Hook.GET_INSTANCE].handle_sync(self.container, self.dependency, context, dependency=self.dependency)
+        else:
+            lookup = Optional.Nothing()
+
+        match lookup:
+            case Optional.Some(v):
+                instance = v
+                disable_implicit_caching = True  # Hook should handle caching
+                self._source = "hook"
+
+            case Optional.Nothing():
+                if known_missing is None and (dep := self._get_existing_instance(self.dependency)):
+                    instance = dep.value
+                    disable_implicit_caching = True  # Already stored by the container
+                else:
+                    dep = None
+                    lookup_hooks_registered = self._lookup_hooks_registered()
+                    if (known_missing is None or lookup_hooks_registered) and self.container.parent:
+                        # Only check parent for the dependency type, not for factory creation
+                        # This ensures sibling container isolation for factory results
+                        if lookup_hooks_registered:
+                            dep = self.container.parent.find(self.dependency, default=None, type_matching=self._type_matching).get()
+                        else:
+                            dep = self.container._find_in_parents(self.dependency, self._type_matching)
+
+                        self._source = "parent"
+
+                    if dep is None:
+                        if known_missing is None:
+                            self._remember_missing()
+
+                        if "default" in self.kwargs:
+                            dep = self.kwargs["default"]
+                            disable_implicit_caching = True
+                            self._source = "default"
+                        elif known_missing:
+                            raise self._unsupported_dependency_error(self.dependency, context)
+                        else:
+                            with self.container._creating(self.dependency):
+                                dep, disable_implicit_caching = self._create_instance_sync(self.dependency, context)
+
+                    instance = dep
+
+            case _:
+                raise ValueError(f"Invalid value for dependency: {self.dependency}, must be an Optional type.")
+
+        if Hook.GOT_INSTANCE in self.container.registry.active_hooks:
+            instance = self.container.registry.hooks[Hook.GOT_INSTANCE].filter_sync(self.container, instance, context, dependency=self.dependency)
+
+        if not disable_implicit_caching:
+            self.container._cache_instance(self.dependency, instance)
+
+        return instance
+
+    async def _get_async(self) -> T:
         disable_implicit_caching = False
         default_factory = self.kwargs.get("default_factory", None)
         cache_factory_result = self.kwargs.get("cache_factory_result", True)
@@ -228,8 +603,8 @@ class Result[T]:
             qualified_key = (self.dependency, qualifier)
 
             # Check current container for qualified instance
-            if qualified_key in self.container.instances:
-                return self.container.instances[qualified_key]
+            if qualified_key in self.container._qualified_instances:
+                return self.container._qualified_instances[qualified_key]
 
             # Check parent container for qualified instance
             if self.container.parent:
@@ -237,46 +612,47 @@ class Result[T]:
                     parent_kwargs = {"qualifier": qualifier}
                     if default_factory:
                         parent_kwargs["default_factory"] = default_factory
-                    return await self.container.parent.find(self.dependency, **parent_kwargs).get_async()
+                    instance = await self.container.parent.find(self.dependency, **parent_kwargs).get_async()
+                    self._source = "parent"
+                    return instance
                 except Exception:  # DependencyResolutionError
                     pass
 
             # If we have a default_factory for qualified dependency, use it
             if default_factory:
                 # Check factory cache first (qualified factories use same cache as unqualified)
-                if cache_factory_result and default_factory in self.container.instances:
-                    return self.container.instances[default_factory]
+                if cache_factory_result and default_factory in self.container._factory_results:
+                    return self.container._factory_results[default_factory]
 
                 # Call factory (handles sync and async factories)
                 instance = await self._call_factory(default_factory)
 
                 # Cache using both the factory key and qualified key (if caching enabled)
                 if cache_factory_result:
-                    self.container.instances[default_factory] = instance
-                    self.container.instances[qualified_key] = instance
+                    self.container._cache_factory_result(default_factory, instance)
+                    self.container._cache_qualified_instance(qualified_key, instance)
+
+                self._source = "factory"
                 return instance
             elif "default" in self.kwargs:
+                self._source = "default"
                 return self.kwargs["default"]
             else:
-                from bevy.injection_types import DependencyResolutionError
-                raise DependencyResolutionError(
-                    dependency_type=self.dependency,
-                    parameter_name="unknown",
-                    message=f"Cannot resolve qualified dependency {self.dependency.__name__} with qualifier '{qualifier}'"
-                )
+                raise self._unresolved_qualifier_error(qualifier)
 
         # Handle unqualified dependencies - prioritize default_factory when specified
         if default_factory:
             # Default factory takes precedence over existing instances
             # Check if we already have a cached result from that factory (if caching enabled)
-            if cache_factory_result and default_factory in self.container.instances:
-                return self.container.instances[default_factory]
+            if cache_factory_result and default_factory in self.container._factory_results:
+                return self.container._factory_results[default_factory]
 
             # Check parent container's factory cache (if caching enabled)
             if cache_factory_result and self.container.parent:
                 if parent_result := self._get_factory_cache_result(default_factory):
                     # Cache in this container too for faster future access
-                    self.container.instances[default_factory] = parent_result
+                    self.container._cache_factory_result(default_factory, parent_result)
+                    self._source = "parent"
                     return parent_result
 
             # Call factory (handles sync and async factories)
@@ -284,39 +660,76 @@ class Result[T]:
 
             # Cache using the factory as the key (if caching enabled)
             if cache_factory_result:
-                self.container.instances[default_factory] = instance
+                self.container._cache_factory_result(default_factory, instance)
+
+            self._source = "factory"
             return instance
 
         # No default factory, use normal resolution with async hooks
-        match await self.container.registry.hooks[Hook.GET_INSTANCE].handle(self.container, self.dependency, context):
+        # Types already known to be missing skip the stored instance lookups and go straight to the default or to
+        # creating an instance. GET_INSTANCE hooks always run, they can return instances the container doesn't store.
+        # The container's lookups version when its stored instances were checked, see _remember_missing
+        self._lookups_version = self.container._lookups_version
+        known_missing = self._known_missing()
+        if Hook.GET_INSTANCE in self.container.registry.active_hooks:
+            hook_manager = self.container.registry.hooks[Hook.GET_INSTANCE]
+            if hook_manager.has_async:
+                lookup = await hook_manager.handle(self.container, self.dependency, context, dependency=self.dependency)
+            else:
+                lookup = hook_manager.handle_sync(self.container, self.dependency, context, dependency=self.dependency)
+        else:
+            lookup = Optional.Nothing()
+
+        match lookup:
             case Optional.Some(v):
                 instance = v
                 disable_implicit_caching = True  # Hook should handle caching
+                self._source = "hook"
 
             case Optional.Nothing():
-                if dep := self._get_existing_instance(self.dependency):
+                if known_missing is None and (dep := self._get_existing_instance(self.dependency)):
                     instance = dep.value
+                    disable_implicit_caching = True  # Already stored by the container
                 else:
                     dep = None
-                    if self.container.parent:
+                    lookup_hooks_registered = self._lookup_hooks_registered()
+                    if (known_missing is None or lookup_hooks_registered) and self.container.parent:
                         # Only check parent for the dependency type, not for factory creation
                         # This ensures sibling container isolation for factory results
-                        dep = await self.container.parent.find(self.dependency, default=None).get_async()
+                        if lookup_hooks_registered:
+                            dep = await self.container.parent.find(self.dependency, default=None, type_matching=self._type_matching).get_async()
+                        else:
+                            dep = self.container._find_in_parents(self.dependency, self._type_matching)
+
+                        self._source = "parent"
 
                     if dep is None:
+                        if known_missing is None:
+                            self._remember_missing()
+
                         if "default" in self.kwargs:
                             dep = self.kwargs["default"]
                             disable_implicit_caching = True
+                            self._source = "default"
+                        elif known_missing:
+                            raise self._unsupported_dependency_error(self.dependency, context)
                         else:
-                            dep, disable_implicit_caching = await self._create_instance(self.dependency, context)
+                            with self.container._creating(self.dependency):
+                                dep, disable_implicit_caching = await self._create_instance(self.dependency, context)
 
                     instance = dep
 
             case _:
                 raise ValueError(f"Invalid value for dependency: {self.dependency}, must be an Optional type.")
 
-        instance = await self.container.registry.hooks[Hook.GOT_INSTANCE].filter(self.container, instance, context)
+        if Hook.GOT_INSTANCE in self.container.registry.active_hooks:
+            hook_manager = self.container.registry.hooks[Hook.GOT_INSTANCE]
+            if hook_manager.has_async:
+                instance = await hook_manager.filter(self.container, instance, context, dependency=self.dependency)
+            else:
+                instance = hook_manager.filter_sync(self.container, instance, context, dependency=self.dependency)
+
         if not disable_implicit_caching:
-            self.container.instances[self.dependency] = instance
+            self.container._cache_instance(self.dependency, instance)
 
         return instance
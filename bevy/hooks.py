@@ -5,11 +5,14 @@ import functools
 import inspect
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Optional as OptionalType, TYPE_CHECKING
+from typing import Any, Callable, Optional as OptionalType, overload, TYPE_CHECKING
 
 from tramp.optionals import Optional
 
 import bevy.registries as r
+import bevy.spans as spans
+from bevy.async_bridge import run_coroutine_sync
+from bevy.injection_types import InjectionChain
 
 if TYPE_CHECKING:
     from bevy.containers import Container
@@ -18,45 +21,90 @@ if TYPE_CHECKING:
 type HookFunction[T] = "Callable[[Container, Type[T], dict[str, Any], T]"
 
 
-def _call_hook_with_appropriate_signature(hook_func: Callable, container: "Container", value: Any, context: dict[str, Any], _from_wrapper: bool = False) -> Any:
-    """Call a sync hook function with the appropriate number of parameters based on its signature.
+class _HookCallback:
+    """A hook callback that has been classified once so that calling it is a plain function call.
 
-    Supports both legacy 2-parameter hooks (container, value) and new 3-parameter hooks
-    (container, value, context) for backwards compatibility.
+    Supports both legacy 2-parameter hooks (container, value) and 3-parameter hooks (container, value, context). When
+    the signature cannot be inspected the callback is assumed to take the context. Calling an async callback returns
+    the coroutine, it is up to the caller to await it or run it on an event loop.
 
-    NOTE: This function only handles SYNC hooks. Async hooks are handled by HookManager._call_hook_async().
+    Callbacks with a higher priority are called first. When for_types is set the callback is only called for
+    dependencies that are one of the types or a subclass of one of them.
     """
-    # If this is a HookWrapper and we're not being called from the wrapper itself
-    if isinstance(hook_func, HookWrapper) and not _from_wrapper:
-        # Let the wrapper handle the call
-        return hook_func(container, value, context)
+    __slots__ = ("func", "is_async", "call", "priority", "for_types")
 
-    # Get the actual function for signature inspection
-    func = hook_func.func if hasattr(hook_func, 'func') else hook_func
+    def __init__(self, func: Callable, *, priority: int = 0, for_types: tuple[type, ...] | None = None):
+        # Avoid circular import
+        from bevy.async_hooks import is_async_hook
 
-    # Get function signature for sync hooks
+        self.func = func
+        self.is_async = is_async_hook(func)
+        self.call = func if self._takes_context(func) else lambda container, value, context: func(container, value)
+        self.priority = priority
+        self.for_types = tuple(for_types) if for_types is not None else None
+
+    def applies_to(self, dependency: Any) -> bool:
+        """Whether the callback should be called when the dependency is being resolved. Callbacks without a type filter
+        apply to everything, callbacks with a filter never apply when the dependency isn't known (None)."""
+        if self.for_types is None:
+            return True
+
+        if not isinstance(dependency, type):
+            return False
+
+        try:
+            return issubclass(dependency, self.for_types)
+        except TypeError:
+            return False
+
+    @staticmethod
+    def _takes_context(func: Callable) -> bool:
+        try:
+            sig = inspect.signature(func.func if hasattr(func, "func") else func)
+        except (ValueError, TypeError):
+            return True
+
+        return len(sig.parameters) >= 3
+
+
+async def _call_in_span(
+    callback: _HookCallback, container: "Container", value: Any, context: dict[str, Any], dependency: Any
+) -> Any:
+    span = spans.start("hook", spans.describe(callback.func), dependency=spans.describe(dependency))
     try:
-        sig = inspect.signature(func)
-    except (ValueError, TypeError):
-        # If we can't inspect, assume new style with context
-        return func(container, value, context)
-    else:
-        params = list(sig.parameters.keys())
-
-        # Check if the function expects 3 parameters (container, value, context)
-        # or 2 parameters (container, value) for backwards compatibility
-        if len(params) >= 3:
-            # New style with context
-            return func(container, value, context)
-        else:
-            # Legacy style without context
-            return func(container, value)
+        result = callback.call(container, value, context)
+        if callback.is_async:
+            result = await result
+
+        return result
+    except BaseException as exception:
+        spans.fail(span, exception)
+        raise
+    finally:
+        spans.finish(span)
+
+
+def _call_in_span_sync(
+    callback: _HookCallback, container: "Container", value: Any, context: dict[str, Any], dependency: Any
+) -> Any:
+    span = spans.start("hook", spans.describe(callback.func), dependency=spans.describe(dependency))
+    try:
+        result = callback.call(container, value, context)
+        if callback.is_async:
+            result = run_coroutine_sync(result, container.resolution_timeout)
 
+        return result
+    except BaseException as exception:
+        spans.fail(span, exception)
+        raise
+    finally:
+        spans.finish(span)
 
 
-@dataclass
+@dataclass(slots=True)
 class InjectionContext:
-    """Rich context information provided to injection hooks."""
+    """Rich context information provided to injection hooks. It is only created when a hook that receives it has a
+    callback. The injection chain is immutable and shared by every context created for the same call."""
     function_name: str
     parameter_name: str
     requested_type: type
@@ -65,24 +113,29 @@ class InjectionContext:
     type_matching: "TypeMatchingStrategy"
     strict_mode: bool
     debug_mode: bool
-    injection_chain: list[str]  # Stack of function calls leading to this injection
+    injection_chain: InjectionChain  # Stack of function calls leading to this injection
     parameter_default: Optional[Any]  # Optional.Some(value) if default set, Optional.Nothing() if unset
     
     def __post_init__(self):
-        """Ensure injection_chain is a list."""
+        """Ensure injection_chain is an InjectionChain."""
         if self.injection_chain is None:
-            self.injection_chain = []
+            self.injection_chain = InjectionChain()
+        elif not isinstance(self.injection_chain, InjectionChain):
+            self.injection_chain = InjectionChain.from_names(self.injection_chain)
 
 
 @dataclass  
 class PostInjectionContext:
-    """Context for post-injection hooks after function call completion."""
+    """Context for post-injection hooks after function call completion. Times are measured with
+    time.perf_counter_ns, execution_time_ms only covers the call and injection_time_ms only covers resolving the
+    injected parameters."""
     function_name: str
     injected_params: dict[str, Any]  # Map of parameter names to injected values
     result: Any
     injection_strategy: "InjectionStrategy"
     debug_mode: bool
     execution_time_ms: float
+    injection_time_ms: float = 0.0
 
 
 class Hook(Enum):
@@ -103,35 +156,91 @@ class Hook(Enum):
 class HookManager:
     """Manages hook callbacks for dependency resolution lifecycle events.
 
-    This class uses an async-native architecture where all hooks are executed asynchronously.
-    Hooks can be either sync or async functions - sync hooks are called directly while async
-    hooks are properly awaited.
+    Hooks can be either sync or async functions. The async methods await async hooks, the sync methods run them on an
+    event loop. Resolution only uses the async methods when has_async is set, so registries with nothing but sync
+    hooks never create coroutines or touch asyncio while dispatching hooks.
+
+    Callbacks are called in order of priority, highest first, and in the order they were added when priorities are
+    equal. Callbacks registered for specific types are only called when one of those types (or a subclass) is being
+    resolved. The callbacks that apply to a dependency are looked up once and kept in a dispatch table.
+
+    The on_change listener is called whenever a callback is added, registries use it to keep their active_hooks and
+    version current no matter how the callback was added.
 
     Methods:
         handle(): Returns the first Some result from any callback, or Nothing if all return Nothing
         filter(): Applies all callbacks in sequence, updating the value when a callback returns Some
     """
-    def __init__(self):
+    def __init__(self, on_change: Callable[[], None] | None = None):
         self.callbacks = set()
+        self._ordered: list[_HookCallback] = []
+        self._dispatch: dict[Any, tuple[_HookCallback, ...]] = {}
+        self._on_change = on_change
+        self.has_async = False
 
-    def add_callback(self, hook: HookFunction):
-        """Adds a function that will be called when the hook is triggered."""
-        self.callbacks.add(hook)
+    def add_callback(
+        self, hook: HookFunction, *, priority: int = 0, for_types: tuple[type, ...] | None = None
+    ):
+        """Adds a function that will be called when the hook is triggered. The callback is classified (sync or async,
+        whether it takes the context) once here rather than every time the hook is triggered.
+
+        Args:
+            hook: The callback, a HookWrapper uses its own priority and type filter
+            priority: Callbacks with a higher priority are called first
+            for_types: Only call the callback when one of these types, or a subclass, is being resolved
+        """
+        if hook in self.callbacks:
+            return
 
-    async def handle[T](self, container: "Container", value: T, context: dict[str, Any] | None = None) -> Optional[Any]:
+        self.callbacks.add(hook)
+        if isinstance(hook, HookWrapper):
+            callback = hook.callback
+        else:
+            callback = _HookCallback(hook, priority=priority, for_types=for_types)
+
+        self.has_async = self.has_async or callback.is_async
+        # Sorting is stable so callbacks with the same priority keep the order they were added in
+        self._ordered = sorted([*self._ordered, callback], key=lambda c: -c.priority)
+        self._dispatch = {}
+        if self._on_change:
+            self._on_change()
+
+    def callbacks_for(self, dependency: Any) -> tuple[_HookCallback, ...]:
+        """Returns the callbacks that apply to the dependency in the order they should be called."""
+        try:
+            return self._dispatch[dependency]
+        except KeyError:
+            callbacks = self._dispatch[dependency] = self._match_callbacks(dependency)
+            return callbacks
+        except TypeError:  # Unhashable dependency
+            return self._match_callbacks(dependency)
+
+    def _match_callbacks(self, dependency: Any) -> tuple[_HookCallback, ...]:
+        return tuple(callback for callback in self._ordered if callback.applies_to(dependency))
+
+    async def handle[T](
+        self, container: "Container", value: T, context: dict[str, Any] | None = None, *, dependency: Any = None
+    ) -> Optional[Any]:
         """Iterates each callback and returns the first Some result, or Nothing if all return Nothing.
 
         Args:
             container: The container instance
             value: The value to pass to callbacks
             context: Optional context dictionary
+            dependency: The dependency being resolved, used to pick the callbacks registered for its type
 
         Returns:
             Optional.Some(result) from first callback that returns Some, or Optional.Nothing()
         """
         ctx = context or {}
-        for callback in self.callbacks:
-            result = await self._call_hook_async(callback, container, value, ctx)
+        for callback in self.callbacks_for(dependency):
+            if spans.enabled:
+                result = await _call_in_span(callback, container, value, ctx, dependency)
+            else:
+                result = callback.call(container, value, ctx)
+                if callback.is_async:
+                    result = await result
+
             match result:
                 case Optional.Some(_):
                     return result
@@ -139,20 +248,29 @@ class HookManager:
                     continue
         return Optional.Nothing()
 
-    async def filter[T](self, container: "Container", value: T, context: dict[str, Any] | None = None) -> T:
+    async def filter[T](
+        self, container: "Container", value: T, context: dict[str, Any] | None = None, *, dependency: Any = None
+    ) -> T:
         """Iterates all callbacks and updates the value when a callback returns Some.
 
         Args:
             container: The container instance
             value: The initial value
             context: Optional context dictionary
+            dependency: The dependency being resolved, used to pick the callbacks registered for its type
 
         Returns:
             The final value after applying all callback transformations
         """
         ctx = context or {}
-        for callback in self.callbacks:
-            result = await self._call_hook_async(callback, container, value, ctx)
+        for callback in self.callbacks_for(dependency):
+            if spans.enabled:
+                result = await _call_in_span(callback, container, value, ctx, dependency)
+            else:
+                result = callback.call(container, value, ctx)
+                if callback.is_async:
+                    result = await result
+
             match result:
                 case Optional.Some(v):
                     value = v
@@ -160,44 +278,84 @@ class HookManager:
                     pass
         return value
 
-    async def _call_hook_async(self, hook_func: Callable, container: "Container", value: Any, context: dict[str, Any]) -> Optional[Any]:
-        """Call a hook function (sync or async) and return result."""
-        # Avoid circular import
-        from bevy.async_hooks import is_async_hook
+    def handle_sync[T](
+        self, container: "Container", value: T, context: dict[str, Any] | None = None, *, dependency: Any = None
+    ) -> Optional[Any]:
+        """Sync version of handle() used by the sync resolution engine. Sync callbacks are called inline, async
+        callbacks are run to completion on an event loop.
 
-        # Handle HookWrapper
-        if isinstance(hook_func, HookWrapper):
-            actual_func = hook_func.func
-        else:
-            actual_func = hook_func
-
-        # Check if async
-        if is_async_hook(actual_func):
-            # Call async hook
-            sig = inspect.signature(actual_func)
-            params = list(sig.parameters.keys())
-            if len(params) >= 3:
-                return await actual_func(container, value, context)
+        Args:
+            container: The container instance
+            value: The value to pass to callbacks
+            context: Optional context dictionary
+            dependency: The dependency being resolved, used to pick the callbacks registered for its type
+
+        Returns:
+            Optional.Some(result) from first callback that returns Some, or Optional.Nothing()
+        """
+        ctx = context or {}
+        for callback in self.callbacks_for(dependency):
+            if spans.enabled:
+                result = _call_in_span_sync(callback, container, value, ctx, dependency)
             else:
-                return await actual_func(container, value)
-        else:
-            # Call sync hook
-            return _call_hook_with_appropriate_signature(hook_func, container, value, context)
+                result = callback.call(container, value, ctx)
+                if callback.is_async:
+                    result = run_coroutine_sync(result, container.resolution_timeout)
+
+            match result:
+                case Optional.Some(_):
+                    return result
+                case Optional.Nothing():
+                    continue
+        return Optional.Nothing()
+
+    def filter_sync[T](
+        self, container: "Container", value: T, context: dict[str, Any] | None = None, *, dependency: Any = None
+    ) -> T:
+        """Sync version of filter() used by the sync resolution engine. Sync callbacks are called inline, async
+        callbacks are run to completion on an event loop.
+
+        Args:
+            container: The container instance
+            value: The initial value
+            context: Optional context dictionary
+            dependency: The dependency being resolved, used to pick the callbacks registered for its type
+
+        Returns:
+            The final value after applying all callback transformations
+        """
+        ctx = context or {}
+        for callback in self.callbacks_for(dependency):
+            if spans.enabled:
+                result = _call_in_span_sync(callback, container, value, ctx, dependency)
+            else:
+                result = callback.call(container, value, ctx)
+                if callback.is_async:
+                    result = run_coroutine_sync(result, container.resolution_timeout)
+
+            match result:
+                case Optional.Some(v):
+                    value = v
+                case Optional.Nothing():
+                    pass
+        return value
 
 
 class HookWrapper[**P, R]:
     """Wraps a hook callback function to make it easier to register with a registry."""
     __match_args__ = ("hook_type",)
 
-    def __init__(self, hook_type: Hook, func: Callable[P, R]):
+    def __init__(
+        self, hook_type: Hook, func: Callable[P, R], *, priority: int = 0, for_types: tuple[type, ...] | None = None
+    ):
         self.hook_type = hook_type
         self.func = func
 
         functools.update_wrapper(self, func)
+        self.callback = _HookCallback(func, priority=priority, for_types=for_types)
 
     def __call__(self, container: "Container", value: P, context=None) -> Optional[R]:
-        # Use the shared helper to call with appropriate signature, marking we're from wrapper
-        return _call_hook_with_appropriate_signature(self.func, container, value, context or {}, _from_wrapper=True)
+        return self.callback.call(container, value, context or {})
 
     def register_hook(self, registry: "r.Registry | None" = None):
         """Adds the callback to a registry for the hook type."""
@@ -232,6 +390,12 @@ class HookDecorator[**P, R]:
         @hooks.GET_INSTANCE
         def foobar(container: Container, some_thing: Thing) -> Thing:
             ...
+
+    The decorators can also be called with a priority and the types the hook should be called for:
+
+        @hooks.CREATE_INSTANCE(priority=10, for_types=(Database,))
+        def create_database(container: Container, dependency: type[Database], context: dict) -> Optional[Database]:
+            ...
     """
     GET_INSTANCE = _HookDecoratorDescriptor()
     GOT_INSTANCE = _HookDecoratorDescriptor()
@@ -249,8 +413,21 @@ class HookDecorator[**P, R]:
     def __init__(self, hook_type: Hook):
         self.hook_type = hook_type
 
+    @overload
     def __call__(self, func: Callable[P, R]) -> HookWrapper[P, R]:
-        return HookWrapper(self.hook_type, func)
+        ...
+
+    @overload
+    def __call__(
+        self, *, priority: int = 0, for_types: tuple[type, ...] | None = None
+    ) -> Callable[[Callable[P, R]], HookWrapper[P, R]]:
+        ...
+
+    def __call__(self, func=None, *, priority: int = 0, for_types: tuple[type, ...] | None = None):
+        if func is None:
+            return functools.partial(HookWrapper, self.hook_type, priority=priority, for_types=for_types)
+
+        return HookWrapper(self.hook_type, func, priority=priority, for_types=for_types)
 
     def __repr__(self):
         return f"HookDecorator({self.hook_type})"
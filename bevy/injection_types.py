@@ -22,6 +22,8 @@ Example:
     ... ):
     ...     pass
 """
+import threading
+from collections.abc import Hashable, Iterable, Iterator, Sequence
 from enum import Enum
 from types import UnionType
 from typing import Annotated, Callable, get_args, get_origin, Optional, Union
@@ -43,6 +45,178 @@ class DependencyResolutionError(Exception):
         super().__init__(message)
 
 
+class CircularDependencyError(DependencyResolutionError):
+    """Raised when creating a dependency requires creating that same dependency, for example when the factory for A
+    injects B and the factory for B injects A."""
+
+
+class _CreatingNode:
+    """A dependency that is being created, linked to the dependency that was being created when it was pushed.
+
+    Nodes pushed one inside another share a _CreatingPath, a single set of every dependency on the path from the
+    outermost node to the innermost, so checking for a circular dependency is one set lookup however deep the
+    resolution goes and pushing a node never copies the nodes before it.
+    """
+    __slots__ = ("dependency", "parent", "path")
+
+    def __init__(self, dependency: Hashable, parent: "_CreatingNode | None"):
+        self.dependency = dependency
+        self.parent = parent
+        if parent is None or not parent.path.extend(parent, self):
+            self.path = _CreatingPath(self)
+        else:
+            self.path = parent.path
+
+    def __iter__(self) -> Iterator["_CreatingNode"]:
+        node = self
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def contains(self, dependency: Hashable) -> bool:
+        return self.path.contains(self, dependency)
+
+    def release(self):
+        self.path.release(self)
+
+
+class _CreatingPath:
+    """The dependencies of the innermost node (top) and every node it was pushed inside of. Nodes are added when they
+    are pushed onto the top and removed when they're released, so the set always matches the path to the top.
+
+    When a node is pushed from a node that isn't the top, a sibling being created concurrently by another task, it
+    starts a new path with a copy of its own path. Lookups from nodes that aren't the top walk the nodes instead of
+    trusting the set.
+
+    Paths are only changed and trusted by the thread that started them, so they need no lock. Chains are shared with
+    other threads when a context is copied into them, for example by asyncio.to_thread in a factory or when deep
+    resolution continues on a new thread. Those threads start their own paths when they push and walk the nodes when
+    they look up nodes from another thread's path. Tasks on the same thread can't interleave inside these methods.
+    """
+    __slots__ = ("members", "top", "thread")
+
+    def __init__(self, top: _CreatingNode):
+        self.members = {node.dependency for node in top}
+        self.top: _CreatingNode | None = top
+        self.thread = threading.get_ident()
+
+    def extend(self, parent: _CreatingNode, node: _CreatingNode) -> bool:
+        if self.top is not parent or self.thread != threading.get_ident() or node.dependency in self.members:
+            return False
+
+        self.members.add(node.dependency)
+        self.top = node
+        return True
+
+    def contains(self, node: _CreatingNode, dependency: Hashable) -> bool:
+        if self.top is node and self.thread == threading.get_ident():
+            return dependency in self.members
+
+        return any(ancestor.dependency == dependency for ancestor in node)
+
+    def release(self, node: _CreatingNode):
+        if self.thread != threading.get_ident():
+            return  # Only ever pushed onto by the thread that started it, so nothing of this node's is in the set
+
+        if self.top is node:
+            self.members.discard(node.dependency)
+            self.top = node.parent
+        else:  # Released out of order, the set no longer matches any node's path
+            self.top = None
+
+
+class InjectionChain(Sequence[str]):
+    """An immutable linked stack of the names of the functions being injected, outermost first.
+
+    Pushing a name is O(1) and shares the rest of the chain with every other chain pushed from the same point, so
+    nested injection never copies the chain. The names are only materialized as a tuple when the chain is read as a
+    sequence. The chain also carries the dependencies that are currently being created, as a linked stack with a
+    shared set (see _CreatingNode), so marking a dependency as being created is O(1) and a circular dependency is found
+    with a single set lookup.
+    """
+    __slots__ = ("_name", "_parent", "_depth", "_creating", "_names")
+
+    def __init__(
+        self,
+        name: str | None = None,
+        parent: "InjectionChain | None" = None,
+        creating: _CreatingNode | None = None,
+    ):
+        self._name = name
+        self._parent = parent
+        self._depth = 0 if name is None else (parent._depth if parent else 0) + 1
+        self._creating = creating
+        self._names: tuple[str, ...] | None = None
+
+    @classmethod
+    def from_names(cls, names: Iterable[str]) -> "InjectionChain":
+        chain = cls()
+        for name in names:
+            chain = chain.push(name)
+
+        return chain
+
+    def push(self, name: str) -> "InjectionChain":
+        """Returns a new chain with the name added to the end."""
+        return InjectionChain(name, self, self._creating)
+
+    def creating(self, dependency: Hashable) -> "InjectionChain":
+        """Returns the same chain marked as creating the dependency. Call finish_creating on the returned chain once
+        the dependency has been created, calls are expected to be nested the same way the dependencies were created.
+
+        Raises:
+            TypeError: When the dependency isn't hashable
+        """
+        chain = InjectionChain(self._name, self._parent, _CreatingNode(dependency, self._creating))
+        chain._names = self._names
+        return chain
+
+    def finish_creating(self):
+        """Marks the dependency that this chain was created for by creating as no longer being created."""
+        if self._creating is not None:
+            self._creating.release()
+
+    def is_creating(self, dependency: Hashable) -> bool:
+        return self._creating is not None and self._creating.contains(dependency)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        if self._names is None:
+            names = []
+            node = self
+            while node is not None and node._depth:
+                names.append(node._name)
+                node = node._parent
+
+            self._names = tuple(reversed(names))
+
+        return self._names
+
+    def __getitem__(self, index):
+        return self.names[index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def __len__(self) -> int:
+        return self._depth
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, InjectionChain):
+            return self.names == other.names
+
+        if isinstance(other, (tuple, list)):
+            return self.names == tuple(other)
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.names)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self.names)!r})"
+
+
 # Type alias for dependency injection using Python 3.12+ syntax
 type Inject[T, Opts: object] = Annotated[T, Opts]
 
@@ -83,8 +257,8 @@ class TypeMatchingStrategy(Enum):
         >>> def flexible_matching(service: Inject[UserService]):
         ...     pass  # UserService or any subclass accepted
     """
-    DEFAULT = "default"                  # Maps to SUBCLASS
-    SUBCLASS = "subclass"                # Allow subclasses (current behavior)
+    DEFAULT = "default"                  # Instances stored for exactly the requested type
+    SUBCLASS = "subclass"                # Also allow instances stored for subclasses
     STRUCTURAL = "structural"            # Allow protocols/duck typing
     EXACT_TYPE = "exact_type"            # Exact type match only
 
@@ -29,18 +29,27 @@ Example:
     >>> result = process_data(data="test")  # Uses global container
 """
 
-import asyncio
-import concurrent.futures
 import contextvars
+import functools
 import inspect
+import keyword
+import sys
+import threading
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from functools import update_wrapper
-from typing import Any, Callable, Dict, get_type_hints, Optional, Tuple
+from types import MappingProxyType, MethodType
+from typing import Any, Callable, Dict, get_type_hints, Mapping, Optional, Tuple
+from weakref import WeakKeyDictionary
 
 from tramp.optionals import Optional as TrampOptional
 
-from bevy.injection_types import (extract_injection_info, InjectionStrategy, Options, TypeMatchingStrategy)
+import bevy.spans as spans
+from bevy.hooks import Hook, PostInjectionContext
+from bevy.injection_types import (
+    extract_injection_info, get_non_none_type, InjectionChain, InjectionStrategy, is_optional_type, Options,
+    TypeMatchingStrategy,
+)
 
 
 def analyze_function_signature(
@@ -125,6 +134,50 @@ def _should_inject_parameter(
     return False
 
 
+# Nesting depth at which call_using starts checking how much of the stack has been used. Shallower graphs never pay
+# for the check.
+_DEEP_NESTING_CHECK = 16
+
+
+def _is_stack_deep() -> bool:
+    """Check if the current stack is using more than three quarters of the recursion limit."""
+    try:
+        sys._getframe(sys.getrecursionlimit() * 3 // 4)
+    except ValueError:
+        return False
+
+    return True
+
+
+def _run_on_fresh_stack[R](func: Callable[..., R], /, *args) -> R:
+    """Run a function on a new thread, in a copy of the current context, and wait for its result.
+
+    Nested sync resolution runs on the caller's stack so very deep dependency graphs use this to continue resolving
+    without hitting the recursion limit. It is only used once the stack is already deep, so a graph needs one extra
+    thread for every few dozen levels instead of one per level.
+    """
+    ctx = contextvars.copy_context()
+    outcome: dict[str, Any] = {}
+
+    def run():
+        try:
+            outcome["result"] = ctx.run(func, *args)
+        except BaseException as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run, name="bevy-deep-resolution")
+    thread.start()
+    thread.join()
+    if "error" in outcome:
+        raise outcome["error"]
+
+    return outcome["result"]
+
+
+def _start_call_span(container, plan: "_InjectionPlan", injection_chain: InjectionChain) -> spans.Span:
+    return spans.start("call", plan.function_name, container_id=id(container), injection_chain=list(injection_chain))
+
+
 @dataclass
 class _InjectableConfig:
     """Shared configuration for an injectable callable."""
@@ -135,18 +188,240 @@ class _InjectableConfig:
     type_matching: TypeMatchingStrategy
     debug: bool
     cache_analysis: bool
+    compile: bool = False
     auto_inject: bool = False
     analysis_cache: Dict[Callable[..., Any], Dict[str, Tuple[type, Optional[Options]]]] = field(default_factory=dict)
 
 
+@dataclass(frozen=True, slots=True)
+class _InjectedParameter:
+    """Everything needed to inject one parameter, computed once when the injection plan is compiled."""
+
+    name: str
+    kind: Any  # inspect.Parameter.kind
+    requested_type: Any  # The annotated type, possibly optional
+    resolve_type: Any  # The requested type with None unwrapped from optionals
+    is_optional: bool
+    options: Optional[Options]
+    default: TrampOptional[Any]  # Some(default) if the parameter has a default, otherwise Nothing()
+    resolution_kwargs: Mapping[str, Any]  # Option derived Result kwargs (qualifier, default_factory, ...)
+
+
+@dataclass(frozen=True, slots=True)
+class _InjectionPlan:
+    """A frozen description of how to inject dependencies into a callable.
+
+    Plans are compiled the first time an injectable is called so that calls never need to inspect the signature, the
+    type hints, or the injection options again.
+    """
+
+    function_name: str
+    signature: inspect.Signature
+    parameters: tuple[_InjectedParameter, ...]
+    inject_passed_arguments: bool  # REQUESTED_ONLY injects parameters even when they were passed
+    injection_config: Mapping[str, Any]
+    trampoline: Optional[Callable[..., Any]] = None  # Generated by @injectable(compile=True)
+    async_trampoline: Optional[Callable[..., Any]] = None
+
+
+def _compile_injection_plan(
+    func: Callable[..., Any],
+    params: Dict[str, Tuple[type, Optional[Options]]],
+    injection_config: Dict[str, Any],
+    *,
+    generate_trampolines: bool = False,
+) -> _InjectionPlan:
+    """Compile an injection plan from the analyzed parameters of a callable."""
+    signature = inspect.signature(func)
+    parameters = []
+    for param_name, (param_type, options) in params.items():
+        parameter = signature.parameters.get(param_name)
+        if parameter is not None and parameter.default is not inspect.Parameter.empty:
+            default = TrampOptional.Some(parameter.default)
+        else:
+            default = TrampOptional.Nothing()
+
+        resolution_kwargs = {}
+        if options:
+            if options.qualifier:
+                resolution_kwargs["qualifier"] = options.qualifier
+            if options.default_factory:
+                resolution_kwargs["default_factory"] = options.default_factory
+                resolution_kwargs["cache_factory_result"] = options.cache_factory_result
+
+        if injection_config["type_matching"] is not TypeMatchingStrategy.DEFAULT:
+            resolution_kwargs["type_matching"] = injection_config["type_matching"]
+
+        is_optional = is_optional_type(param_type)
+        parameters.append(
+            _InjectedParameter(
+                name=param_name,
+                kind=parameter.kind if parameter is not None else inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                requested_type=param_type,
+                resolve_type=get_non_none_type(param_type) if is_optional else param_type,
+                is_optional=is_optional,
+                options=options,
+                default=default,
+                resolution_kwargs=MappingProxyType(resolution_kwargs),
+            )
+        )
+
+    plan = _InjectionPlan(
+        function_name=getattr(func, "__name__", str(func)),
+        signature=signature,
+        parameters=tuple(parameters),
+        inject_passed_arguments=injection_config["strategy"] == InjectionStrategy.REQUESTED_ONLY,
+        injection_config=MappingProxyType(injection_config),
+    )
+    if not generate_trampolines:
+        return plan
+
+    return replace(
+        plan,
+        trampoline=_generate_trampoline(plan, is_async=False),
+        async_trampoline=_generate_trampoline(plan, is_async=True) if inspect.iscoroutinefunction(func) else None,
+    )
+
+
+_MISSING = object()  # Default used by trampolines for parameters that were not passed
+
+# Every name the generated trampolines use for their own purposes starts with this prefix. Functions that have
+# parameters using the prefix fall back to the regular call path.
+_TRAMPOLINE_PREFIX = "_bevy_"
+
+
+def _generate_trampoline(plan: _InjectionPlan, *, is_async: bool) -> Optional[Callable[..., Any]]:
+    """Generate a Python function specialized to the plan's signature.
+
+    The trampoline has the same parameters as the wrapped function, so Python's own argument handling maps explicit
+    arguments straight into local variables, no BoundArguments needed. Parameters that can be injected default to a
+    sentinel and are filled using the plan's precomputed parameters when they are missing. The wrapped function is
+    then called with its arguments in their positional slots.
+
+    For a plan injecting ``service`` into ``def handler(service: Inject[Service], data: str, *, flag=False)`` the
+    generated source is equivalent to::
+
+        def handler(_bevy_func, _bevy_container, _bevy_chain, /, service=_bevy_missing, data=_bevy_missing, *,
+                    flag=_bevy_default_2):
+            if service is _bevy_missing:
+                service = _bevy_container._inject_single_dependency_sync(_bevy_plan, _bevy_param_0, _bevy_chain)
+            if data is _bevy_missing:
+                raise TypeError("handler() missing required argument: 'data'")
+            return _bevy_func(service, data, flag=flag)
+
+    Returns None when the signature cannot be expressed safely, callers then use the regular call path.
+    """
+    from bevy.injection_types import DependencyResolutionError
+
+    signature_parameters = list(plan.signature.parameters.values())
+    if any(parameter.name.startswith(_TRAMPOLINE_PREFIX) for parameter in signature_parameters):
+        return None
+
+    function_name = plan.function_name
+    if not function_name.isidentifier() or keyword.iskeyword(function_name):
+        function_name = "trampoline"
+
+    namespace: Dict[str, Any] = {
+        "_bevy_missing": _MISSING,
+        "_bevy_plan": plan,
+        "_bevy_resolution_error": DependencyResolutionError,
+    }
+    injected = {parameter.name: index for index, parameter in enumerate(plan.parameters)}
+    for index, parameter in enumerate(plan.parameters):
+        namespace[f"_bevy_param_{index}"] = parameter
+
+    inject_call = "_bevy_container._inject_single_dependency_sync"
+    if is_async:
+        inject_call = "await _bevy_container._inject_single_dependency"
+
+    signature_source = ["_bevy_func", "_bevy_container", "_bevy_chain"]
+    if not any(parameter.kind is inspect.Parameter.POSITIONAL_ONLY for parameter in signature_parameters):
+        signature_source.append("/")
+
+    body = []
+    call_args = []
+    call_kwargs = []
+    keyword_only_started = False
+    for position, parameter in enumerate(signature_parameters):
+        name = parameter.name
+        match parameter.kind:
+            case inspect.Parameter.VAR_POSITIONAL:
+                signature_source.append(f"*{name}")
+                call_args.append(f"*{name}")
+                keyword_only_started = True
+                continue
+
+            case inspect.Parameter.VAR_KEYWORD:
+                signature_source.append(f"**{name}")
+                call_kwargs.append(f"**{name}")
+                continue
+
+            case inspect.Parameter.KEYWORD_ONLY:
+                if not keyword_only_started:
+                    signature_source.append("*")
+                    keyword_only_started = True
+
+                call_kwargs.append(f"{name}={name}")
+
+            case _:
+                call_args.append(name)
+
+        if parameter.default is inspect.Parameter.empty:
+            signature_source.append(f"{name}=_bevy_missing")
+        else:
+            namespace[f"_bevy_default_{position}"] = parameter.default
+            signature_source.append(f"{name}=_bevy_default_{position}")
+
+        if parameter.kind is inspect.Parameter.POSITIONAL_ONLY and (
+            position + 1 == len(signature_parameters)
+            or signature_parameters[position + 1].kind is not inspect.Parameter.POSITIONAL_ONLY
+        ):
+            signature_source.append("/")
+
+        if name in injected:
+            inject = f"{name} = {inject_call}(_bevy_plan, _bevy_param_{injected[name]}, _bevy_chain)"
+            if plan.inject_passed_arguments:
+                body.extend((
+                    "    try:",
+                    f"        {inject}",
+                    "    except _bevy_resolution_error:",
+                    f"        if {name} is _bevy_missing:",
+                    "            raise",
+                ))
+            else:
+                body.extend((f"    if {name} is _bevy_missing:", f"        {inject}"))
+
+        elif parameter.default is inspect.Parameter.empty:
+            body.extend((
+                f"    if {name} is _bevy_missing:",
+                f"        raise TypeError(\"{function_name}() missing required argument: '{name}'\")",
+            ))
+
+    call = f"_bevy_func({', '.join(call_args + call_kwargs)})"
+    body.append(f"    return await {call}" if is_async else f"    return {call}")
+    source = "\n".join((
+        f"{'async def' if is_async else 'def'} {function_name}({', '.join(signature_source)}):",
+        *body,
+    ))
+    exec(compile(source, f"<bevy trampoline {plan.function_name}>", "exec"), namespace)
+    return namespace[function_name]
+
+
+# Compiled plans are shared by every InjectableCallable wrapping the same function with the same configuration. This
+# matters for wrappers that are created per call, like the bound methods created by InjectableCallable.__get__ and the
+# constructors called by Container.call for types.
+_injection_plans: "WeakKeyDictionary[Callable[..., Any], dict[tuple, _InjectionPlan]]" = WeakKeyDictionary()
+
+
 class InjectableCallable:
     """Wrapper that performs dependency injection against a container."""
 
-    __slots__ = ("_func", "_config", "__wrapped__", "__dict__")
+    __slots__ = ("_func", "_config", "_plan", "__wrapped__", "__dict__")
 
     def __init__(self, func: Callable[..., Any], config: _InjectableConfig):
         self._func = func
         self._config = config
+        self._plan: _InjectionPlan | None = None
         update_wrapper(self, func)
         self.__wrapped__ = func
 
@@ -182,6 +457,46 @@ class InjectableCallable:
             "debug_mode": self._config.debug,
         }
 
+    def _injection_plan(self) -> _InjectionPlan:
+        """Returns the compiled injection plan, compiling it on first use. Plans are not cached when analysis caching
+        is disabled."""
+        if self._plan is not None:
+            return self._plan
+
+        if not self._config.cache_analysis:
+            return self._compile_plan()
+
+        # Bound methods are keyed by their function so that every instance shares the same plan
+        is_bound = isinstance(self._func, MethodType)
+        target = self._func.__func__ if is_bound else self._func
+        config_key = (
+            is_bound,
+            self._config.strategy,
+            tuple(self._config.params) if self._config.params is not None else None,
+            self._config.type_matching,
+            self._config.strict,
+            self._config.debug,
+            self._config.compile,
+        )
+        try:
+            plans = _injection_plans.setdefault(target, {})
+        except TypeError:  # The callable cannot be weakly referenced, cache on this wrapper only
+            plans = {}
+
+        if config_key not in plans:
+            plans[config_key] = self._compile_plan()
+
+        self._plan = plans[config_key]
+        return self._plan
+
+    def _compile_plan(self) -> _InjectionPlan:
+        return _compile_injection_plan(
+            self._func,
+            self._analyze(self._func),
+            self._build_injection_configuration(),
+            generate_trampolines=self._config.compile,
+        )
+
     @property
     def is_async(self) -> bool:
         """Check if the wrapped function is async."""
@@ -195,39 +510,47 @@ class InjectableCallable:
         if not isinstance(container, Container):  # pragma: no cover - defensive
             raise TypeError("container must be a Container instance")
 
-        start_time = time.time()
-        function_name = getattr(self._func, "__name__", str(self._func))
-        current_injection_chain = container._build_injection_chain(function_name)
-        injection_config = self._build_injection_configuration()
-
-        sig = inspect.signature(self._func)
-        bound_args = sig.bind_partial(*args, **kwargs)
-        bound_args.apply_defaults()
-
-        # Run async injection in a thread pool with context preservation
-        def run_injection():
-            return asyncio.run(self._inject_missing_dependencies(
-                container,
-                injection_config,
-                bound_args,
-                function_name,
-                current_injection_chain,
-                sig,
-            ))
-
-        # Capture context variables
-        ctx = contextvars.copy_context()
-
-        # Run in thread with context
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future = executor.submit(ctx.run, run_injection)
-            try:
-                injected_params = future.result(timeout=30)
-            except concurrent.futures.TimeoutError:
-                raise TimeoutError(f"Dependency injection timed out after 30 seconds")
-
-        result = self._func(*bound_args.args, **bound_args.kwargs)
-        return result
+        plan = self._plan or self._injection_plan()
+        current_injection_chain = container._build_injection_chain(plan.function_name)
+        span = _start_call_span(container, plan, current_injection_chain) if spans.enabled else None
+        try:
+            # Timing is only measured when something is listening for it
+            post_injection_call = Hook.POST_INJECTION_CALL in container.registry.active_hooks
+
+            # Resolve inline on the calling thread, only async factories and hooks are handed to an event loop. Nested
+            # resolution (e.g. type_factory building a constructor graph) reuses this stack until it is close to the
+            # recursion limit, then continues on a fresh stack.
+            inject = self._inject_missing_dependencies_sync
+            if len(current_injection_chain) >= _DEEP_NESTING_CHECK and _is_stack_deep():
+                inject = functools.partial(_run_on_fresh_stack, inject)
+            elif plan.trampoline and not post_injection_call:
+                return plan.trampoline(self._func, container, current_injection_chain, *args, **kwargs)
+
+            if not post_injection_call:
+                bound_args = plan.signature.bind_partial(*args, **kwargs)
+                bound_args.apply_defaults()
+                inject(container, plan, bound_args, current_injection_chain)
+                return self._func(*bound_args.args, **bound_args.kwargs)
+
+            started = time.perf_counter_ns()
+            bound_args = plan.signature.bind_partial(*args, **kwargs)
+            bound_args.apply_defaults()
+            injected_params = inject(container, plan, bound_args, current_injection_chain)
+
+            injected = time.perf_counter_ns()
+            result = self._func(*bound_args.args, **bound_args.kwargs)
+            finished = time.perf_counter_ns()
+
+            context = self._create_post_injection_context(plan, injected_params, result, started, injected, finished)
+            container.registry.hooks[Hook.POST_INJECTION_CALL].filter_sync(container, context)
+            return result
+        except BaseException as exception:
+            if span is not None:
+                spans.fail(span, exception)
+            raise
+        finally:
+            if span is not None:
+                spans.finish(span)
 
     async def call_using_async(self, container, /, *args, **kwargs):
         """Async version of call_using that uses async dependency resolution."""
@@ -236,24 +559,62 @@ class InjectableCallable:
         if not isinstance(container, Container):  # pragma: no cover - defensive
             raise TypeError("container must be a Container instance")
 
-        function_name = getattr(self._func, "__name__", str(self._func))
-        current_injection_chain = container._build_injection_chain(function_name)
-        injection_config = self._build_injection_configuration()
-
-        sig = inspect.signature(self._func)
-        bound_args = sig.bind_partial(*args, **kwargs)
-        bound_args.apply_defaults()
-
-        await self._inject_missing_dependencies(
-            container,
-            injection_config,
-            bound_args,
-            function_name,
-            current_injection_chain,
-            sig,
-        )
+        plan = self._plan or self._injection_plan()
+        current_injection_chain = container._build_injection_chain(plan.function_name)
+        span = _start_call_span(container, plan, current_injection_chain) if spans.enabled else None
+        try:
+            # Timing is only measured when something is listening for it
+            if Hook.POST_INJECTION_CALL not in container.registry.active_hooks:
+                if plan.async_trampoline:
+                    return await plan.async_trampoline(self._func, container, current_injection_chain, *args, **kwargs)
+
+                bound_args = plan.signature.bind_partial(*args, **kwargs)
+                bound_args.apply_defaults()
+                await self._inject_missing_dependencies(container, plan, bound_args, current_injection_chain)
+                return await self._func(*bound_args.args, **bound_args.kwargs)
+
+            started = time.perf_counter_ns()
+            bound_args = plan.signature.bind_partial(*args, **kwargs)
+            bound_args.apply_defaults()
+            injected_params = await self._inject_missing_dependencies(
+                container, plan, bound_args, current_injection_chain
+            )
 
-        return await self._func(*bound_args.args, **bound_args.kwargs)
+            injected = time.perf_counter_ns()
+            result = await self._func(*bound_args.args, **bound_args.kwargs)
+            finished = time.perf_counter_ns()
+
+            context = self._create_post_injection_context(plan, injected_params, result, started, injected, finished)
+            hook_manager = container.registry.hooks[Hook.POST_INJECTION_CALL]
+            if hook_manager.has_async:
+                await hook_manager.filter(container, context)
+            else:
+                hook_manager.filter_sync(container, context)
+
+            return result
+        except BaseException as exception:
+            if span is not None:
+                spans.fail(span, exception)
+            raise
+        finally:
+            if span is not None:
+                spans.finish(span)
+
+    @staticmethod
+    def _create_post_injection_context(
+        plan: _InjectionPlan, injected_params: Dict[str, Any], result: Any, started: int, injected: int, finished: int
+    ) -> PostInjectionContext:
+        """Create the context passed to POST_INJECTION_CALL hooks from perf_counter_ns timestamps taken before
+        injection, after injection, and after the call."""
+        return PostInjectionContext(
+            function_name=plan.function_name,
+            injected_params=injected_params,
+            result=result,
+            injection_strategy=plan.injection_config["strategy"],
+            debug_mode=plan.injection_config["debug_mode"],
+            execution_time_ms=(finished - injected) / 1_000_000,
+            injection_time_ms=(injected - started) / 1_000_000,
+        )
 
     def __call__(self, *args, **kwargs):
         if self.auto_inject:
@@ -269,46 +630,51 @@ class InjectableCallable:
     async def _inject_missing_dependencies(
         self,
         container,
-        injection_config: Dict[str, Any],
-        bound_args,
-        function_name: str,
-        current_injection_chain: list[str],
-        signature: inspect.Signature,
+        plan: _InjectionPlan,
+        bound_args: inspect.BoundArguments,
+        current_injection_chain: InjectionChain,
     ) -> Dict[str, Any]:
         """Async version of dependency injection with full hook support."""
         from bevy.injection_types import DependencyResolutionError
 
         injected_params: Dict[str, Any] = {}
+        arguments = bound_args.arguments
+        for parameter in plan.parameters:
+            if parameter.name in arguments and not plan.inject_passed_arguments:
+                continue
 
-        for param_name, (param_type, options) in injection_config["params"].items():
-            should_inject = (
-                param_name not in bound_args.arguments
-                or injection_config["strategy"] == InjectionStrategy.REQUESTED_ONLY
-            )
+            try:
+                injected_value = await container._inject_single_dependency(plan, parameter, current_injection_chain)
+                arguments[parameter.name] = injected_value
+                injected_params[parameter.name] = injected_value
+            except DependencyResolutionError:
+                if parameter.name not in arguments:
+                    raise
 
-            if not should_inject:
+        return injected_params
+
+    def _inject_missing_dependencies_sync(
+        self,
+        container,
+        plan: _InjectionPlan,
+        bound_args: inspect.BoundArguments,
+        current_injection_chain: InjectionChain,
+    ) -> Dict[str, Any]:
+        """Sync version of dependency injection with full hook support."""
+        from bevy.injection_types import DependencyResolutionError
+
+        injected_params: Dict[str, Any] = {}
+        arguments = bound_args.arguments
+        for parameter in plan.parameters:
+            if parameter.name in arguments and not plan.inject_passed_arguments:
                 continue
 
             try:
-                parameter = signature.parameters.get(param_name)
-                if parameter is not None and parameter.default is not inspect.Parameter.empty:
-                    parameter_default = TrampOptional.Some(parameter.default)
-                else:
-                    parameter_default = TrampOptional.Nothing()
-
-                injected_value = await container._inject_single_dependency(
-                    param_name,
-                    param_type,
-                    options,
-                    injection_config,
-                    function_name,
-                    current_injection_chain,
-                    parameter_default,
-                )
-                bound_args.arguments[param_name] = injected_value
-                injected_params[param_name] = injected_value
+                injected_value = container._inject_single_dependency_sync(plan, parameter, current_injection_chain)
+                arguments[parameter.name] = injected_value
+                injected_params[parameter.name] = injected_value
             except DependencyResolutionError:
-                if param_name not in bound_args.arguments:
+                if parameter.name not in arguments:
                     raise
 
         return injected_params
@@ -323,6 +689,7 @@ class InjectableCallable:
             "strict_mode": self._config.strict,
             "debug_mode": self._config.debug,
             "cache_analysis": self._config.cache_analysis,
+            "compile": self._config.compile,
         }
 
     # ------------------------------------------------------------------
@@ -348,6 +715,7 @@ class InjectableCallable:
         type_matching: TypeMatchingStrategy | None = None,
         debug: bool = False,
         cache_analysis: bool = True,
+        compile: bool = False,
     ) -> "InjectableCallable":
         if isinstance(func, cls):
             return func
@@ -356,9 +724,7 @@ class InjectableCallable:
         if actual_strategy == InjectionStrategy.DEFAULT:
             actual_strategy = InjectionStrategy.REQUESTED_ONLY
 
-        actual_type_matching = type_matching or TypeMatchingStrategy.SUBCLASS
-        if actual_type_matching == TypeMatchingStrategy.DEFAULT:
-            actual_type_matching = TypeMatchingStrategy.SUBCLASS
+        actual_type_matching = type_matching or TypeMatchingStrategy.DEFAULT
 
         config = _InjectableConfig(
             strategy=actual_strategy,
@@ -367,6 +733,7 @@ class InjectableCallable:
             type_matching=actual_type_matching,
             debug=debug,
             cache_analysis=cache_analysis,
+            compile=compile,
         )
         return cls(func, config)
 
@@ -393,7 +760,8 @@ def injectable(
     strict: bool = True,
     type_matching: TypeMatchingStrategy = TypeMatchingStrategy.DEFAULT,
     debug: bool = False,
-    cache_analysis: bool = True
+    cache_analysis: bool = True,
+    compile: bool = False,
 ):
     """
     Configure dependency injection for a function.
@@ -407,9 +775,12 @@ def injectable(
         strategy: Controls which parameters are injected (default: REQUESTED_ONLY)
         params: List of parameter names to inject (used with ONLY strategy)
         strict: Whether to raise errors for missing dependencies (default: True)
-        type_matching: How to match types during resolution (default: SUBCLASS)
+        type_matching: Which stored instances can be injected (default: DEFAULT, only instances stored for exactly the
+            requested type)
         debug: Enable debug logging during injection (default: False)
         cache_analysis: Cache function signature analysis for performance (default: True)
+        compile: Generate a wrapper specialized to the function's signature that skips generic argument binding on
+            every call (default: False)
     
     Example:
         Basic usage:
@@ -439,20 +810,16 @@ def injectable(
         if strategy == InjectionStrategy.DEFAULT 
         else strategy
     )
-    actual_type_matching = (
-        TypeMatchingStrategy.SUBCLASS 
-        if type_matching == TypeMatchingStrategy.DEFAULT 
-        else type_matching
-    )
     
     def decorator(target_func):
         config = _InjectableConfig(
             strategy=actual_strategy,
             params=list(params) if params is not None else None,
             strict=strict,
-            type_matching=actual_type_matching,
+            type_matching=type_matching,
             debug=debug,
             cache_analysis=cache_analysis,
+            compile=compile,
         )
 
         return InjectableCallable(target_func, config)
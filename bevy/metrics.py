@@ -0,0 +1,171 @@
+"""
+Resolution metrics for containers and registries.
+
+Registries created with ``collect_metrics=True`` count how every lookup made through their containers was answered and
+how long every factory took. Each container keeps its own counters, the registry keeps totals for all of its containers
+(including containers that have since been garbage collected).
+
+Example:
+    >>> registry = Registry(collect_metrics=True)
+    >>> container = registry.create_container()
+    >>> container.get(UserService)
+    >>> stats = container.stats()
+    >>> stats.by_source()
+    {'factory': 1}
+    >>> stats.factories[user_service_factory].percentile(0.95)
+    25000
+
+Sources are the same as the ones reported by bevy.tracing: "cache", "parent", "factory", "hook", "default", and
+"error". Lookups answered from the cache or a parent are hits, everything else is a miss.
+"""
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+# Upper bounds of the factory latency histogram buckets in nanoseconds, from 1µs up to 10s. Slower calls are counted in
+# a final overflow bucket.
+LATENCY_BUCKETS_NS: tuple[int, ...] = tuple(
+    base * scale for scale in (1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000, 1_000_000_000)
+    for base in (1, 2, 5)
+) + (10_000_000_000,)
+
+HIT_SOURCES = frozenset({"cache", "parent"})
+
+
+@dataclass(frozen=True, slots=True)
+class FactoryLatency:
+    """Latency histogram for a single factory.
+
+    Attributes:
+        count: How many times the factory was called
+        total_ns: The total time spent in the factory
+        min_ns: The fastest call
+        max_ns: The slowest call
+        buckets: The number of calls that finished within each bound of LATENCY_BUCKETS_NS, the last count is for calls
+            slower than every bound
+    """
+    count: int
+    total_ns: int
+    min_ns: int
+    max_ns: int
+    buckets: tuple[int, ...]
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> int:
+        """The upper bound of the bucket that contains the given fraction (0.0 - 1.0) of calls, capped at the slowest
+        call."""
+        target = fraction * self.count
+        seen = 0
+        for bound, count in zip(LATENCY_BUCKETS_NS, self.buckets):
+            seen += count
+            if count and seen >= target:
+                return min(bound, self.max_ns)
+
+        return self.max_ns
+
+
+@dataclass(frozen=True, slots=True)
+class ResolutionStats:
+    """A snapshot of resolution metrics.
+
+    Attributes:
+        resolutions: Counts keyed by (dependency, qualifier), each a mapping of source to how many lookups it answered
+        factories: Latency histograms keyed by factory
+    """
+    resolutions: Mapping[tuple[Any, str | None], Mapping[str, int]]
+    factories: Mapping[Callable, FactoryLatency]
+
+    def by_source(self) -> dict[str, int]:
+        """Lookup counts for each source across every dependency."""
+        totals: dict[str, int] = {}
+        for sources in self.resolutions.values():
+            for source, count in sources.items():
+                totals[source] = totals.get(source, 0) + count
+
+        return totals
+
+    @property
+    def hits(self) -> int:
+        """Lookups answered from the container's cache or from a parent."""
+        return sum(count for source, count in self.by_source().items() if source in HIT_SOURCES)
+
+    @property
+    def misses(self) -> int:
+        """Lookups that had to create, default, or failed to find a value."""
+        return sum(count for source, count in self.by_source().items() if source not in HIT_SOURCES)
+
+
+class _Histogram:
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_NS) + 1)
+
+    def add(self, duration_ns: int):
+        if not self.count or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+
+        self.count += 1
+        self.total_ns += duration_ns
+        self.buckets[bisect_left(LATENCY_BUCKETS_NS, duration_ns)] += 1
+
+    def snapshot(self) -> FactoryLatency:
+        return FactoryLatency(self.count, self.total_ns, self.min_ns, self.max_ns, tuple(self.buckets))
+
+
+class ResolutionMetrics:
+    """Thread safe counters for lookups and factory calls."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._resolutions: dict[tuple[Any, str | None, str], int] = {}
+        self._factories: dict[Callable, _Histogram] = {}
+
+    def record_resolution(self, dependency: Any, qualifier: str | None, source: str):
+        key = (dependency, qualifier, source)
+        with self._lock:
+            try:
+                self._resolutions[key] = self._resolutions.get(key, 0) + 1
+            except TypeError:  # Unhashable dependencies are counted by their repr
+                key = (repr(dependency), qualifier, source)
+                self._resolutions[key] = self._resolutions.get(key, 0) + 1
+
+    def record_factory(self, factory: Callable, duration_ns: int):
+        with self._lock:
+            try:
+                histogram = self._factories[factory]
+            except KeyError:
+                histogram = self._factories[factory] = _Histogram()
+
+            histogram.add(duration_ns)
+
+    def snapshot(self) -> ResolutionStats:
+        with self._lock:
+            resolutions: dict[tuple[Any, str | None], dict[str, int]] = {}
+            for (dependency, qualifier, source), count in self._resolutions.items():
+                resolutions.setdefault((dependency, qualifier), {})[source] = count
+
+            factories = {factory: histogram.snapshot() for factory, histogram in self._factories.items()}
+
+        return ResolutionStats(
+            resolutions=MappingProxyType({key: MappingProxyType(sources) for key, sources in resolutions.items()}),
+            factories=MappingProxyType(factories),
+        )
+
+    def reset(self):
+        with self._lock:
+            self._resolutions.clear()
+            self._factories.clear()
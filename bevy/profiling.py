@@ -0,0 +1,110 @@
+"""
+Collapsed-stack profiles of dependency resolution.
+
+The profiler records the span tree of every resolution (see bevy.spans) and folds it into Brendan Gregg's collapsed
+stack format, one line per stack with the frames separated by semicolons followed by a weight:
+
+    handle_request;UserService;Database 1234
+
+Frames are the injectable functions being called and the dependencies being resolved, following the injection chain.
+Constructors and factory functions that are called to create a dependency are folded into the dependency's frame. Each
+stack is weighted by the nanoseconds spent in factories and hooks at that point in the graph, excluding the time spent
+resolving their own dependencies, so the output can be fed straight into flamegraph.pl, speedscope, or any other tool
+that reads collapsed stacks.
+
+Example:
+    >>> from bevy.profiling import ResolutionProfiler
+    >>>
+    >>> with ResolutionProfiler() as profiler:
+    ...     container.call(handle_request)
+    >>>
+    >>> with open("bevy.folded", "w") as file:
+    ...     profiler.write(file)
+"""
+import threading
+from typing import IO
+
+import bevy.spans as spans
+
+# Spans that create dependencies, their time and the time of the calls they make is counted
+_WEIGHTED_KINDS = frozenset({"create", "hook"})
+
+
+class ResolutionProfiler:
+    """Span exporter that folds resolution span trees into weighted collapsed stacks. Spans are buffered until the
+    root span of their tree finishes, then the whole tree is folded at once."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: dict[int, list[spans.Span]] = {}
+        self._stacks: dict[str, int] = {}
+
+    def __call__(self, span: spans.Span):
+        with self._lock:
+            tree = self._pending.setdefault(span.trace_id, [])
+            tree.append(span)
+            if span.parent_id is None:
+                del self._pending[span.trace_id]
+                self._fold(tree)
+
+    def __enter__(self) -> "ResolutionProfiler":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self) -> "ResolutionProfiler":
+        """Starts recording spans."""
+        spans.add_exporter(self)
+        return self
+
+    def stop(self):
+        """Stops recording spans. Trees that were still running are discarded."""
+        spans.remove_exporter(self)
+        with self._lock:
+            self._pending.clear()
+
+    def stacks(self) -> dict[str, int]:
+        """The collapsed stacks mapped to their weight in nanoseconds."""
+        with self._lock:
+            return dict(self._stacks)
+
+    def format(self) -> str:
+        """The collapsed stacks as text, one stack per line, sorted by stack."""
+        return "".join(f"{stack} {weight}\n" for stack, weight in sorted(self.stacks().items()))
+
+    def write(self, file: IO[str]):
+        file.write(self.format())
+
+    def clear(self):
+        with self._lock:
+            self._pending.clear()
+            self._stacks.clear()
+
+    def _fold(self, tree: list[spans.Span]):
+        child_time: dict[int, int] = {}
+        for span in tree:
+            if span.parent_id is not None:
+                child_time[span.parent_id] = child_time.get(span.parent_id, 0) + span.duration_ns
+
+        frames: dict[int, tuple[str, ...]] = {}
+        in_factory: dict[int, bool] = {}
+        for span in sorted(tree, key=lambda span: span.span_id):  # Parents are started before their children
+            parent_frames = frames.get(span.parent_id, ())
+            parent_in_factory = in_factory.get(span.parent_id, False)
+            if span.kind == "resolve" or (span.kind == "call" and not parent_in_factory):
+                frames[span.span_id] = (*parent_frames, _frame_name(span.name))
+            else:
+                frames[span.span_id] = parent_frames
+
+            # Calls made by factories and hooks are constructing the dependency, their time is the factory's time
+            in_factory[span.span_id] = span.kind in _WEIGHTED_KINDS or (span.kind == "call" and parent_in_factory)
+            if in_factory[span.span_id]:
+                weight = max(span.duration_ns - child_time.get(span.span_id, 0), 0)
+                stack = ";".join(frames[span.span_id]) or _frame_name(span.name)
+                self._stacks[stack] = self._stacks.get(stack, 0) + weight
+
+
+def _frame_name(name: str) -> str:
+    """Semicolons separate frames and newlines separate stacks, so neither can appear in a frame."""
+    return name.replace(";", ",").replace("\n", " ")
@@ -1,22 +1,90 @@
 from collections import defaultdict
 from typing import overload, Type
 
+from tramp.optionals import Optional
+
 import bevy.containers as containers
 import bevy.hooks as hooks
+import bevy.metrics as metrics
+from bevy.async_bridge import DEFAULT_TIMEOUT
 from bevy.context_vars import get_global_registry, global_registry, global_container, GlobalContextMixin
 from bevy.factories import Factory
 
 type DependencyFactory[T] = "Callable[[containers.Container], T]"
 
 
+class _Factories(dict):
+    """The registry's factories dict. Counts every change so the registry notices factories that are added, replaced,
+    or removed without using add_factory."""
+    __slots__ = ("mutations",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.mutations = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.mutations += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.mutations += 1
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self.mutations += 1
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self.mutations += 1
+        return item
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.mutations += 1
+
+    def clear(self):
+        super().clear()
+        self.mutations += 1
+
+
 class Registry(GlobalContextMixin, var=global_registry):
     """Registries hold factories and hooks for creating and managing instances of objects. Containers are created from
-    registries, and containers are used to create and cache instances of objects."""
-    def __init__(self):
+    registries, and containers are used to create and cache instances of objects.
+
+    The resolution_timeout is how many seconds a sync caller waits on async factories and async hooks before a
+    TimeoutError is raised. Containers created from the registry use it unless they set their own.
+
+    When collect_metrics is set the containers created from the registry count how each lookup was answered and time
+    every factory call, see Container.stats and Registry.stats."""
+    def __init__(self, *, resolution_timeout: float = DEFAULT_TIMEOUT, collect_metrics: bool = False):
         super().__init__()
-        self.hooks: dict[hooks.Hook, hooks.HookManager] = defaultdict(hooks.HookManager)
-        self.factories: "dict[Type[containers.Instance], DependencyFactory[containers.Instance]]" = {}
+        self.hooks: dict[hooks.Hook, hooks.HookManager] = defaultdict(
+            lambda: hooks.HookManager(on_change=self._hooks_changed)
+        )
+        self._factories = _Factories()
+        self.resolution_timeout = resolution_timeout
+        self.collect_metrics = collect_metrics
+        self._metrics = metrics.ResolutionMetrics()
         self._container_tokens: list = []
+        self._version = 0
+        self._active_hooks: frozenset[hooks.Hook] = frozenset()
+        # Factory lookup index, see find_factory
+        self._factory_positions: dict[type, int] = {}
+        self._indexed_mutations = 0
+        self._checked_factory_types: list[type] = []
+        self._factory_lookups: dict[type, type | None] = {}
 
     @overload
     def add_factory(self, factory: "DependencyFactory[containers.Instance]", for_type: "Type[containers.Instance]"):
@@ -35,25 +103,111 @@ class Registry(GlobalContextMixin, var=global_registry):
                 factory.register_factory(self)
 
             case [factory, type() as for_type] if callable(factory):
+                self._version += 1
+                self._sync_factory_index()
+                if for_type not in self.factories:
+                    self._index_factory_type(for_type)
+                    # Types that already had a factory keep it, the new factory can only answer lookups that missed
+                    self._factory_lookups = {
+                        dependency: factory_type
+                        for dependency, factory_type in self._factory_lookups.items()
+                        if factory_type is not None
+                    }
+
                 self.factories[for_type] = factory
+                self._indexed_mutations = self.factories.mutations  # The index was updated above
 
             case _:
                 raise ValueError(f"Unexpected arguments to add_factory: {args}")
 
+    @property
+    def factories(self) -> "dict[Type[containers.Instance], DependencyFactory[containers.Instance]]":
+        """The factories for each type. Changes made to the dict directly are picked up by find_factory and change the
+        registry's version the same way add_factory does."""
+        return self._factories
+
+    @factories.setter
+    def factories(self, factories: "dict[Type[containers.Instance], DependencyFactory[containers.Instance]]"):
+        self._version += 1
+        self._factories = _Factories(factories)
+
+    def find_factory(self, dependency: "Type[containers.Instance]") -> "Optional[DependencyFactory[containers.Instance]]":
+        """Finds the factory that creates instances of the dependency type. A factory added for the type or for one of
+        its base classes can be used. When several could be used, the one that was added first wins.
+
+        Answers are remembered per dependency type (including when no factory is found) until a factory is added for a
+        new type, or the factories dict is changed directly."""
+        if not isinstance(dependency, type):
+            return Optional.Nothing()
+
+        self._sync_factory_index()
+        try:
+            factory_type = self._factory_lookups[dependency]
+        except KeyError:
+            factory_type = self._factory_lookups[dependency] = self._match_factory_type(dependency)
+
+        if factory_type is None:
+            return Optional.Nothing()
+
+        return Optional.Some(self.factories[factory_type])
+
+    def _match_factory_type(self, dependency: type) -> type | None:
+        positions = self._factory_positions
+        candidates = [base for base in dependency.__mro__ if base in positions]
+        # Types with a custom __subclasscheck__ (ABCs, runtime checkable protocols) can match types that don't list
+        # them in their MRO, so they are checked with issubclass
+        candidates.extend(
+            factory_type
+            for factory_type in self._checked_factory_types
+            if containers.issubclass_or_raises(
+                dependency,
+                factory_type,
+                TypeError(f"Cannot check if {dependency!r} is a subclass of {factory_type!r}"),
+            )
+        )
+        return min(candidates, key=positions.__getitem__, default=None)
+
+    def _index_factory_type(self, factory_type: type):
+        self._factory_positions[factory_type] = len(self._factory_positions)
+        if type(factory_type).__subclasscheck__ is not type.__subclasscheck__:
+            self._checked_factory_types.append(factory_type)
+
+    def _sync_factory_index(self):
+        """Rebuilds the factory index if the factories dict was changed without using add_factory."""
+        if self.factories.mutations != self._indexed_mutations:
+            self._rebuild_factory_index()
+
+    def _rebuild_factory_index(self):
+        self._indexed_mutations = self.factories.mutations
+        self._factory_positions.clear()
+        self._checked_factory_types.clear()
+        self._factory_lookups.clear()
+        for factory_type in self.factories:
+            self._index_factory_type(factory_type)
+
     @overload
     def add_hook(self, hook: "hooks.HookWrapper"):
         ...
 
     @overload
-    def add_hook(self, hook_type: "hooks.Hook", func: "hooks.HookFunction"):
+    def add_hook(
+        self,
+        hook_type: "hooks.Hook",
+        func: "hooks.HookFunction",
+        *,
+        priority: int = 0,
+        for_types: tuple[type, ...] | None = None,
+    ):
         ...
 
-    def add_hook(self, *args):
-        """Adds a callback to a hook. If a HookWrapper is passed, the hook is added to the registry. If a Hook type and
-        a callable are passed, the callable is added as a callback to the hook."""
+    def add_hook(self, *args, priority: int = 0, for_types: tuple[type, ...] | None = None):
+        """Adds a callback to a hook. If a HookWrapper is passed, the hook is added to the registry using the wrapper's
+        priority and type filter. If a Hook type and a callable are passed, the callable is added as a callback to the
+        hook. Callbacks with a higher priority are called first, callbacks with for_types are only called when one of
+        those types (or a subclass) is being resolved."""
         match args:
             case [hooks.Hook() as hook_type, func] if callable(func):
-                self.hooks[hook_type].add_callback(func)
+                self.hooks[hook_type].add_callback(func, priority=priority, for_types=for_types)
 
             case [hooks.HookWrapper(hook_type) as hook]:
                 self.hooks[hook_type].add_callback(hook)
@@ -61,6 +215,36 @@ class Registry(GlobalContextMixin, var=global_registry):
             case _:
                 raise ValueError(f"Unexpected arguments to add_hook: {args}")
 
+    def _hooks_changed(self):
+        """Called by the hook managers in the hooks dict whenever a callback is added to them."""
+        self._active_hooks = frozenset(hook_type for hook_type, manager in self.hooks.items() if manager.callbacks)
+        self._version += 1
+
+    @property
+    def active_hooks(self) -> "frozenset[hooks.Hook]":
+        """The hook types that have at least one callback. Resolution skips the hook types that aren't in the set
+        entirely, so no hook calls, context dicts, or injection contexts are created for them.
+
+        The set is updated whenever a callback is added to one of the hook managers in the hooks dict, whether through
+        add_hook or the manager's add_callback."""
+        return self._active_hooks
+
+    def stats(self) -> "metrics.ResolutionStats":
+        """A snapshot of the resolution metrics of every container created from the registry. Metrics are only
+        collected while collect_metrics is set."""
+        return self._metrics.snapshot()
+
+    def reset_stats(self):
+        """Clears the registry's metric totals, the metrics of each container are kept."""
+        self._metrics.reset()
+
+    @property
+    def version(self) -> int:
+        """Changes every time a factory or a hook is added, and whenever the factories dict is changed directly.
+        Containers use it to know when to discard what they have learned about which dependencies cannot be
+        resolved."""
+        return self._version + self.factories.mutations
+
 
     def __enter__(self):
         registry = super().__enter__()
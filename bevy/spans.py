@@ -0,0 +1,242 @@
+"""
+Span tracing for dependency resolution.
+
+Spans record where the time inside a call goes. Every injectable call, every Container.get/find lookup, every instance
+that is created, and every hook callback that runs gets a span. Spans nest the same way the injection chain does, a
+span started while another is active becomes its child, so a single ``container.call()`` produces a tree showing which
+dependencies came from the cache, which from a parent, and which factories or hooks were slow.
+
+Span tracing is off by default and costs a single module-level check (``spans.enabled``) at each instrumented point
+while it is off. Adding an exporter turns it on, every finished span is then passed to each exporter.
+
+Example:
+    Record the spans of a call in memory:
+
+    >>> from bevy import spans
+    >>>
+    >>> recorder = spans.add_exporter(spans.InMemoryExporter())
+    >>> container.call(handle_request)
+    >>> spans.remove_exporter(recorder)
+    >>> for span in recorder.roots():
+    ...     print(span.name, span.duration_ns)
+
+    Write a Chrome trace-event file that can be loaded in chrome://tracing or Perfetto:
+
+    >>> exporter = spans.add_exporter(spans.ChromeTraceExporter("bevy-trace.json"))
+    >>> container.call(handle_request)
+    >>> spans.remove_exporter(exporter)
+    >>> exporter.close()
+"""
+import itertools
+import json
+import os
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, IO
+
+# The single check used by the instrumented code, True while at least one exporter is installed
+enabled = False
+
+_exporters: "tuple[Exporter, ...]" = ()
+
+# The span that new spans are nested under, propagated into factories, hooks, and async bridges with the context
+_current_span: "ContextVar[Span | None]" = ContextVar("bevy_current_span", default=None)
+
+_span_ids = itertools.count(1)
+
+
+@dataclass(slots=True)
+class Span:
+    """A timed step of dependency resolution.
+
+    Attributes:
+        kind: "call" for an injectable call, "resolve" for a Container.get/find lookup, "create" for an instance being
+            created by a factory or hook, "hook" for a single hook callback
+        name: The function name for calls, the dependency for resolve and create spans, the callback for hooks
+        span_id: Unique id of the span
+        parent_id: The id of the span this one is nested under, None for root spans
+        trace_id: The id of the root span of the tree this span belongs to
+        start_ns: When the span started, measured with time.perf_counter_ns
+        end_ns: When the span finished, None while it is still running
+        thread_id: The thread the span ran on
+        attributes: Details about the step, e.g. the container id, qualifier, and where a value came from
+        error: The repr of the exception that ended the span, if any
+    """
+    kind: str
+    name: str
+    span_id: int
+    parent_id: int | None
+    trace_id: int
+    start_ns: int
+    end_ns: int | None = None
+    thread_id: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+    _token: Any = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def duration_ns(self) -> int | None:
+        return None if self.end_ns is None else self.end_ns - self.start_ns
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "name": self.name,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "trace_id": self.trace_id,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ns": self.duration_ns,
+            "thread_id": self.thread_id,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+type Exporter = Callable[[Span], None]
+
+
+def describe(value: Any) -> str:
+    """The name used for a dependency or callable in span names."""
+    return getattr(value, "__qualname__", None) or repr(value)
+
+
+def start(kind: str, name: str, **attributes: Any) -> Span:
+    """Starts a span nested under the current span and makes it the current span. Every span that is started must be
+    passed to finish() in the same context."""
+    parent = _current_span.get()
+    span_id = next(_span_ids)
+    span = Span(
+        kind=kind,
+        name=name,
+        span_id=span_id,
+        parent_id=parent.span_id if parent else None,
+        trace_id=parent.trace_id if parent else span_id,
+        start_ns=time.perf_counter_ns(),
+        thread_id=threading.get_ident(),
+        attributes=attributes,
+    )
+    span._token = _current_span.set(span)
+    return span
+
+
+def fail(span: Span, exception: BaseException):
+    """Records the exception that is ending the span."""
+    span.error = repr(exception)
+
+
+def finish(span: Span):
+    """Ends the span, restores its parent as the current span, and exports it."""
+    span.end_ns = time.perf_counter_ns()
+    _current_span.reset(span._token)
+    span._token = None
+    for exporter in _exporters:
+        exporter(span)
+
+
+def add_exporter[E: Exporter](exporter: E) -> E:
+    """Installs an exporter and turns span tracing on. Returns the exporter so it can be removed later."""
+    global _exporters, enabled
+    _exporters = (*_exporters, exporter)
+    enabled = True
+    return exporter
+
+
+def remove_exporter(exporter: Exporter):
+    """Removes an exporter, span tracing is turned off when no exporters are left."""
+    global _exporters, enabled
+    _exporters = tuple(installed for installed in _exporters if installed != exporter)
+    enabled = bool(_exporters)
+
+
+def disable():
+    """Removes every exporter and turns span tracing off."""
+    global _exporters, enabled
+    _exporters = ()
+    enabled = False
+
+
+class InMemoryExporter:
+    """Keeps every finished span in a list. Spans are added when they finish, so children come before their parents."""
+
+    def __init__(self):
+        self.spans: list[Span] = []
+
+    def __call__(self, span: Span):
+        self.spans.append(span)
+
+    def roots(self) -> list[Span]:
+        """The spans that have no parent, in the order they started."""
+        return sorted((span for span in self.spans if span.parent_id is None), key=lambda span: span.start_ns)
+
+    def children(self, parent: Span) -> list[Span]:
+        """The spans nested directly under the parent, in the order they started."""
+        return sorted(
+            (span for span in self.spans if span.parent_id == parent.span_id), key=lambda span: span.start_ns
+        )
+
+    def clear(self):
+        self.spans.clear()
+
+
+class _FileExporter:
+    """Base for exporters that write to a path or to an open text file. Files opened from a path are closed by
+    close(), files that were passed in are only flushed."""
+
+    def __init__(self, file: str | os.PathLike | IO[str]):
+        self._owns_file = isinstance(file, (str, os.PathLike))
+        self.file: IO[str] = open(file, "w") if self._owns_file else file
+        self._lock = threading.Lock()
+
+    def close(self):
+        with self._lock:
+            if self._owns_file:
+                self.file.close()
+            else:
+                self.file.flush()
+
+
+class JsonLinesExporter(_FileExporter):
+    """Writes each finished span as a JSON object on its own line."""
+
+    def __call__(self, span: Span):
+        line = json.dumps(span.to_dict(), default=repr)
+        with self._lock:
+            self.file.write(line + "\n")
+
+
+class ChromeTraceExporter(_FileExporter):
+    """Collects spans as Chrome trace events and writes them when closed. The file can be loaded in chrome://tracing,
+    Perfetto, or any other viewer that understands the trace-event format."""
+
+    def __init__(self, file: str | os.PathLike | IO[str]):
+        super().__init__(file)
+        self.events: list[dict[str, Any]] = []
+
+    def __call__(self, span: Span):
+        event = {
+            "name": span.name,
+            "cat": span.kind,
+            "ph": "X",  # Complete event, timestamps are in microseconds
+            "ts": span.start_ns / 1000,
+            "dur": span.duration_ns / 1000,
+            "pid": os.getpid(),
+            "tid": span.thread_id,
+            "args": {
+                **span.attributes,
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                **({"error": span.error} if span.error else {}),
+            },
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def close(self):
+        with self._lock:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ns"}, self.file, default=repr)
+
+        super().close()
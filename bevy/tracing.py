@@ -0,0 +1,133 @@
+"""
+Structured tracing for dependency resolution.
+
+Tracing is off by default and costs a single module-level check (``tracing.enabled``) per resolution step while it is
+off, no events or timers are created. Installing a sink turns it on, every resolution and injection then emits a
+TraceEvent to each installed sink.
+
+Example:
+    Send events to the "bevy" logger:
+
+    >>> import logging
+    >>> from bevy import tracing
+    >>>
+    >>> logging.basicConfig(level=logging.DEBUG)
+    >>> tracing.enable()
+
+    Collect events with a custom sink:
+
+    >>> events = []
+    >>> tracing.add_sink(events.append)
+    >>> container.get(UserService)
+    >>> tracing.remove_sink(events.append)
+
+Functions decorated with ``@injectable(debug=True)`` always emit their injection events. When no sink is installed
+those events are logged to the "bevy" logger at DEBUG level.
+"""
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable
+
+logger = logging.getLogger("bevy")
+
+# The single check used by the resolution code, True while at least one sink is installed
+enabled = False
+
+_sinks: "tuple[Sink, ...]" = ()
+
+
+@dataclass(frozen=True, slots=True)
+class TraceEvent:
+    """A single resolution or injection step.
+
+    Attributes:
+        kind: "resolve" for a Container.get/find lookup, "inject" for a parameter injected into a function
+        dependency: The type that was requested
+        source: Where the value came from. Resolve events use "cache", "parent", "factory", "hook", "default", or
+            "error". Inject events use "injected", "optional_none", or "non_strict_none".
+        container_id: The id() of the container that resolved the dependency
+        qualifier: The qualifier that was requested, if any
+        duration_ns: How long the step took, measured with time.perf_counter_ns
+        function: The name of the function being injected (inject events only)
+        parameter: The name of the parameter being injected (inject events only)
+    """
+    kind: str
+    dependency: Any
+    source: str
+    container_id: int
+    qualifier: str | None = None
+    duration_ns: int | None = None
+    function: str | None = None
+    parameter: str | None = None
+
+    def describe(self) -> str:
+        """A single line, human readable description of the event."""
+        dependency = getattr(self.dependency, "__qualname__", repr(self.dependency))
+        parts = [f"{self.kind} {dependency}"]
+        if self.qualifier:
+            parts.append(f"qualifier={self.qualifier!r}")
+
+        if self.parameter:
+            parts.append(f"parameter={self.function}.{self.parameter}")
+
+        parts.append(f"source={self.source}")
+        if self.duration_ns is not None:
+            parts.append(f"duration={self.duration_ns / 1000:.1f}us")
+
+        parts.append(f"container={self.container_id:#x}")
+        return " ".join(parts)
+
+
+type Sink = Callable[[TraceEvent], None]
+
+
+class LoggingSink:
+    """Logs each event as a single line, the event is attached to the log record as record.bevy_event."""
+
+    def __init__(self, target: logging.Logger = logger, level: int = logging.DEBUG):
+        self.logger = target
+        self.level = level
+
+    def __call__(self, event: TraceEvent):
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, "%s", event.describe(), extra={"bevy_event": event})
+
+
+_debug_sink = LoggingSink()
+
+
+def add_sink(sink: Sink) -> Sink:
+    """Installs a sink and turns tracing on. Returns the sink so it can be removed later."""
+    global _sinks, enabled
+    _sinks = (*_sinks, sink)
+    enabled = True
+    return sink
+
+
+def remove_sink(sink: Sink):
+    """Removes a sink, tracing is turned off when no sinks are left."""
+    global _sinks, enabled
+    _sinks = tuple(installed for installed in _sinks if installed != sink)
+    enabled = bool(_sinks)
+
+
+def enable(sink: Sink | None = None) -> Sink:
+    """Turns tracing on, sending events to the sink or to the "bevy" logger when no sink is given."""
+    return add_sink(sink or LoggingSink())
+
+
+def disable():
+    """Removes every sink and turns tracing off."""
+    global _sinks, enabled
+    _sinks = ()
+    enabled = False
+
+
+def emit(event: TraceEvent, *, debug: bool = False):
+    """Sends the event to the installed sinks. Debug events are logged when no sinks are installed."""
+    if _sinks:
+        for sink in _sinks:
+            sink(event)
+
+    elif debug:
+        _debug_sink(event)
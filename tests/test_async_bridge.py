@@ -0,0 +1,113 @@
+"""Tests for the event loop bridge that sync callers use to run async factories and hooks."""
+import asyncio
+import contextvars
+import threading
+
+import pytest
+from tramp.optionals import Optional
+
+from bevy import Inject, injectable, Options
+from bevy.async_bridge import DEFAULT_TIMEOUT, run_coroutine_sync
+from bevy.hooks import hooks
+from bevy.registries import Registry
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="")
+
+
+class Value:
+    def __init__(self, loop=None, thread_id=None):
+        self.loop = loop
+        self.thread_id = thread_id
+
+
+async def create_value():
+    await asyncio.sleep(0)
+    return Value(asyncio.get_running_loop(), threading.get_ident())
+
+
+def test_event_loop_is_reused_between_calls():
+    container = Registry().create_container()
+    first = container.get(Value, default_factory=create_value, cache_factory_result=False)
+    second = container.get(Value, default_factory=create_value, cache_factory_result=False)
+
+    assert first.loop is second.loop
+    assert not first.loop.is_closed()
+    assert first.thread_id == threading.get_ident()
+
+
+def test_contextvars_propagate_to_thread_loop():
+    async def read_request_id():
+        return request_id.get()
+
+    request_id.set("abc")
+    assert run_coroutine_sync(read_request_id()) == "abc"
+
+
+@pytest.mark.asyncio
+async def test_sync_get_inside_running_loop_uses_background_loop():
+    request_id.set("from running loop")
+    captured = []
+
+    @hooks.GET_INSTANCE
+    async def capture(container, dependency, context):
+        captured.append((request_id.get(), threading.get_ident()))
+        return Optional.Some(Value())
+
+    registry = Registry()
+    capture.register_hook(registry)
+    container = registry.create_container()
+
+    container.get(Value)
+    container.get(Value)
+
+    assert [value for value, _ in captured] == ["from running loop"] * 2
+    # The background loop thread is returned to the pool and reused
+    assert captured[0][1] == captured[1][1] != threading.get_ident()
+
+
+def test_resolution_timeout_defaults():
+    registry = Registry()
+    container = registry.create_container()
+    assert registry.resolution_timeout == DEFAULT_TIMEOUT
+    assert container.resolution_timeout == DEFAULT_TIMEOUT
+
+
+def test_registry_resolution_timeout():
+    async def slow_factory():
+        await asyncio.sleep(5)
+
+    container = Registry(resolution_timeout=0.05).create_container()
+    with pytest.raises(TimeoutError, match="timed out after 0.05 seconds"):
+        container.get(Value, default_factory=slow_factory)
+
+
+def test_container_resolution_timeout_is_inherited_by_branches():
+    @hooks.GET_INSTANCE
+    async def slow_hook(container, dependency, context):
+        await asyncio.sleep(5)
+        return Optional.Nothing()
+
+    registry = Registry()
+    slow_hook.register_hook(registry)
+    container = registry.create_container()
+    container.resolution_timeout = 0.05
+    branch = container.branch()
+
+    @injectable
+    def handler(value: Inject[Value, Options(default_factory=Value)]):
+        return value
+
+    assert branch.resolution_timeout == 0.05
+    with pytest.raises(TimeoutError, match="timed out"):
+        branch.get(Value)
+
+    # Default factories skip the GET_INSTANCE hook entirely
+    assert isinstance(branch.call(handler), Value)
+
+
+def test_timeout_error_raised_by_coroutine_is_not_rewritten():
+    async def raises_timeout():
+        raise TimeoutError("upstream timed out")
+
+    with pytest.raises(TimeoutError, match="upstream"):
+        run_coroutine_sync(raises_timeout())
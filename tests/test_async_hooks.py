@@ -249,7 +249,7 @@ def test_async_hook_with_legacy_signature():
 
 
 def test_async_post_injection_hook():
-    """Test async hooks for post-injection callbacks - not called in async-native architecture."""
+    """Test async hooks for post-injection callbacks."""
     post_hook_called = []
 
     @hooks.POST_INJECTION_CALL
@@ -273,8 +273,7 @@ def test_async_post_injection_hook():
     result = container.call(test_func)
 
     assert result == "Result: test"  # Default TestDependency has name="test"
-    # POST_INJECTION_CALL hooks are no longer called from sync container.call() in async-native architecture
-    # assert len(post_hook_called) == 1
+    assert post_hook_called == [{'function': 'test_func', 'result': "Result: test"}]
 
 
 def test_async_hook_with_parent_container():
@@ -413,4 +412,45 @@ def test_async_hook_nested_container_calls_no_deadlock():
     assert isinstance(result, AsyncSession)
     assert isinstance(result.engine, AsyncEngine)
     assert result.engine.url == "postgresql://localhost"
-    assert hooks_called == ["session_start", "engine", "session_complete"]
\ No newline at end of file
+    assert hooks_called == ["session_start", "engine", "session_complete"]
+
+@pytest.mark.asyncio
+async def test_sync_only_hooks_skip_async_dispatch(monkeypatch):
+    """Test that async resolution calls sync hooks without going through the async hook methods."""
+    from bevy.hooks import HookManager
+
+    async def fail(*args, **kwargs):
+        raise AssertionError("Async hook dispatch used for sync hooks")
+
+    monkeypatch.setattr(HookManager, "handle", fail)
+    monkeypatch.setattr(HookManager, "filter", fail)
+
+    @hooks.CREATE_INSTANCE
+    def create(container, dependency, context):
+        return Optional.Some(dependency("created"))
+
+    @hooks.GOT_INSTANCE
+    def got(container, instance, context):
+        return Optional.Some(TestValue(f"got {instance.value}"))
+
+    registry = Registry()
+    create.register_hook(registry)
+    got.register_hook(registry)
+    assert not registry.hooks[Hook.CREATE_INSTANCE].has_async
+
+    container = registry.create_container()
+    result = await container.find(TestValue).get_async()
+    assert result.value == "got created"
+
+
+def test_has_async_is_set_by_async_callbacks():
+    """Test that hook managers know when an async callback has been added."""
+    async def async_hook(container, dependency, context):
+        return Optional.Nothing()
+
+    registry = Registry()
+    registry.add_hook(Hook.GET_INSTANCE, lambda container, dependency, context: Optional.Nothing())
+    assert not registry.hooks[Hook.GET_INSTANCE].has_async
+
+    registry.add_hook(Hook.GET_INSTANCE, async_hook)
+    assert registry.hooks[Hook.GET_INSTANCE].has_async
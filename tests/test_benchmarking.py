@@ -0,0 +1,60 @@
+"""Tests for the benchmark harness."""
+import pytest
+
+from bevy.benchmarking import (
+    BenchmarkResult, compare, format_comparisons, load_results, measure, measure_async, percentile, save_results,
+)
+
+
+def test_measure():
+    calls = []
+    result = measure("append", lambda: calls.append(None), warmup=5, samples=3, batch_size=10)
+
+    assert len(calls) == 5 + 3 * 10
+    assert (result.name, result.batch_size, len(result.samples_ns)) == ("append", 10, 3)
+    assert result.median_ns > 0
+    assert result.ops_per_sec == pytest.approx(1_000_000_000 / result.median_ns)
+
+
+def test_measure_calibrates_batches():
+    result = measure("noop", lambda: None, warmup=0, samples=2, sample_time_ns=100_000)
+    assert result.batch_size > 1
+
+
+def test_measure_async():
+    calls = []
+
+    async def append():
+        calls.append(None)
+
+    result = measure_async("append", append, warmup=2, samples=2, batch_size=4)
+    assert len(calls) == 2 + 2 * 4
+    assert len(result.samples_ns) == 2
+
+
+def test_percentile():
+    assert percentile([1, 2, 3, 4, 5], 0.5) == 3
+    assert percentile([1, 2, 3, 4, 5], 0.95) == pytest.approx(4.8)
+    assert percentile([7], 0.95) == 7
+
+
+def test_compare_flags_regressions():
+    baseline = {"a": BenchmarkResult("a", (100.0,), 1), "b": BenchmarkResult("b", (100.0,), 1)}
+    current = {
+        "a": BenchmarkResult("a", (105.0,), 1),
+        "b": BenchmarkResult("b", (300.0,), 1),
+        "new": BenchmarkResult("new", (1.0,), 1),
+    }
+
+    comparisons = compare(baseline, current, threshold=0.1)
+    assert [(comparison.name, comparison.regressed) for comparison in comparisons] == [("a", False), ("b", True)]
+    assert comparisons[1].ratio == 3
+    assert "REGRESSION" in format_comparisons(comparisons).splitlines()[2]
+
+
+def test_results_round_trip(tmp_path):
+    path = tmp_path / "results.json"
+    results = [BenchmarkResult("a", (1.0, 2.0, 3.0), 8)]
+    save_results(path, results)
+
+    assert load_results(path) == {"a": results[0]}
@@ -0,0 +1,85 @@
+"""Tests for the python -m bevy bench command."""
+import json
+
+import pytest
+
+from bevy.__main__ import main
+
+APP = '''
+from bevy import Inject, injectable, Registry
+from bevy.bundled.type_factory_hook import type_factory
+
+
+class Database:
+    pass
+
+
+class UserService:
+    def __init__(self, db: Inject[Database]):
+        self.db = db
+
+
+registry = Registry()
+type_factory.register_hook(registry)
+
+
+@injectable
+def handle(service: Inject[UserService], db: Inject[Database]):
+    return service
+
+
+@injectable
+async def handle_async(service: Inject[UserService]):
+    return service
+'''
+
+
+@pytest.fixture
+def app_module(tmp_path, monkeypatch):
+    (tmp_path / "bench_app.py").write_text(APP)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return "bench_app"
+
+
+def run(argv):
+    with pytest.raises(SystemExit) as exc_info:
+        main(argv)
+
+    return exc_info.value.code
+
+
+def test_bench_reports_each_target(app_module, capsys):
+    argv = ["bench", app_module, "--resolve", "UserService", "--call", "handle", "--call", "handle_async", "-n", "20"]
+    assert run(argv) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert "ops/sec" in lines[0] and "p99 us" in lines[0]
+    assert lines[1].startswith("resolve UserService") and lines[1].endswith("cache=1")
+    assert lines[2].startswith("call handle ") and lines[2].endswith("cache=2")
+    assert lines[3].startswith("call handle_async") and lines[3].endswith("cache=1")
+
+
+def test_bench_saves_per_operation_samples(app_module, tmp_path):
+    output = tmp_path / "results.json"
+    assert run(["bench", app_module, "--resolve", "UserService", "-n", "15", "-o", str(output)]) == 0
+
+    result = json.loads(output.read_text())["results"]["resolve UserService"]
+    assert result["batch_size"] == 1
+    assert len(result["samples_ns"]) == 15
+
+
+def test_bench_restores_metrics_setting(app_module):
+    import bench_app
+
+    assert run(["bench", app_module, "--container", "registry", "--resolve", "UserService", "-n", "5"]) == 0
+    assert not bench_app.registry.collect_metrics
+
+
+def test_bench_reports_errors(app_module, capsys):
+    assert run(["bench", app_module, "--resolve", "Nope", "-n", "5"]) == 1
+    assert "Error:" in capsys.readouterr().err
+
+
+def test_dotpath_docs_still_work(capsys):
+    main(["bevy.containers.Container", "signature"])
+    assert "Signature for: bevy.containers.Container" in capsys.readouterr().out
@@ -9,6 +9,8 @@ This test suite covers container branching including:
 - Cache inheritance across branches
 """
 
+import sys
+
 import pytest
 
 from bevy import Container, Inject, injectable, Registry
@@ -364,5 +366,140 @@ class TestFactoryCacheInheritance:
         assert "parent-db" in child.call(test)
 
 
+class TestFlattenedParentLookups:
+    """Test that branches resolve parent instances through the flattened parent view."""
+
+    def build_chain(self, depth):
+        chain = [Container(Registry())]
+        for _ in range(depth):
+            chain.append(chain[-1].branch())
+
+        return chain
+
+    def test_deep_branch_lookup_does_not_recurse_through_results(self, monkeypatch):
+        app, tenant, request, *_, leaf = self.build_chain(5)
+        db = DatabaseConnection("app-db")
+        app.add(db)
+
+        finds = []
+        original_find = Container.find
+
+        def find(self, *args, **kwargs):
+            finds.append(self)
+            return original_find(self, *args, **kwargs)
+
+        monkeypatch.setattr(Container, "find", find)
+
+        sibling = request.branch()
+        assert leaf.get(DatabaseConnection) is db
+        assert sibling.get(DatabaseConnection) is db
+        # Only the containers that were asked create results, their parents are never asked
+        assert finds == [leaf, sibling]
+
+    def test_parent_changes_invalidate_views(self):
+        app, tenant, request, leaf = self.build_chain(3)
+        app.add(DatabaseConnection("app-db"))
+        assert leaf.get(DatabaseConnection, default=None).url == "app-db"
+
+        sibling = request.branch()
+        tenant.add(DatabaseConnection("tenant-db"))
+        assert sibling.get(DatabaseConnection).url == "tenant-db"
+        assert request.branch().get(DatabaseConnection).url == "tenant-db"
+
+    def test_deleting_parent_instances_invalidates_views(self):
+        from bevy import TypeMatchingStrategy
+
+        class SpecialDatabase(DatabaseConnection):
+            pass
+
+        app, tenant = self.build_chain(1)
+        app.add(SpecialDatabase("app-db"))
+        assert tenant.branch().get(SpecialDatabase).url == "app-db"
+        assert tenant.branch().branch().get(DatabaseConnection, type_matching=TypeMatchingStrategy.SUBCLASS).url == "app-db"
+
+        del app.instances[SpecialDatabase]
+        assert app.get(DatabaseConnection, default=None, type_matching=TypeMatchingStrategy.SUBCLASS) is None
+        assert tenant.branch().get(SpecialDatabase, default=None) is None
+        assert tenant.branch().get(DatabaseConnection, default=None, type_matching=TypeMatchingStrategy.SUBCLASS) is None
+
+        app.add(DatabaseConnection, SpecialDatabase("base-db"))
+        assert tenant.branch().get(DatabaseConnection).url == "base-db"
+        del app.instances[DatabaseConnection]
+        assert tenant.branch().get(DatabaseConnection, default=None) is None
+
+    def test_storing_the_same_instance_again_keeps_views(self, monkeypatch):
+        app, tenant, leaf = self.build_chain(2)
+        db = DatabaseConnection("app-db")
+        app.add(db)
+        assert leaf.get(DatabaseConnection) is db
+
+        forgotten = []
+        original_forget_lookups = Container._forget_lookups
+
+        def forget_lookups(self, *dependencies):
+            forgotten.append(self)
+            original_forget_lookups(self, *dependencies)
+
+        monkeypatch.setattr(Container, "_forget_lookups", forget_lookups)
+
+        app.add(db)
+        app.instances[DatabaseConnection] = db
+        assert forgotten == []
+
+        replacement = DatabaseConnection("new-db")
+        app.instances[DatabaseConnection] = replacement
+        assert forgotten == [app]
+        assert tenant.branch().get(DatabaseConnection) is replacement
+
+    def test_parent_cache_hits_keep_branch_views(self):
+        app, tenant = self.build_chain(1)
+        branches = [tenant.branch() for _ in range(100)]
+        db = DatabaseConnection("app-db")
+        app.add(db)
+        assert all(branch.get(DatabaseConnection) is db for branch in branches)
+        assert tenant.get(DatabaseConnection) is db
+
+        versions = [branch._lookups_version for branch in (tenant, *branches)]
+        for _ in range(10):
+            assert app.get(DatabaseConnection) is db
+            assert tenant.get(DatabaseConnection) is db
+
+        assert [branch._lookups_version for branch in (tenant, *branches)] == versions
+
+    def test_changes_invalidate_branch_chains_deeper_than_the_recursion_limit(self):
+        chain = self.build_chain(sys.getrecursionlimit() + 100)
+        assert chain[-1].get(DatabaseConnection, default=None) is None
+
+        db = DatabaseConnection("app-db")
+        chain[0].add(db)
+        assert chain[-1].get(DatabaseConnection) is db
+
+    def test_parent_misses_are_remembered_until_added(self):
+        app, tenant, leaf = self.build_chain(2)
+        assert leaf.get(EmailService, default=None) is None
+        assert tenant.branch().get(EmailService, default=None) is None
+
+        app.add(EmailService())
+        assert isinstance(tenant.branch().get(EmailService), EmailService)
+
+    def test_parent_lookup_hooks_still_run(self):
+        from tramp.optionals import Optional
+        from bevy.hooks import hooks
+
+        seen = []
+
+        @hooks.GET_INSTANCE
+        def record(container, dependency, context):
+            seen.append(container)
+            return Optional.Nothing()
+
+        app, tenant, leaf = self.build_chain(2)
+        record.register_hook(app.registry)
+        app.add(DatabaseConnection("app-db"))
+
+        assert leaf.get(DatabaseConnection).url == "app-db"
+        assert seen == [leaf, tenant, app]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -245,5 +245,56 @@ class TestContainerGetEdgeCases:
         assert "factory-with-default" in result.value
 
 
+class TestContainerInstanceStores:
+    """Test that instances are kept in separate stores and exposed through Container.instances."""
+
+    def test_instances_are_stored_by_kind(self):
+        def create_db():
+            return DatabaseConnection("factory")
+
+        container = Container(Registry())
+        service = ServiceExample()
+        primary = DatabaseConnection("primary")
+        container.add(service)
+        container.add(DatabaseConnection, primary, qualifier="primary")
+        created = container.get(DatabaseConnection, default_factory=create_db)
+
+        assert container.type_instances[ServiceExample] is service
+        assert container.qualified_instances == {(DatabaseConnection, "primary"): primary}
+        assert container.factory_results == {create_db: created}
+        assert ServiceExample not in container.factory_results
+
+    def test_instances_mapping_is_compatible(self):
+        def create_db():
+            return DatabaseConnection("factory")
+
+        container = Container(Registry())
+        service = ServiceExample()
+        container.add(service)
+        container.add(DatabaseConnection, DatabaseConnection("primary"), qualifier="primary")
+        created = container.get(DatabaseConnection, default_factory=create_db)
+
+        instances = container.instances
+        assert instances[ServiceExample] is service
+        assert instances[(DatabaseConnection, "primary")].url == "primary"
+        assert instances[create_db] is created
+        assert {ServiceExample, (DatabaseConnection, "primary"), create_db, Container, Registry} == set(instances)
+        assert len(instances) == 5
+
+    def test_writes_through_instances_mapping(self):
+        def create_db():
+            return DatabaseConnection("factory")
+
+        container = Container(Registry())
+        assert container.get(ServiceExample, default=None) is None
+
+        container.instances[ServiceExample] = service = ServiceExample("written")
+        container.instances[create_db] = DatabaseConnection("written")
+
+        assert container.get(ServiceExample) is service
+        assert container.get(DatabaseConnection, default_factory=create_db).url == "written"
+        assert create_db in container.factory_results
+
+
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
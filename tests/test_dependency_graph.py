@@ -0,0 +1,179 @@
+"""Tests for dependency graph exports."""
+import json
+import sys
+
+import pytest
+
+from bevy import Inject, injectable, Options, Registry
+from bevy.__main__ import main
+from bevy.bundled.type_factory_hook import type_factory
+from bevy.dependency_graph import build_graph
+from bevy.factories import factory
+
+
+class Config:
+    pass
+
+
+class Database:
+    def __init__(self, config: Config):
+        self.config = config
+
+
+class Cache:
+    pass
+
+
+class Service:
+    def __init__(self, database: Database, cache: Cache | None = None):
+        self.database = database
+
+
+@factory(Config)
+def config_factory(container):
+    return Config()
+
+
+calls = []
+
+
+@injectable
+def handler(service: Inject[Service], database: Inject[Database]):
+    calls.append(handler)
+    return service
+
+
+@injectable
+async def async_handler(replica: Inject[Database, Options(qualifier="replica")]):
+    return replica
+
+
+def create_registry():
+    registry = Registry()
+    type_factory.register_hook(registry)
+    config_factory.register_factory(registry)
+    return registry
+
+
+def name(cls):
+    return f"{__name__}.{cls.__qualname__}"
+
+
+def test_graph_follows_injectables_constructors_and_factories():
+    graph = build_graph(sys.modules[__name__], create_registry())
+
+    assert graph.nodes[name(handler)].kind == "injectable"
+    assert graph.nodes[name(Service)].provider == "constructor"
+    assert graph.nodes[name(Config)].provider == "factory"
+    assert graph.nodes[name(Config)].factory == f"{__name__}.config_factory"
+    assert graph.nodes[f"{name(Database)}[replica]"].qualifier == "replica"
+    assert graph.nodes[f"{name(Database)}[replica]"].provider == "unresolved"
+    assert graph.dependencies(name(handler)) == {name(Service), name(Database), name(Cache), name(Config)}
+
+    edges = {(edge.source, edge.target): edge for edge in graph.edges}
+    assert edges[name(Service), name(Cache)].optional
+    assert edges[name(handler), name(Service)].parameter == "service"
+
+
+def test_types_are_unresolved_without_hooks():
+    registry = Registry()
+    config_factory.register_factory(registry)
+    graph = build_graph(sys.modules[__name__], registry)
+
+    assert graph.nodes[name(Service)].provider == "unresolved"
+    assert name(Database) not in graph.dependencies(name(Service))
+
+
+def test_profile_annotates_construction_time_and_size():
+    registry = create_registry()
+    graph = build_graph(sys.modules[__name__], registry)
+    graph.profile(registry.create_container())
+
+    for cls in (Config, Database, Service, Cache):
+        node = graph.nodes[name(cls)]
+        assert node.construction_ns > 0
+        assert node.size_bytes > 0
+
+    assert graph.nodes[name(handler)].construction_ns > 0
+    assert graph.nodes[name(async_handler)].error
+    assert graph.nodes[f"{name(Database)}[replica]"].construction_ns is None
+    assert calls == []
+
+
+def test_qualified_dependencies_with_a_default_factory():
+    @injectable
+    def replica_handler(replica: Inject[Database, Options(qualifier="replica", default_factory=lambda: Database(Config()))]):
+        calls.append(replica_handler)
+
+    module = type(sys)("replica_app")
+    replica_handler.__module__ = module.__name__
+    module.replica_handler = replica_handler
+    registry = create_registry()
+    graph = build_graph(module, registry)
+    node = graph.nodes[f"{name(Database)}[replica]"]
+    assert node.provider == "factory"
+    assert "lambda" in node.factory
+
+    graph.profile(registry.create_container())
+    assert node.error is None
+    [injectable_node] = [node for node in graph.nodes.values() if node.kind == "injectable"]
+    assert injectable_node.construction_ns > 0
+    assert calls == []
+
+
+def test_dot_and_json_exports():
+    registry = create_registry()
+    graph = build_graph(sys.modules[__name__], registry)
+    graph.profile(registry.create_container())
+
+    dot = graph.to_dot()
+    assert dot.startswith("digraph bevy {")
+    assert f'"{name(handler)}" -> "{name(Service)}" [label="service"];' in dot
+    assert f'"{name(Service)}" -> "{name(Cache)}" [label="cache", style=dashed];' in dot
+
+    data = json.loads(graph.to_json())
+    nodes = {node["id"]: node for node in data["nodes"]}
+    assert nodes[name(handler)]["dependencies"] == 4
+    assert nodes[name(Config)]["provider"] == "factory"
+    assert "size_bytes" in nodes[name(Service)]
+    assert {"source": name(Database), "target": name(Config), "parameter": "config", "optional": False} in data["edges"]
+
+
+APP = '''
+from bevy import Inject, injectable, Registry
+from bevy.bundled.type_factory_hook import type_factory
+
+
+class Database:
+    pass
+
+
+registry = Registry()
+type_factory.register_hook(registry)
+
+
+@injectable
+def handle(db: Inject[Database]):
+    print("handled")
+    return db
+'''
+
+
+def test_graph_command(tmp_path, monkeypatch, capsys):
+    (tmp_path / "graph_app.py").write_text(APP)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    output = tmp_path / "graph.json"
+
+    with pytest.raises(SystemExit) as exc_info:
+        main(["graph", "graph_app", "--profile", "--format", "json", "-o", str(output)])
+
+    assert exc_info.value.code == 0
+    nodes = {node["id"]: node for node in json.loads(output.read_text())["nodes"]}
+    assert nodes["graph_app.Database"]["construction_ns"] > 0
+
+    with pytest.raises(SystemExit):
+        main(["graph", "graph_app"])
+
+    out = capsys.readouterr().out
+    assert '"graph_app.handle" -> "graph_app.Database" [label="db"];' in out
+    assert "handled" not in out
@@ -3,8 +3,9 @@ from typing import Annotated
 import pytest
 from tramp.optionals import Optional
 
-from bevy import Inject, injectable
-from bevy.hooks import hooks
+from bevy import Container, Inject, injectable
+from bevy.hooks import Hook, hooks
+from bevy.injection_types import DependencyResolutionError
 from bevy.registries import Registry
 
 
@@ -98,3 +99,260 @@ def test_hooks_can_modify(hook_type):
     hook.register_hook(registry)
     container = registry.create_container()
     container.call(test_func)
+
+
+def test_active_hooks_track_registered_callbacks():
+    registry = Registry()
+    assert registry.active_hooks == frozenset()
+
+    @hooks.GOT_INSTANCE
+    def hook(container, instance, context):
+        return Optional.Nothing()
+
+    hook.register_hook(registry)
+    assert registry.active_hooks == {Hook.GOT_INSTANCE}
+
+
+def test_callbacks_added_to_hook_managers_are_dispatched():
+    class Dependency:
+        pass
+
+    registry = Registry()
+    container = registry.create_container()
+    assert container.get(Dependency, default=None) is None
+
+    instance = Dependency()
+    registry.hooks[Hook.GET_INSTANCE].add_callback(lambda container, dependency: Optional.Some(instance))
+
+    assert registry.active_hooks == {Hook.GET_INSTANCE}
+    # The container had learned Dependency was missing, adding the callback has to invalidate that
+    assert container.get(Dependency) is instance
+
+
+def test_injection_context_is_skipped_without_hooks(monkeypatch):
+    def fail(*args):
+        raise AssertionError("InjectionContext created without any hooks registered")
+
+    monkeypatch.setattr(Container, "_create_injection_context", staticmethod(fail))
+
+    @injectable
+    def test_func(dep: Inject[InjectClass]):
+        return dep
+
+    container = Registry().create_container()
+    container.add(InjectClass("payload"))
+    assert container.call(test_func).payload == "payload"
+
+    @injectable
+    def missing(dep: Inject[InjectWrapper]):
+        return dep
+
+    with pytest.raises(DependencyResolutionError, match="No handler found") as error:
+        Registry().create_container().call(missing)
+
+    assert error.value.parameter_name == "dep"
+
+
+def test_injection_context_is_created_for_subscribed_hooks():
+    contexts = []
+
+    @hooks.INJECTION_RESPONSE
+    def hook(container, value, context):
+        contexts.append(context["injection_context"])
+        return Optional.Nothing()
+
+    @injectable
+    def test_func(dep: Inject[InjectClass]):
+        return dep
+
+    registry = Registry()
+    hook.register_hook(registry)
+    container = registry.create_container()
+    container.add(InjectClass("payload"))
+    container.call(test_func)
+
+    assert [context.parameter_name for context in contexts] == ["dep"]
+
+
+def test_hook_signatures_are_inspected_when_added(monkeypatch):
+    import bevy.hooks
+
+    inspected = []
+    signature = bevy.hooks.inspect.signature
+    monkeypatch.setattr(bevy.hooks.inspect, "signature", lambda func: inspected.append(func) or signature(func))
+
+    def legacy_hook(container, instance):
+        return Optional.Some(InjectWrapper(instance))
+
+    async def async_hook(container, instance, context):
+        return Optional.Nothing()
+
+    registry = Registry()
+    registry.add_hook(Hook.GOT_INSTANCE, legacy_hook)
+    registry.add_hook(Hook.GOT_INSTANCE, async_hook)
+    assert len(inspected) == 2
+
+    container = registry.create_container()
+    for _ in range(3):
+        assert isinstance(container.get(InjectClass, default=InjectClass(None)), InjectWrapper)
+
+    assert len(inspected) == 2
+
+
+class Database:
+    pass
+
+
+class PostgresDatabase(Database):
+    pass
+
+
+def test_hooks_are_called_by_priority_then_in_order_added():
+    calls = []
+
+    def make_hook(name):
+        def hook(container, instance, context):
+            calls.append(name)
+            return Optional.Nothing()
+
+        return hook
+
+    registry = Registry()
+    for name, priority in [("first", 0), ("high", 10), ("second", 0), ("low", -5), ("third", 0)]:
+        registry.add_hook(Hook.GOT_INSTANCE, make_hook(name), priority=priority)
+
+    registry.create_container().get(InjectClass, default=None)
+    assert calls == ["high", "first", "second", "third", "low"]
+
+
+def test_hooks_are_only_called_for_their_types():
+    calls = []
+
+    @hooks.CREATE_INSTANCE(for_types=(Database,))
+    def create_database(container, dependency, context):
+        calls.append(dependency)
+        return Optional.Some(dependency())
+
+    registry = Registry()
+    create_database.register_hook(registry)
+    container = registry.create_container()
+
+    assert isinstance(container.get(PostgresDatabase), PostgresDatabase)
+    assert container.get(InjectClass, default=None) is None
+    assert calls == [PostgresDatabase]
+
+
+def test_hook_decorator_priority():
+    calls = []
+
+    @hooks.GOT_INSTANCE(priority=1)
+    def wrap(container, instance, context):
+        calls.append("wrap")
+        return Optional.Some(InjectWrapper(instance))
+
+    @hooks.GOT_INSTANCE(priority=2)
+    def payload(container, instance, context):
+        calls.append("payload")
+        return Optional.Nothing()
+
+    registry = Registry()
+    wrap.register_hook(registry)
+    payload.register_hook(registry)
+
+    container = registry.create_container()
+    container.add(InjectClass("payload"))
+    assert isinstance(container.get(InjectClass), InjectWrapper)
+    assert calls == ["payload", "wrap"]
+
+
+@pytest.mark.parametrize("compile", [False, True])
+def test_post_injection_call(compile):
+    contexts = []
+
+    @hooks.POST_INJECTION_CALL
+    def hook(container, context):
+        contexts.append(context)
+
+    @injectable(compile=compile)
+    def test_func(dep: Inject[InjectClass], value: int):
+        return dep.payload, value
+
+    registry = Registry()
+    hook.register_hook(registry)
+    container = registry.create_container()
+    dependency = InjectClass("payload")
+    container.add(dependency)
+
+    assert container.call(test_func, value=1) == ("payload", 1)
+    [context] = contexts
+    assert context.function_name == "test_func"
+    assert context.injected_params == {"dep": dependency}
+    assert context.result == ("payload", 1)
+    assert context.execution_time_ms >= 0
+    assert context.injection_time_ms >= 0
+
+
+def test_post_injection_call_async():
+    import asyncio
+
+    contexts = []
+
+    @hooks.POST_INJECTION_CALL
+    async def hook(container, context):
+        contexts.append(context)
+
+    @injectable
+    async def test_func(dep: Inject[InjectClass]):
+        await asyncio.sleep(0.01)
+        return dep.payload
+
+    registry = Registry()
+    hook.register_hook(registry)
+    container = registry.create_container()
+    container.add(InjectClass("payload"))
+
+    assert asyncio.run(container.call(test_func)) == "payload"
+    [context] = contexts
+    assert context.result == "payload"
+    assert context.execution_time_ms >= 10
+
+
+def test_post_injection_call_is_not_timed_without_hooks(monkeypatch):
+    import bevy.injections
+
+    def fail():
+        raise AssertionError("Call timed without a POST_INJECTION_CALL hook")
+
+    monkeypatch.setattr(bevy.injections.time, "perf_counter_ns", fail)
+
+    @injectable
+    def test_func(dep: Inject[InjectClass]):
+        return dep.payload
+
+    container = Registry().create_container()
+    container.add(InjectClass("payload"))
+    assert container.call(test_func) == "payload"
+
+
+def test_injection_contexts_share_the_call_chain():
+    contexts = []
+
+    @hooks.INJECTION_REQUEST
+    def hook(container, context):
+        contexts.append(context)
+        return Optional.Nothing()
+
+    @injectable
+    def test_func(first: Inject[InjectClass], second: Inject[InjectClass]):
+        return first, second
+
+    registry = Registry()
+    hook.register_hook(registry)
+    container = registry.create_container()
+    container.add(InjectClass("payload"))
+    container.call(test_func)
+
+    first, second = contexts
+    assert first.injection_chain == ("test_func",)
+    assert first.injection_chain is second.injection_chain
+    assert not hasattr(first, "__dict__")
@@ -1,9 +1,13 @@
+import asyncio
 import functools
 
+import pytest
+from tramp.optionals import Optional as TrampOptional
+
 from bevy import auto_inject, injectable
 from bevy.containers import Container
 from bevy.registries import Registry
-from bevy.injection_types import Inject
+from bevy.injection_types import Inject, InjectionStrategy, Options
 
 
 class Service:
@@ -113,3 +117,118 @@ def test_injectable_callable_supports_method_variants():
 
     assert container.call(Handler.class_auto) == "Handler-local"
     assert container.call(Handler.static_auto) == "static-local"
+
+
+def test_injection_plan_is_compiled_once(monkeypatch):
+    import bevy.injections as injections
+
+    compiled = []
+    compile_plan = injections._compile_injection_plan
+
+    def counting_compile(*args, **kwargs):
+        compiled.append(args[0])
+        return compile_plan(*args, **kwargs)
+
+    monkeypatch.setattr(injections, "_compile_injection_plan", counting_compile)
+
+    @injectable
+    def use_dependency(dep: Inject[Dependency], suffix: str = "!") -> str:
+        return dep.value + suffix
+
+    container = Container(Registry())
+    container.add(Dependency("value"))
+
+    assert [container.call(use_dependency) for _ in range(3)] == ["value!"] * 3
+    assert len(compiled) == 1
+
+
+def test_injection_plan_is_shared_by_bound_methods():
+    container = Container(Registry())
+    container.add(Dependency("local"))
+
+    first, second = Handler("a"), Handler("b")
+    assert container.call(first.instance_call) == "a-local"
+    assert container.call(second.instance_call) == "b-local"
+    assert first.instance_call._injection_plan() is second.instance_call._injection_plan()
+
+
+def test_injection_plan_precomputes_parameters():
+    @injectable
+    def func(dep: Inject[Dependency | None], service: Inject[Service, Options(qualifier="primary")] = None):
+        pass
+
+    plan = func._injection_plan()
+    dep, service = plan.parameters
+
+    assert dep.resolve_type is Dependency and dep.is_optional
+    assert isinstance(dep.default, TrampOptional.Nothing)
+    assert service.resolution_kwargs == {"qualifier": "primary"}
+    assert isinstance(service.default, TrampOptional.Some) and service.default.value is None
+    assert plan.inject_passed_arguments
+
+
+def test_injection_plan_not_cached_without_analysis_cache():
+    @injectable(cache_analysis=False)
+    def func(dep: Inject[Dependency]):
+        return dep.value
+
+    container = Container(Registry())
+    container.add(Dependency("value"))
+
+    assert container.call(func) == "value"
+    assert func._injection_plan() is not func._injection_plan()
+
+
+def test_compiled_injectable_matches_regular_call():
+    def handler(dep: Inject[Dependency], /, suffix: str = "!", *extra, service: Inject[Service | None] = None, **kw):
+        return dep.value, suffix, extra, service, kw
+
+    regular = injectable(handler)
+    compiled = injectable(handler, compile=True)
+    container = Container(Registry())
+    container.add(Dependency("value"))
+
+    for args, kwargs in [((), {}), ((Dependency("passed"), "?", 1, 2), {"flag": True})]:
+        assert container.call(compiled, *args, **kwargs) == container.call(regular, *args, **kwargs)
+
+    assert compiled._injection_plan().trampoline is not None
+    assert regular._injection_plan().trampoline is None
+
+
+def test_compiled_injectable_only_injects_missing_parameters():
+    @injectable(strategy=InjectionStrategy.ONLY, params=["dep"], compile=True)
+    def handler(name: str, dep: Dependency):
+        return f"{name}-{dep.value}"
+
+    container = Container(Registry())
+    container.add(Dependency("container"))
+
+    assert container.call(handler, "a") == "a-container"
+    assert container.call(handler, "b", Dependency("passed")) == "b-passed"
+    with pytest.raises(TypeError, match="missing required argument: 'name'"):
+        container.call(handler)
+
+
+def test_compiled_injectable_async_and_bound_methods():
+    class Owner:
+        @injectable(compile=True)
+        async def run(self, dep: Inject[Dependency]):
+            return dep.value
+
+    container = Container(Registry())
+    container.add(Dependency("async"))
+
+    assert asyncio.run(container.call(Owner().run)) == "async"
+    assert Owner().run._injection_plan().async_trampoline is not None
+
+
+def test_compile_falls_back_for_reserved_parameter_names():
+    @injectable(compile=True)
+    def handler(dep: Inject[Dependency], _bevy_func: int = 1):
+        return dep.value, _bevy_func
+
+    container = Container(Registry())
+    container.add(Dependency("value"))
+
+    assert handler._injection_plan().trampoline is None
+    assert container.call(handler) == ("value", 1)
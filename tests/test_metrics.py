@@ -0,0 +1,133 @@
+"""Tests for per-container and per-registry resolution metrics."""
+import asyncio
+
+import pytest
+from tramp.optionals import Optional
+
+from bevy import Inject, injectable, Registry
+from bevy.factories import create_type_factory
+from bevy.hooks import hooks
+from bevy.metrics import LATENCY_BUCKETS_NS, ResolutionMetrics
+
+
+class Database:
+    pass
+
+
+class Cache:
+    pass
+
+
+class Missing:
+    pass
+
+
+def test_metrics_are_off_by_default():
+    registry = Registry()
+    registry.add_factory(create_type_factory(Database))
+    container = registry.create_container()
+    container.get(Database)
+
+    assert container.stats().resolutions == {}
+    assert registry.stats().factories == {}
+
+
+def test_sources_are_counted_per_container():
+    registry = Registry(collect_metrics=True)
+    factory = create_type_factory(Database)
+    registry.add_factory(factory)
+    parent = registry.create_container()
+    child = parent.branch()
+
+    parent.get(Database)
+    parent.get(Database)
+    child.get(Database)
+    child.get(Missing, default=None)
+    with pytest.raises(Exception):
+        child.get(Missing)
+
+    assert parent.stats().resolutions == {(Database, None): {"factory": 1, "cache": 1}}
+    assert child.stats().resolutions == {(Database, None): {"parent": 1}, (Missing, None): {"default": 1, "error": 1}}
+    assert (child.stats().hits, child.stats().misses) == (1, 2)
+    assert registry.stats().by_source() == {"factory": 1, "cache": 1, "parent": 1, "default": 1, "error": 1}
+
+    [latency] = parent.stats().factories.values()
+    assert latency.count == 1
+    assert latency.min_ns == latency.max_ns == latency.total_ns
+    assert child.stats().factories == {}
+
+
+def test_qualifiers_hooks_and_default_factories():
+    registry = Registry(collect_metrics=True)
+
+    @hooks.CREATE_INSTANCE
+    def create_cache(container, dependency):
+        return Optional.Some(Cache()) if dependency is Cache else Optional.Nothing()
+
+    create_cache.register_hook(registry)
+    container = registry.create_container()
+    container.add(Database, Database(), qualifier="primary")
+
+    container.get(Database, qualifier="primary")
+    container.get(Cache)
+    asyncio.run(container.find(Missing, default_factory=Missing).get_async())
+
+    stats = container.stats()
+    assert stats.resolutions == {
+        (Database, "primary"): {"cache": 1},
+        (Cache, None): {"hook": 1},
+        (Missing, None): {"factory": 1},
+    }
+    assert list(stats.factories) == [Missing]
+
+
+def test_injection_is_counted():
+    @injectable
+    def handler(database: Inject[Database]):
+        return database
+
+    registry = Registry(collect_metrics=True)
+    container = registry.create_container()
+    container.add(Database())
+    container.call(handler)
+    container.call(handler)
+
+    assert container.stats().resolutions == {(Database, None): {"cache": 2}}
+
+
+def test_reset():
+    registry = Registry(collect_metrics=True)
+    container = registry.create_container()
+    container.get(Missing, default=None)
+
+    container.reset_stats()
+    assert container.stats().resolutions == {}
+    assert registry.stats().resolutions == {(Missing, None): {"default": 1}}
+
+    registry.reset_stats()
+    assert registry.stats().resolutions == {}
+
+
+def test_snapshots_do_not_change():
+    registry = Registry(collect_metrics=True)
+    container = registry.create_container()
+    snapshot = container.stats()
+    container.get(Missing, default=None)
+
+    assert snapshot.resolutions == {}
+
+
+def test_latency_histogram():
+    metrics = ResolutionMetrics()
+    for duration in (500, 1_500, 1_500, 3_000_000, 20_000_000_000):
+        metrics.record_factory(Database, duration)
+
+    latency = metrics.snapshot().factories[Database]
+    assert latency.count == 5
+    assert (latency.min_ns, latency.max_ns) == (500, 20_000_000_000)
+    assert latency.buckets[0] == 1
+    assert latency.buckets[LATENCY_BUCKETS_NS.index(2_000)] == 2
+    assert latency.buckets[-1] == 1
+    assert latency.percentile(0.5) == 2_000
+    assert latency.percentile(0.8) == 5_000_000
+    assert latency.percentile(1.0) == 20_000_000_000
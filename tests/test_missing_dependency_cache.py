@@ -0,0 +1,193 @@
+"""Tests for the per-container cache of dependencies that are known to be missing."""
+import asyncio
+
+import pytest
+from tramp.optionals import Optional
+
+from bevy import Inject, injectable, Registry
+from bevy.factories import create_type_factory
+from bevy.hooks import hooks
+from bevy.injection_types import DependencyResolutionError
+
+
+class Missing:
+    pass
+
+
+class MissingSubclass(Missing):
+    pass
+
+
+@injectable
+def optional_handler(value: Inject[Missing | None]):
+    return value
+
+
+def counting_registry():
+    calls = []
+
+    @hooks.GET_INSTANCE
+    def count_lookups(container, dependency, context):
+        calls.append(("get", dependency))
+        return Optional.Nothing()
+
+    @hooks.HANDLE_UNSUPPORTED_DEPENDENCY
+    def count_unsupported(container, dependency, context):
+        calls.append(("unsupported", dependency))
+        return Optional.Nothing()
+
+    registry = Registry()
+    count_lookups.register_hook(registry)
+    count_unsupported.register_hook(registry)
+    return registry, calls
+
+
+def test_repeated_optional_misses_skip_creation():
+    registry, calls = counting_registry()
+    container = registry.create_container()
+
+    assert [container.call(optional_handler) for _ in range(3)] == [None] * 3
+    # GET_INSTANCE hooks still run every time, only the attempt to create the dependency is skipped
+    assert calls == [("get", Missing), ("unsupported", Missing), ("get", Missing), ("get", Missing)]
+
+
+def test_repeated_misses_still_raise():
+    registry, calls = counting_registry()
+    container = registry.create_container()
+
+    for _ in range(2):
+        with pytest.raises(DependencyResolutionError):
+            container.get(Missing)
+
+    with pytest.raises(DependencyResolutionError):
+        asyncio.run(container.find(Missing).get_async())
+
+    assert [call for call in calls if call[0] == "unsupported"] == [("unsupported", Missing)]
+
+
+def test_add_invalidates_container_and_branches():
+    registry, _ = counting_registry()
+    parent = registry.create_container()
+    child = parent.branch()
+    assert child.call(optional_handler) is None
+    assert parent.get(Missing, default=None) is None
+
+    instance = MissingSubclass()
+    parent.add(Missing, instance)
+
+    assert parent.get(Missing) is instance
+    assert child.call(optional_handler) is instance
+
+
+def test_parent_resolution_invalidates_branches():
+    registry = Registry()
+    parent = registry.create_container()
+    child = parent.branch()
+    assert child.get(Missing, default=None) is None
+
+    registry.factories[Missing] = lambda container: Missing()  # Bypasses add_factory
+    created = parent.get(Missing)
+    assert child.get(Missing, default=None) is created
+
+
+def test_add_factory_invalidates():
+    registry = Registry()
+    container = registry.create_container()
+    assert container.call(optional_handler) is None
+
+    registry.add_factory(create_type_factory(Missing))
+    assert isinstance(container.call(optional_handler), Missing)
+
+
+def test_add_hook_invalidates():
+    registry = Registry()
+    container = registry.create_container()
+    assert container.call(optional_handler) is None
+
+    @hooks.HANDLE_UNSUPPORTED_DEPENDENCY
+    def create(container, dependency, context):
+        return Optional.Some(Missing())
+
+    create.register_hook(registry)
+    assert isinstance(container.call(optional_handler), Missing)
+
+
+def hook_cached_registry():
+    """A registry whose hooks keep their own cache of instances. Values returned by hooks aren't stored by the
+    container, so the dependency stays missing from the container's point of view."""
+    cache = {}
+
+    @hooks.GET_INSTANCE
+    def get_cached(container, dependency, context):
+        if dependency in cache:
+            return Optional.Some(cache[dependency])
+
+        return Optional.Nothing()
+
+    @hooks.CREATE_INSTANCE
+    def create_and_cache(container, dependency, context):
+        if dependency is Missing:
+            cache[dependency] = Missing()
+            return Optional.Some(cache[dependency])
+
+        return Optional.Nothing()
+
+    registry = Registry()
+    get_cached.register_hook(registry)
+    create_and_cache.register_hook(registry)
+    return registry
+
+
+def test_hook_managed_cache_returns_the_same_instance():
+    container = hook_cached_registry().create_container()
+
+    first = container.get(Missing)
+    assert container.get(Missing) is first
+    assert container.call(optional_handler) is first
+    assert container.branch().get(Missing) is first
+
+
+def test_hook_managed_cache_returns_the_same_instance_async():
+    container = hook_cached_registry().create_container()
+
+    async def get_twice():
+        return await container.find(Missing).get_async(), await container.find(Missing).get_async()
+
+    first, second = asyncio.run(get_twice())
+    assert first is second
+
+
+def test_cached_instances_are_not_stored_again(monkeypatch):
+    container = Registry().create_container()
+    instance = Missing()
+    container.add(instance)
+
+    stored = []
+    monkeypatch.setattr(type(container), "_forget_lookups", lambda self, *dependencies: stored.append(dependencies))
+    for _ in range(3):
+        assert container.get(Missing) is instance
+        assert asyncio.run(container.find(Missing).get_async()) is instance
+
+    assert stored == []
+
+
+def test_misses_are_not_remembered_when_an_instance_is_added_while_looking():
+    instance = Missing()
+    added = []
+
+    @hooks.GET_INSTANCE
+    def add_to_child(container, dependency, context):
+        # Stands in for another thread adding the instance after the child checked its own instances
+        if container is parent and dependency is Missing and not added:
+            added.append(instance)
+            child.add(instance)
+
+        return Optional.Nothing()
+
+    registry = Registry()
+    add_to_child.register_hook(registry)
+    parent = registry.create_container()
+    child = parent.branch()
+
+    assert child.get(Missing, default=None) is None
+    assert child.get(Missing) is instance
@@ -1,20 +1,24 @@
 #!/usr/bin/env python3
 """
-Tests for performance with larger dependency graphs.
+Tests for larger dependency graphs.
 
-This test suite covers performance scenarios including:
+This test suite covers the scenarios that matter for performance:
 - Large dependency counts
 - Nested dependency resolution chains
 - Complex dependency graphs
-- Performance regression detection
+- Factory caching
+
+These tests only check correctness. Timing is measured by the benchmark suite, see benchmarks/suite.py.
 """
 
 import pytest
-import time
+import threading
 from bevy import injectable, Inject, Container, Registry
 from bevy.injection_types import Options
 from bevy.bundled.type_factory_hook import type_factory
 
+from benchmarks.graphs import build_constructor_chain, build_wide_graph
+
 
 class TestLargeDependencyGraphs:
     """Test performance with many dependencies."""
@@ -45,12 +49,7 @@ class TestLargeDependencyGraphs:
         ):
             return s0.value + s1.value + s2.value + s3.value + s4.value
         
-        start_time = time.time()
         result = container.call(use_many_services)
-        end_time = time.time()
-        
-        # Should complete reasonably quickly
-        assert end_time - start_time < 1.0
         assert result == sum(range(5))
     
     def test_repeated_large_dependency_calls(self):
@@ -79,22 +78,12 @@ class TestLargeDependencyGraphs:
             return s0.value + s1.value + s2.value + s3.value + s4.value
         
         # First call (cold)
-        start_time = time.time()
         result1 = container.call(compute_sum)
-        first_call_time = time.time() - start_time
         
         # Subsequent calls (warm)
-        call_times = []
         for _ in range(10):
-            start_time = time.time()
             result = container.call(compute_sum)
-            call_times.append(time.time() - start_time)
             assert result == result1  # Results should be consistent
-        
-        avg_warm_time = sum(call_times) / len(call_times)
-        
-        # Warm calls should be reasonably fast
-        assert avg_warm_time < 0.1  # Should be very fast
     
     def test_wide_dependency_graph(self):
         """Test performance with wide dependency graphs (many services at same level)."""
@@ -133,12 +122,7 @@ class TestLargeDependencyGraphs:
         ):
             return [s1.process(), s2.process(), s3.process()]
         
-        start_time = time.time()
         results = container.call(create_aggregator)
-        end_time = time.time()
-        
-        # Should complete quickly
-        assert end_time - start_time < 0.5
         
         # Verify functionality
         assert len(results) == 3
@@ -183,12 +167,7 @@ class TestNestedDependencyChains:
         def use_nested_service(service: Inject[ServiceA]):
             return f"{service.name}->{service.b.name}->{service.b.c.name}->{service.b.c.d.name}->{service.b.c.d.e.name}"
         
-        start_time = time.time()
         result = container.call(use_nested_service)
-        end_time = time.time()
-        
-        # Should complete quickly and return correct chain
-        assert end_time - start_time < 0.1
         assert result == "A->B->C->D->E"
     
     def test_diamond_dependency_pattern(self):
@@ -224,11 +203,7 @@ class TestNestedDependencyChains:
             same_d = service.b.d is service.c.d
             return f"{service.name} with shared D: {same_d}"
         
-        start_time = time.time()
         result = container.call(use_diamond_service)
-        end_time = time.time()
-        
-        assert end_time - start_time < 0.1
         assert "A with shared D: True" in result
     
     def test_complex_dependency_web(self):
@@ -287,19 +262,62 @@ class TestNestedDependencyChains:
             ]
             return all(checks)
         
-        start_time = time.time()
         result = container.call(use_complex_service)
-        end_time = time.time()
-        
-        assert end_time - start_time < 0.2
         assert result is True
 
+    def test_deep_type_factory_graph_resolves_on_calling_thread(self):
+        """Test that a 50-deep constructor graph is built inline without spawning threads."""
+        registry = Registry()
+        type_factory.register_hook(registry)
+        container = Container(registry)
+
+        chain = build_constructor_chain(50)
+        threads_before = threading.active_count()
+        thread_ids = set()
+
+        original_init = chain[0].__init__
+        def record_thread(self):
+            thread_ids.add(threading.get_ident())
+            original_init(self)
+        chain[0].__init__ = record_thread
+
+        top = container.get(chain[-1])
+
+        assert thread_ids == {threading.get_ident()}
+        assert threading.active_count() == threads_before
+        depth = 1
+        while hasattr(top, "dependency"):
+            top = top.dependency
+            depth += 1
+        assert depth == 50
+
+    def test_wide_type_factory_graph(self):
+        """Test that a constructor with 500 dependencies is built inline."""
+        registry = Registry()
+        type_factory.register_hook(registry)
+        container = Container(registry)
+
+        leaves, root = build_wide_graph(500)
+        instance = container.get(root)
+
+        assert len(instance.dependencies) == 500
+        assert all(isinstance(dep, leaf) for dep, leaf in zip(instance.dependencies, leaves))
+
+    def test_type_factory_graph_deeper_than_recursion_limit(self):
+        """Test that graphs deeper than the stack allows still resolve."""
+        registry = Registry()
+        type_factory.register_hook(registry)
+        container = Container(registry)
+
+        chain = build_constructor_chain(300)
+        assert isinstance(container.get(chain[-1]), chain[-1])
+
 
 class TestFactoryPerformance:
     """Test performance characteristics of factories."""
     
     def test_factory_vs_direct_instance_performance(self):
-        """Compare performance of factory vs direct instance injection."""
+        """Test that factory results are cached so repeated calls don't create new instances."""
         registry = Registry()
         type_factory.register_hook(registry)
         container = Container(registry)
@@ -316,8 +334,11 @@ class TestFactoryPerformance:
             def __init__(self):
                 self.name = "factory"
         
+        created = []
+        
         def factory_creator():
-            return FactoryService()
+            created.append(FactoryService())
+            return created[-1]
         
         @injectable
         def use_direct(service: Inject[DirectService]):
@@ -325,31 +346,14 @@ class TestFactoryPerformance:
         
         @injectable
         def use_factory(service: Inject[FactoryService, Options(default_factory=factory_creator)]):
-            return service.name
-        
-        # Warm up
-        container.call(use_direct)
-        container.call(use_factory)
+            return service
         
-        # Measure direct instance calls
-        direct_times = []
         for _ in range(100):
-            start = time.time()
-            container.call(use_direct)
-            direct_times.append(time.time() - start)
+            assert container.call(use_direct) == "direct"
+            assert container.call(use_factory) is created[0]
         
-        # Measure factory calls (should be cached after first call)
-        factory_times = []
-        for _ in range(100):
-            start = time.time()
-            container.call(use_factory)
-            factory_times.append(time.time() - start)
-        
-        avg_direct = sum(direct_times) / len(direct_times)
-        avg_factory = sum(factory_times) / len(factory_times)
-        
-        # Factory calls should be comparable to direct instances (due to caching)
-        assert avg_factory < avg_direct * 2  # At most 2x slower
+        # The factory result is cached after the first call
+        assert len(created) == 1
     
     def test_uncached_factory_performance(self):
         """Test performance impact of uncached factories."""
@@ -361,7 +365,6 @@ class TestFactoryPerformance:
         def expensive_factory():
             nonlocal creation_count
             creation_count += 1
-            time.sleep(0.001)  # Simulate expensive creation
             return type("ExpensiveService", (), {"id": creation_count})()
         
         @injectable
@@ -372,19 +375,14 @@ class TestFactoryPerformance:
             return service.id
         
         # Multiple calls should each create new instance
-        start_time = time.time()
         results = []
         for _ in range(10):
             result = container.call(use_uncached_factory)
             results.append(result)
-        end_time = time.time()
         
         # Should have created 10 instances
         assert creation_count == 10
         assert results == list(range(1, 11))
-        
-        # Should complete in reasonable time despite uncached creation
-        assert end_time - start_time < 1.0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,54 @@
+"""Tests for collapsed-stack resolution profiles."""
+import io
+import time
+
+from bevy import Inject, injectable, Registry
+from bevy import spans
+from bevy.bundled.type_factory_hook import type_factory
+from bevy.profiling import ResolutionProfiler
+
+
+class Database:
+    def __init__(self):
+        time.sleep(0.002)
+
+
+class Repository:
+    def __init__(self, database: Inject[Database]):
+        self.database = database
+
+
+def test_profile_follows_the_dependency_graph():
+    @injectable
+    def handle_request(repository: Inject[Repository]):
+        return repository
+
+    registry = Registry()
+    type_factory.register_hook(registry)
+    container = registry.create_container()
+
+    with ResolutionProfiler() as profiler:
+        container.call(handle_request)
+        container.call(handle_request)  # Cached, no time in factories or hooks
+
+    assert not spans.enabled
+    stacks = profiler.stacks()
+    assert set(stacks) == {"handle_request;Repository", "handle_request;Repository;Database"}
+    assert stacks["handle_request;Repository;Database"] >= 2_000_000
+    assert stacks["handle_request;Repository"] < stacks["handle_request;Repository;Database"]
+
+
+def test_default_factories_and_output_format():
+    container = Registry().create_container()
+    with ResolutionProfiler() as profiler:
+        container.get(Database, default_factory=Database)
+
+    file = io.StringIO()
+    profiler.write(file)
+    [line] = file.getvalue().splitlines()
+    stack, weight = line.rsplit(" ", 1)
+    assert stack == "Database"
+    assert int(weight) >= 2_000_000
+
+    profiler.clear()
+    assert profiler.format() == ""
@@ -0,0 +1,122 @@
+"""Tests for how registries find the factory that creates a dependency."""
+from abc import ABC
+
+from tramp.optionals import Optional
+
+from bevy import Registry
+from bevy.factories import create_type_factory, factory
+
+
+class Base:
+    pass
+
+
+class Middle(Base):
+    pass
+
+
+class Leaf(Middle):
+    pass
+
+
+def make(name):
+    return lambda container: name
+
+
+def test_first_added_factory_wins():
+    registry = Registry()
+    registry.add_factory(make("middle"), Middle)
+    registry.add_factory(make("base"), Base)
+
+    container = registry.create_container()
+    assert container.get(Leaf) == "middle"
+    assert registry.create_container().get(Base) == "base"
+
+
+def test_missing_factory_is_found_after_it_is_added():
+    registry = Registry()
+    registry.add_factory(make("middle"), Middle)
+    assert isinstance(registry.find_factory(Base), Optional.Nothing)
+
+    registry.add_factory(make("base"), Base)
+    assert registry.find_factory(Base).value(None) == "base"
+    # Types that already had a factory keep it
+    assert registry.find_factory(Leaf).value(None) == "middle"
+
+
+def test_replacing_a_factory_updates_lookups():
+    registry = Registry()
+    registry.add_factory(make("old"), Base)
+    assert registry.find_factory(Leaf).value(None) == "old"
+
+    registry.add_factory(make("new"), Base)
+    assert registry.find_factory(Leaf).value(None) == "new"
+
+
+def test_factory_register_factory_updates_lookups():
+    @factory(Middle, Base)
+    def create(container):
+        return "decorated"
+
+    registry = Registry()
+    assert isinstance(registry.find_factory(Leaf), Optional.Nothing)
+
+    create.register_factory(registry)
+    assert registry.find_factory(Leaf).value(None) == "decorated"
+    assert registry.find_factory(Base).value(None) == "decorated"
+
+
+def test_virtual_subclasses_use_abc_factories():
+    class Interface(ABC):
+        pass
+
+    class Implementation:
+        pass
+
+    Interface.register(Implementation)
+    registry = Registry()
+    registry.add_factory(create_type_factory(Implementation))
+    registry.add_factory(make("interface"), Interface)
+
+    assert isinstance(registry.create_container().get(Implementation), Implementation)
+
+    class Virtual:
+        pass
+
+    Interface.register(Virtual)
+    assert registry.find_factory(Virtual).value(None) == "interface"
+
+
+def test_factories_dict_changes_are_picked_up():
+    registry = Registry()
+    assert isinstance(registry.find_factory(Base), Optional.Nothing)
+
+    registry.factories[Base] = make("direct")
+    assert registry.find_factory(Leaf).value(None) == "direct"
+
+    del registry.factories[Base]
+    registry.factories[Middle] = make("middle")
+    assert registry.find_factory(Leaf).value(None) == "middle"
+    assert isinstance(registry.find_factory(Base), Optional.Nothing)
+
+
+
+def test_replacing_factories_directly_is_picked_up():
+    class Standalone:
+        pass
+
+    registry = Registry()
+    registry.factories[Base] = make("base")
+    container = registry.create_container()
+    assert registry.find_factory(Leaf).value(None) == "base"
+    assert container.get(Standalone, default=None) is None
+
+    # The same number of factories, but for a different type
+    del registry.factories[Base]
+    registry.factories[Standalone] = lambda container: Standalone()
+    assert isinstance(registry.find_factory(Leaf), Optional.Nothing)
+    assert isinstance(container.get(Standalone), Standalone)
+
+    registry.factories.clear()
+    registry.factories.update({Middle: make("middle")})
+    assert registry.find_factory(Leaf).value(None) == "middle"
@@ -0,0 +1,159 @@
+"""Tests for resolution span tracing and its exporters."""
+import asyncio
+import io
+import json
+
+import pytest
+from tramp.optionals import Optional
+
+from bevy import Inject, injectable, Registry
+from bevy import spans
+from bevy.bundled.type_factory_hook import type_factory
+from bevy.factories import create_type_factory
+from bevy.hooks import hooks
+
+
+class Database:
+    pass
+
+
+class Repository:
+    def __init__(self, database: Inject[Database]):
+        self.database = database
+
+
+class Missing:
+    pass
+
+
+@pytest.fixture
+def recorder():
+    exporter = spans.add_exporter(spans.InMemoryExporter())
+    yield exporter
+    spans.remove_exporter(exporter)
+
+
+def tree(recorder, span=None):
+    """Nested (kind, name) tuples for the recorded spans."""
+    if span is None:
+        return [tree(recorder, root) for root in recorder.roots()]
+
+    children = [tree(recorder, child) for child in recorder.children(span)]
+    return (span.kind, span.name, children) if children else (span.kind, span.name)
+
+
+def test_spans_are_off_by_default():
+    assert not spans.enabled
+
+
+def test_call_builds_a_span_tree(recorder):
+    @injectable
+    def handler(repository: Inject[Repository]):
+        return repository
+
+    registry = Registry()
+    type_factory.register_hook(registry)
+    container = registry.create_container()
+
+    container.call(handler)
+    container.call(handler)
+
+    first, second = recorder.roots()
+    assert tree(recorder, first) == (
+        "call", "handler", [
+            ("resolve", "Repository", [
+                ("create", "Repository", [
+                    ("hook", "type_factory", [
+                        ("call", "__init__", [
+                            ("resolve", "Database", [
+                                ("create", "Database", [("hook", "type_factory", [("call", "__init__")])]),
+                            ]),
+                        ]),
+                    ]),
+                ]),
+            ]),
+        ],
+    )
+    assert tree(recorder, second) == ("call", "handler", [("resolve", "Repository")])
+    [resolve] = recorder.children(second)
+    assert resolve.attributes["source"] == "cache"
+    assert resolve.trace_id == second.span_id
+    assert first.attributes["injection_chain"] == ["handler"]
+    assert all(span.end_ns >= span.start_ns for span in recorder.spans)
+
+
+def test_parent_and_error_spans(recorder):
+    parent = Registry().create_container()
+    parent.add(Database())
+    child = parent.branch()
+
+    child.get(Database)
+    with pytest.raises(Exception):
+        child.get(Missing)
+
+    database, missing = recorder.roots()
+    assert database.attributes == {"container_id": id(child), "source": "parent"}
+    assert missing.attributes["source"] == "error"
+    assert "Missing" in missing.error
+
+
+def test_hook_and_async_spans(recorder):
+    registry = Registry()
+
+    @hooks.CREATE_INSTANCE
+    async def create_database(container, dependency, context):
+        return Optional.Some(Database()) if dependency is Database else Optional.Nothing()
+
+    create_database.register_hook(registry)
+    asyncio.run(registry.create_container().find(Database, qualifier="primary", default_factory=Database).get_async())
+    asyncio.run(registry.create_container().find(Database).get_async())
+
+    assert tree(recorder) == [
+        ("resolve", "Database", [("create", "Database")]),
+        ("resolve", "Database", [("create", "Database", [("hook", "test_hook_and_async_spans.<locals>.create_database")])]),
+    ]
+    assert recorder.roots()[0].attributes["qualifier"] == "primary"
+    assert recorder.roots()[1].attributes["source"] == "hook"
+
+
+def test_json_lines_exporter():
+    file = io.StringIO()
+    exporter = spans.add_exporter(spans.JsonLinesExporter(file))
+    try:
+        Registry().create_container().get(Missing, default=None)
+    finally:
+        spans.remove_exporter(exporter)
+        exporter.close()
+
+    [line] = file.getvalue().splitlines()
+    span = json.loads(line)
+    assert (span["kind"], span["name"], span["attributes"]["source"]) == ("resolve", "Missing", "default")
+    assert span["duration_ns"] == span["end_ns"] - span["start_ns"]
+
+
+def test_factory_spans(recorder):
+    registry = Registry()
+    registry.add_factory(create_type_factory(Database))
+    registry.create_container().get(Database)
+
+    [resolve] = recorder.roots()
+    [create] = recorder.children(resolve)
+    assert resolve.attributes["source"] == "factory"
+    assert "Factory" in create.attributes["factory"]
+
+
+def test_chrome_trace_exporter(tmp_path):
+    path = tmp_path / "trace.json"
+    exporter = spans.add_exporter(spans.ChromeTraceExporter(path))
+    try:
+        Registry().create_container().get(Database, default_factory=Database)
+    finally:
+        spans.remove_exporter(exporter)
+        exporter.close()
+
+    events = json.loads(path.read_text())["traceEvents"]
+    assert [(event["cat"], event["name"], event["ph"]) for event in events] == [
+        ("create", "Database", "X"),
+        ("resolve", "Database", "X"),
+    ]
+    assert events[0]["args"]["parent_id"] == events[1]["args"]["span_id"]
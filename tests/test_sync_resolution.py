@@ -0,0 +1,105 @@
+"""Tests for the synchronous resolution engine used by Result.get() and InjectableCallable.call_using()."""
+import asyncio
+import threading
+
+from tramp.optionals import Optional
+
+from bevy import Inject, injectable, Options
+from bevy.bundled.type_factory_hook import type_factory
+from bevy.factories import create_type_factory
+from bevy.hooks import hooks
+from bevy.registries import Registry
+
+
+class Service:
+    def __init__(self):
+        self.thread_id = threading.get_ident()
+
+
+class Config:
+    def __init__(self, name: str = "default"):
+        self.name = name
+
+
+def test_get_resolves_on_calling_thread():
+    registry = Registry()
+    registry.add_factory(create_type_factory(Service))
+    container = registry.create_container()
+
+    assert container.get(Service).thread_id == threading.get_ident()
+
+
+def test_call_resolves_on_calling_thread():
+    registry = Registry()
+    type_factory.register_hook(registry)
+    container = registry.create_container()
+
+    @injectable
+    def handler(service: Inject[Service]):
+        return service.thread_id, threading.get_ident()
+
+    service_thread, call_thread = container.call(handler)
+    assert service_thread == call_thread == threading.get_ident()
+
+
+def test_sync_hooks_run_on_calling_thread():
+    hook_threads = []
+
+    @hooks.CREATE_INSTANCE
+    def create(container, dependency, context):
+        hook_threads.append(threading.get_ident())
+        return Optional.Nothing()
+
+    registry = Registry()
+    create.register_hook(registry)
+    registry.add_factory(create_type_factory(Service))
+    container = registry.create_container()
+
+    container.get(Service)
+    assert hook_threads == [threading.get_ident()]
+
+
+def test_async_hook_falls_back_to_event_loop():
+    @hooks.HANDLE_UNSUPPORTED_DEPENDENCY
+    async def create(container, dependency, context):
+        await asyncio.sleep(0)
+        return Optional.Some(Config("from async hook"))
+
+    registry = Registry()
+    create.register_hook(registry)
+    container = registry.create_container()
+
+    @injectable
+    def handler(config: Inject[Config]):
+        return config.name
+
+    assert container.call(handler) == "from async hook"
+
+
+def test_async_default_factory_falls_back_to_event_loop():
+    async def make_config():
+        await asyncio.sleep(0)
+        return Config("from async factory")
+
+    container = Registry().create_container()
+
+    @injectable
+    def handler(config: Inject[Config, Options(default_factory=make_config)]):
+        return config
+
+    first = container.call(handler)
+    assert first.name == "from async factory"
+    assert container.call(handler) is first
+
+
+def test_sync_get_matches_async_semantics_for_parents_and_qualifiers():
+    registry = Registry()
+    parent = registry.create_container()
+    parent.add(Config, Config("primary"), qualifier="primary")
+    parent.add(Config("unqualified"))
+    child = parent.branch()
+
+    assert child.get(Config, qualifier="primary").name == "primary"
+    assert child.get(Config).name == "unqualified"
+    assert child.get(Service, default=None) is None
+    assert asyncio.run(child.find(Config, qualifier="primary").get_async()).name == "primary"
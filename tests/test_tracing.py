@@ -0,0 +1,117 @@
+"""Tests for structured resolution tracing."""
+import asyncio
+import logging
+
+import pytest
+
+from bevy import Inject, injectable, Options, Registry
+from bevy.factories import create_type_factory
+from bevy import tracing
+
+
+class Service:
+    pass
+
+
+class Missing:
+    pass
+
+
+@pytest.fixture
+def events():
+    collected = []
+    tracing.add_sink(collected.append)
+    yield collected
+    tracing.remove_sink(collected.append)
+
+
+def resolve_events(events):
+    return [(event.dependency, event.source) for event in events if event.kind == "resolve"]
+
+
+def test_tracing_is_off_by_default():
+    assert not tracing.enabled
+
+
+def test_sinks_turn_tracing_on_and_off():
+    sink = tracing.add_sink(lambda event: None)
+    assert tracing.enabled
+
+    tracing.remove_sink(sink)
+    assert not tracing.enabled
+
+
+def test_resolve_events_record_the_source(events):
+    registry = Registry()
+    registry.add_factory(create_type_factory(Service))
+    parent = registry.create_container()
+    child = parent.branch()
+
+    created = parent.get(Service)
+    assert parent.get(Service) is created
+    assert child.get(Service) is created
+    assert child.get(Missing, default=None) is None
+    with pytest.raises(Exception):
+        child.get(Missing)
+
+    assert resolve_events(events) == [
+        (Service, "factory"),
+        (Service, "cache"),
+        (Service, "parent"),
+        (Missing, "default"),
+        (Missing, "error"),
+    ]
+    assert all(event.duration_ns >= 0 for event in events)
+    assert events[2].container_id == id(child)
+
+
+def test_qualified_resolve_events(events):
+    container = Registry().create_container()
+    container.add(Service, Service(), qualifier="primary")
+
+    container.get(Service, qualifier="primary")
+    asyncio.run(container.find(Service, default_factory=Service).get_async())
+
+    assert [(event.qualifier, event.source) for event in events] == [("primary", "cache"), (None, "factory")]
+
+
+def test_inject_events(events):
+    @injectable
+    def handler(service: Inject[Service], missing: Inject[Missing | None], primary: Inject[Service, Options(qualifier="primary")]):
+        return service
+
+    container = Registry().create_container()
+    container.add(Service())
+    container.add(Service, Service(), qualifier="primary")
+    container.call(handler)
+
+    injected = [(event.parameter, event.source, event.qualifier) for event in events if event.kind == "inject"]
+    assert injected == [("service", "injected", None), ("missing", "optional_none", None), ("primary", "injected", "primary")]
+    assert {event.function for event in events if event.kind == "inject"} == {"handler"}
+
+
+def test_debug_mode_logs_without_sinks(caplog):
+    @injectable(debug=True)
+    def handler(service: Inject[Service]):
+        return service
+
+    container = Registry().create_container()
+    container.add(Service())
+    with caplog.at_level(logging.DEBUG, logger="bevy"):
+        container.call(handler)
+
+    [record] = caplog.records
+    assert record.bevy_event.parameter == "service"
+    assert "handler.service" in record.getMessage()
+
+
+def test_logging_sink(caplog):
+    sink = tracing.enable()
+    try:
+        with caplog.at_level(logging.DEBUG, logger="bevy"):
+            Registry().create_container().get(Missing, default=None)
+    finally:
+        tracing.remove_sink(sink)
+
+    [record] = caplog.records
+    assert record.bevy_event.source == "default"
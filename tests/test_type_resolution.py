@@ -11,9 +11,9 @@ This test suite covers complex type scenarios including:
 """
 
 import pytest
-from typing import List, Callable, Optional
-from bevy import injectable, Inject, Container, Registry
-from bevy.injection_types import Options
+from typing import List, Callable, Optional, Protocol, runtime_checkable
+from bevy import injectable, Inject, Container, Registry, TypeMatchingStrategy
+from bevy.injection_types import DependencyResolutionError, Options
 from bevy.bundled.type_factory_hook import type_factory
 
 
@@ -311,6 +311,214 @@ class TestTypeMatchingStrategies:
         result = container.call(use_database)
         assert result == "Special: special://database"
 
+    def test_subclass_instances_match_base_type_in_add_order(self):
+        """Test that the first subclass instance added is used for its base types."""
+        class PostgresDatabase(DatabaseConnection):
+            pass
+
+        class SqliteDatabase(DatabaseConnection):
+            pass
+
+        container = Container(Registry())
+        container.add(PostgresDatabase("postgres://db"))
+        container.add(SqliteDatabase("sqlite://db"))
+        # Replacing the first subclass instance keeps its precedence
+        replacement = PostgresDatabase("postgres://replacement")
+        container.add(replacement)
+
+        assert container.get(DatabaseConnection, type_matching=TypeMatchingStrategy.SUBCLASS) is replacement
+
+    def test_exact_instance_wins_over_subclass_instances(self):
+        """Test that an instance stored for exactly the requested type is preferred."""
+        class SpecialDatabase(DatabaseConnection):
+            pass
+
+        container = Container(Registry())
+        container.add(SpecialDatabase())
+        exact = DatabaseConnection("exact://db")
+        container.add(exact)
+
+        assert container.get(DatabaseConnection, type_matching=TypeMatchingStrategy.SUBCLASS) is exact
+
+    def test_qualified_subclass_instances_do_not_match_base_type(self):
+        """Test that qualified instances are only used for qualified lookups."""
+        class SpecialDatabase(DatabaseConnection):
+            pass
+
+        container = Container(Registry())
+        container.add(SpecialDatabase, SpecialDatabase(), qualifier="special")
+
+        assert container.get(DatabaseConnection, default=None) is None
+
+    def test_default_matching_ignores_subclass_instances(self):
+        """Test that by default only instances stored for exactly the requested type are used."""
+        class SpecialDatabase(DatabaseConnection):
+            pass
+
+        container = Container(Registry())
+        container.add(SpecialDatabase("special://db"))
+
+        @injectable
+        def use_database(db: Inject[DatabaseConnection | None]):
+            return db
+
+        assert container.get(DatabaseConnection, default=None) is None
+        assert container.branch().get(DatabaseConnection, default=None) is None
+        assert container.call(use_database) is None
+
+    def test_parent_exact_instance_wins_over_child_subclass_instance_by_default(self):
+        """Test that a child's subclass instance doesn't shadow the parent's instance unless SUBCLASS is used."""
+        class SpecialDatabase(DatabaseConnection):
+            pass
+
+        parent = Container(Registry())
+        parent.add(DatabaseConnection("parent://db"))
+        special = SpecialDatabase("child://db")
+        default_child, subclass_child = parent.branch(), parent.branch()
+        default_child.add(special)
+        subclass_child.add(special)
+
+        assert default_child.get(DatabaseConnection).url == "parent://db"
+        assert subclass_child.get(DatabaseConnection, type_matching=TypeMatchingStrategy.SUBCLASS) is special
+
+    def test_subclass_matching_injects_subclass_instances(self):
+        """Test that injectables using SUBCLASS get instances stored for subclasses."""
+        class SpecialDatabase(DatabaseConnection):
+            pass
+
+        parent = Container(Registry())
+        special = SpecialDatabase("special://db")
+        parent.add(special)
+
+        @injectable(type_matching=TypeMatchingStrategy.SUBCLASS)
+        def use_database(db: Inject[DatabaseConnection]):
+            return db
+
+        assert parent.branch().call(use_database) is special
+
+    def test_exact_type_matching_ignores_subclass_instances(self):
+        """Test that EXACT_TYPE only uses instances stored for exactly the requested type."""
+        class SpecialDatabase(DatabaseConnection):
+            pass
+
+        parent = Container(Registry())
+        parent.add(SpecialDatabase("special://db"))
+        child = parent.branch()
+
+        @injectable(type_matching=TypeMatchingStrategy.EXACT_TYPE)
+        def use_database(db: Inject[DatabaseConnection]):
+            return db
+
+        with pytest.raises(DependencyResolutionError):
+            child.call(use_database)
+
+        assert child.get(DatabaseConnection, type_matching=TypeMatchingStrategy.EXACT_TYPE, default=None) is None
+        # The exact miss isn't remembered as a miss for subclass matching
+        assert child.get(DatabaseConnection, type_matching=TypeMatchingStrategy.SUBCLASS).url == "special://db"
+
+        exact = DatabaseConnection("exact://db")
+        parent.add(exact)
+        assert parent.branch().call(use_database) is exact
+
+    def test_structural_matching_uses_runtime_checkable_protocols(self):
+        """Test that STRUCTURAL matches instances that satisfy a runtime checkable protocol."""
+        @runtime_checkable
+        class SupportsSend(Protocol):
+            def send(self, to: str, message: str): ...
+
+        parent = Container(Registry())
+        email = EmailService()
+        parent.add(DatabaseConnection())
+        parent.add(email)
+        child = parent.branch()
+
+        @injectable(type_matching=TypeMatchingStrategy.STRUCTURAL)
+        def notify(sender: Inject[SupportsSend]):
+            return sender
+
+        @injectable
+        def notify_subclass_only(sender: Inject[SupportsSend | None]):
+            return sender
+
+        assert child.call(notify) is email
+        assert Container(Registry()).call(notify_subclass_only) is None
+
+    def test_structural_matches_are_cached_per_type(self, monkeypatch):
+        """Test that protocol checks are cached for each concrete type."""
+        import bevy.containers
+
+        @runtime_checkable
+        class SupportsSend(Protocol):
+            def send(self, to: str, message: str): ...
+
+        monkeypatch.setattr(bevy.containers, "_protocol_matches", {})
+
+        for _ in range(3):
+            container = Container(Registry())
+            container.add(EmailService())
+            assert isinstance(
+                container.get(SupportsSend, type_matching=TypeMatchingStrategy.STRUCTURAL), EmailService
+            )
+
+        # One entry for each concrete type checked: the container, the registry, and the email service
+        assert bevy.containers._protocol_matches == {
+            (SupportsSend, Container): False,
+            (SupportsSend, Registry): False,
+            (SupportsSend, EmailService): True,
+        }
+
+
+class SpecialDatabase(DatabaseConnection):
+    pass
+
+
+def add_instance(container, instance):
+    container.add(instance)
+
+
+def add_for_type(container, instance):
+    container.add(SpecialDatabase, instance)
+
+
+def set_instance(container, instance):
+    container.instances[SpecialDatabase] = instance
+
+
+def cache_registry_factory_result(container, instance):
+    container.registry.add_factory(lambda _: instance, SpecialDatabase)
+    assert container.get(SpecialDatabase) is instance
+
+
+@pytest.mark.parametrize(
+    "store", [add_instance, add_for_type, set_instance, cache_registry_factory_result],
+)
+def test_every_write_path_is_found_by_subclass_lookups(store):
+    """Test that instances stored in any way are indexed for subclass lookups and update the views of branches."""
+    parent = Container(Registry())
+    child = parent.branch()
+    assert child.get(SpecialDatabase, default=None) is None
+    assert child.get(DatabaseConnection, default=None, type_matching=TypeMatchingStrategy.SUBCLASS) is None
+
+    instance = SpecialDatabase("stored://db")
+    store(parent, instance)
+
+    assert parent.get(DatabaseConnection, type_matching=TypeMatchingStrategy.SUBCLASS) is instance
+    assert child.get(SpecialDatabase) is instance
+    assert parent.branch().get(DatabaseConnection, type_matching=TypeMatchingStrategy.SUBCLASS) is instance
+
+
+def test_class_default_factory_results_are_found_by_subclass_lookups():
+    """Test that results cached for a default_factory that is a class are indexed like instances stored for it."""
+    container = Container(Registry())
+    instance = container.get(SpecialDatabase, default_factory=SpecialDatabase)
+
+    assert container.factory_results[SpecialDatabase] is instance
+    assert container.get(DatabaseConnection, type_matching=TypeMatchingStrategy.SUBCLASS) is instance
+
+    del container.instances[SpecialDatabase]
+    assert SpecialDatabase not in container.factory_results
+    assert container.get(SpecialDatabase, default=None) is None
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file